@@ -0,0 +1,114 @@
+"""
+한국 달력 차원 테이블 (평일 / 주말 / 공휴일)
+
+- 매년 날짜가 같은 양력 공휴일은 규칙으로 생성
+- 설날·추석·부처님오신날(음력), 대체공휴일, 임시공휴일(선거일 등)은
+  해마다 날짜가 달라서 연도별 표로 관리
+  (표에 없는 연도는 양력 공휴일만 반영되므로 새 연도 데이터를 넣을 때 함께 추가)
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+DAY_TYPES = ["평일", "주말", "공휴일"]
+WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+
+# 매년 같은 날짜의 양력 공휴일 (월, 일, 이름)
+FIXED_HOLIDAYS = [
+    (1, 1, "신정"),
+    (3, 1, "삼일절"),
+    (5, 5, "어린이날"),
+    (6, 6, "현충일"),
+    (8, 15, "광복절"),
+    (10, 3, "개천절"),
+    (10, 9, "한글날"),
+    (12, 25, "성탄절"),
+]
+
+# 연도별로 날짜가 바뀌는 공휴일 (음력 명절, 대체공휴일, 임시공휴일)
+YEARLY_HOLIDAYS = {
+    2024: [
+        (date(2024, 2, 9), "설날 연휴"),
+        (date(2024, 2, 10), "설날"),
+        (date(2024, 2, 11), "설날 연휴"),
+        (date(2024, 2, 12), "대체공휴일(설날)"),
+        (date(2024, 4, 10), "국회의원 선거일"),
+        (date(2024, 5, 6), "대체공휴일(어린이날)"),
+        (date(2024, 5, 15), "부처님오신날"),
+        (date(2024, 9, 16), "추석 연휴"),
+        (date(2024, 9, 17), "추석"),
+        (date(2024, 9, 18), "추석 연휴"),
+        (date(2024, 10, 1), "국군의 날(임시공휴일)"),
+    ],
+    2025: [
+        (date(2025, 1, 27), "임시공휴일"),
+        (date(2025, 1, 28), "설날 연휴"),
+        (date(2025, 1, 29), "설날"),
+        (date(2025, 1, 30), "설날 연휴"),
+        (date(2025, 3, 3), "대체공휴일(삼일절)"),
+        (date(2025, 5, 5), "부처님오신날"),
+        (date(2025, 5, 6), "대체공휴일(어린이날·부처님오신날)"),
+        (date(2025, 6, 3), "대통령 선거일"),
+        (date(2025, 10, 5), "추석 연휴"),
+        (date(2025, 10, 6), "추석"),
+        (date(2025, 10, 7), "추석 연휴"),
+        (date(2025, 10, 8), "대체공휴일(추석)"),
+    ],
+    2026: [
+        (date(2026, 2, 16), "설날 연휴"),
+        (date(2026, 2, 17), "설날"),
+        (date(2026, 2, 18), "설날 연휴"),
+        (date(2026, 3, 2), "대체공휴일(삼일절)"),
+        (date(2026, 5, 24), "부처님오신날"),
+        (date(2026, 5, 25), "대체공휴일(부처님오신날)"),
+        (date(2026, 6, 3), "전국동시지방선거일"),
+        (date(2026, 8, 17), "대체공휴일(광복절)"),
+        (date(2026, 9, 24), "추석 연휴"),
+        (date(2026, 9, 25), "추석"),
+        (date(2026, 9, 26), "추석 연휴"),
+        (date(2026, 10, 5), "대체공휴일(개천절)"),
+    ],
+}
+
+
+def holidays_for_year(year: int) -> dict:
+    """해당 연도의 {date: 공휴일 이름} (같은 날 두 공휴일이면 이름을 합침)"""
+    result = {}
+    entries = [(date(year, m, d), name) for m, d, name in FIXED_HOLIDAYS]
+    entries += YEARLY_HOLIDAYS.get(year, [])
+    for d, name in entries:
+        result[d] = f"{result[d]}·{name}" if d in result else name
+    return result
+
+
+def build_calendar(days: np.ndarray) -> pd.DataFrame:
+    """
+    날짜 배열(datetime64[D])에 대한 달력 차원 테이블.
+    컬럼: 날짜, 요일, 주말, 공휴일, 공휴일명, 일유형(평일/주말/공휴일)
+    """
+    days = np.asarray(days, dtype="datetime64[D]")
+    dates = days.astype(object)
+
+    holiday_map = {}
+    for year in sorted({d.year for d in dates}):
+        holiday_map.update(holidays_for_year(year))
+
+    # 1970-01-01 은 목요일 → (일수 + 3) % 7 이 0=월요일
+    weekday = (days.astype(np.int64) + 3) % 7
+    is_weekend = weekday >= 5
+    holiday_name = np.array([holiday_map.get(d, "") for d in dates], dtype=object)
+    is_holiday = holiday_name != ""
+
+    day_type = np.where(is_holiday, "공휴일", np.where(is_weekend, "주말", "평일"))
+
+    return pd.DataFrame(
+        {
+            "날짜": dates,
+            "요일": np.array(WEEKDAY_NAMES, dtype=object)[weekday],
+            "주말": is_weekend,
+            "공휴일": is_holiday,
+            "공휴일명": holiday_name,
+            "일유형": pd.Categorical(day_type, categories=DAY_TYPES),
+        }
+    )
@@ -1,161 +1,117 @@
 # app.py
+import pathlib
+import sys
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import re
-import os
+
+# 상위 폴더의 population_* 모듈 사용
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+import population_data  # noqa: E402
+import population_export  # noqa: E402
+from population_cache import data_version, load_population_cube  # noqa: E402
 
 st.set_page_config(page_title="연령별 인구 그래프", layout="wide")
 
 st.title("지역별 연령대 인구 꺾은선 그래프 (Plotly + Streamlit)")
 
-# --- 데이터 로드: 여러 인코딩 시도 ---
-def load_csv_try(path_candidates):
-    last_err = None
-    for p in path_candidates:
-        if not os.path.exists(p):
-            continue
-        for enc in ["cp949", "euc-kr", "utf-8-sig", "utf-8"]:
-            try:
-                df = pd.read_csv(p, encoding=enc)
-                return df, p, enc
-            except Exception as e:
-                last_err = e
-    raise RuntimeError(f"파일을 열 수 없습니다. 시도한 경로/인코딩 실패. 마지막 오류: {last_err}")
-
-# 후보 경로: 앱 루트에 population.csv 두는 경우, 또는 /mnt/data (업로드 환경)
-file_candidates = ["./population.csv", "./data/population.csv", "/mnt/data/population.csv", "population.csv"]
+
+# --- 데이터 로드: [지역, 월, 성별, 나이] 큐브 (파일이 바뀔 때만 다시 만듦) ---
 try:
-    df_raw, used_path, used_encoding = load_csv_try(file_candidates)
+    cube = load_population_cube()
 except Exception as e:
-    st.error("population.csv 파일을 찾지 못했거나 열 수 없습니다. 앱 디렉토리에 population.csv 파일을 올려주세요.")
+    st.error(f"population.csv 파일을 열 수 없습니다: {e}")
     st.stop()
 
-st.sidebar.markdown(f"**데이터 파일:** `{used_path}`  (인코딩: {used_encoding})")
-
-# 작은 전처리: 칼럼 이름 공백 제거
-df = df_raw.copy()
-df.columns = [c.strip() for c in df.columns]
-
-# 가능한 지역(행정구역) 컬럼 탐색
-region_col_candidates = [c for c in df.columns if re.search(r"행정|시군구|지역|지역명|시군", c, re.I)]
-if region_col_candidates:
-    region_col = region_col_candidates[0]
-else:
-    # fallback: 첫번째 컬럼 사용
-    region_col = df.columns[0]
-
-# 가능한 '항목' or '연령' 컬럼 탐색
-age_label_col_candidates = [c for c in df.columns if re.search(r"항목|연령|연령구간|구간|나이", c, re.I)]
-age_label_col = age_label_col_candidates[0] if age_label_col_candidates else None
+if cube is None:
+    st.error("population.csv 파일을 찾지 못했거나 열 수 없습니다. 앱 디렉토리에 population.csv 파일을 올려주세요.")
+    st.stop()
 
-# 연도/시점 컬럼(숫자 형태 또는 YYYY 형태) 탐색
-year_cols = [c for c in df.columns if re.match(r"^\d{4}(\.\d+)?$|^\d{4}년|^\d{4}년", str(c))]
-# 추가: 컬럼명이 '2025년10월...' 같이 포함된 경우
-year_like_cols = [c for c in df.columns if re.search(r"\d{4}", str(c)) and c not in [region_col, age_label_col]]
-# 결합, 중복 제거
-all_year_candidates = list(dict.fromkeys(year_cols + year_like_cols))
+st.sidebar.markdown(f"**기준월:** {', '.join(cube.month_labels)}  (지역 {len(cube.labels):,}개)")
 
 # UI: 지역 선택
-regions = df[region_col].astype(str).unique().tolist()
-regions_display = sorted([r for r in regions if r and str(r).strip()!=""], key=lambda x: str(x))
+regions_display = sorted([r for r in cube.labels if r], key=lambda x: str(x))
 sel_region = st.sidebar.selectbox("지역 선택", regions_display)
-
-# UI: 시점(연도) 선택
-if all_year_candidates:
-    sel_year = st.sidebar.selectbox("시점(연도/컬럼) 선택 (그래프에 쓸 인구값을 담은 컬럼)", all_year_candidates, index=len(all_year_candidates)-1)
-else:
-    sel_year = st.sidebar.text_input("직접 입력할 인구수 컬럼명 (예: 2024)", value="2024")
-
-st.write(f"선택 지역: **{sel_region}**, 선택 시점 컬럼: **{sel_year}**")
-
-# --- 데이터 준비 함수 ---
-def clean_number(x):
-    if pd.isna(x):
-        return None
-    if isinstance(x, (int, float)):
-        return x
-    s = str(x)
-    # 숫자 바깥 문자 제거 (콤마, 공백, 괄호 등)
-    s = re.sub(r"[^\d\-\.]", "", s)
+compare_regions = st.sidebar.multiselect(
+    "겹쳐 볼 지역 (여러 개 선택 가능)", [r for r in regions_display if r != sel_region]
+)
+as_share = st.sidebar.checkbox("지역 인구 대비 비율(%)로 보기", value=False)
+
+# UI: 시점(기준월) / 성별 선택, 기본값은 가장 최근 월의 '계'(남녀 합계)
+sel_year = st.sidebar.selectbox("시점(기준월) 선택", cube.month_labels, index=len(cube.month_labels) - 1)
+sel_sex = st.sidebar.radio("성별", cube.sexes, index=0, horizontal=True)
+
+# UI: 연령 구분 (1세 단위 / N세 단위 / 사용자 지정 연령대)
+band_mode = st.sidebar.radio("연령 구분", ["1세 단위", "5세 단위", "10세 단위", "사용자 지정"], index=0)
+bands = None
+if band_mode in ("5세 단위", "10세 단위"):
+    bands = population_data.cohort_bands(int(band_mode[:-4]), int(cube.ages[-1]))
+elif band_mode == "사용자 지정":
+    band_text = st.sidebar.text_input("연령대 (쉼표로 구분, 예: 0-6, 7-12, 65+)", value="0-6, 7-12, 13-18, 19-64, 65+")
     try:
-        if s == "" or s == "-" :
-            return None
-        if "." in s:
-            return float(s)
-        return int(s)
-    except:
-        return None
-
-def prepare_age_population(df, region, region_col, age_label_col, value_col):
-    # 케이스 A: 세로형(각 행이 연령 항목) — age_label_col이 존재
-    if age_label_col and age_label_col in df.columns and value_col in df.columns:
-        sub = df[df[region_col].astype(str) == str(region)][[age_label_col, value_col]].copy()
-        sub = sub.rename(columns={age_label_col: "age_label", value_col: "pop"})
-        sub["pop"] = sub["pop"].apply(clean_number)
-        sub = sub.dropna(subset=["pop"])
-        return sub
-    # 케이스 B: 연령이 컬럼명인 가로형 (예: '0세','1세', ... 가 여러 컬럼)
-    age_like_cols = [c for c in df.columns if re.search(r"^\d+세$|^\d+-\d+|^\d+~\d+|^\d+대", str(c))]
-    # also try columns that look numeric or small ints
-    if not age_like_cols:
-        # 추정: 첫행이 지역별 전체 인구 행이고, 연령 컬럼들이 아닌가
-        # 시도: 선택한 지역의 row에서 숫자형으로 변환 가능한 컬럼들 추출
-        row = df[df[region_col].astype(str) == str(region)]
-        if not row.empty:
-            possible_cols = []
-            for c in df.columns:
-                if c==region_col: continue
-                v = row.iloc[0].get(c)
-                if pd.isna(v): continue
-                cleaned = re.sub(r"[^\d\-\.]", "", str(v))
-                if cleaned:
-                    possible_cols.append(c)
-            # 정렬(가능하면 연령 순)
-            age_like_cols = possible_cols
-    if age_like_cols:
-        row = df[df[region_col].astype(str) == str(region)]
-        if row.empty:
-            return pd.DataFrame(columns=["age_label","pop"])
-        row = row.iloc[0]
-        records = []
-        for c in age_like_cols:
-            val = clean_number(row.get(c))
-            if val is None:
-                continue
-            records.append({"age_label": str(c), "pop": val})
-        if records:
-            return pd.DataFrame(records)
-    # 실패 시: 빈 데이터 반환
-    return pd.DataFrame(columns=["age_label","pop"])
-
-# 실제 준비
-data_agepop = prepare_age_population(df, sel_region, region_col, age_label_col, sel_year)
-
-if data_agepop.empty:
-    st.warning("선택한 형식에서 연령별 인구 데이터를 찾지 못했습니다. 데이터 예시를 아래에서 확인하고, '시점(연도) 선택'을 올바른 컬럼명으로 바꿔보세요.")
-    st.subheader("데이터 파일(앞부분) 미리보기")
-    st.dataframe(df.head(30))
-    st.stop()
-
-# 연령 라벨 정렬 시도: 숫자 추출해서 정렬
-def age_key(label):
-    # extract first integer in label
-    m = re.search(r"(\d{1,3})", str(label))
-    if m:
-        return int(m.group(1))
-    # fallback: length-based
-    return str(label)
-
-data_agepop["age_sort"] = data_agepop["age_label"].apply(age_key)
-data_agepop = data_agepop.sort_values("age_sort").reset_index(drop=True)
-
-# Plotly 라인
-fig = px.line(data_agepop, x="age_label", y="pop", markers=True,
-              title=f"{sel_region} - 연령별 인구 ({sel_year})",
-              labels={"age_label":"연령(또는 연령구간)", "pop":"인구수"})
-fig.update_layout(xaxis_tickangle= -45)
-fig.update_traces(hovertemplate="%{x}<br>인구: %{y:,}")
+        bands = population_data.parse_bands(band_text)
+    except ValueError as e:
+        st.sidebar.error(str(e))
+        st.stop()
+
+st.write(f"선택 지역: **{sel_region}**, 선택 시점: **{sel_year}**, 성별: **{sel_sex}**")
+
+# --- 데이터 준비: 배열 슬라이스 (연령대는 누적합 두 번 조회) ---
+region_idx = cube.region_index(sel_region)
+month_idx, sex_idx = cube.month_index(sel_year), cube.sex_index(sel_sex)
+if bands is None:
+    pops = cube.age_series(region_idx, month_idx, sex_idx)
+    data_agepop = pd.DataFrame({"age_label": cube.age_labels, "pop": pops})
+else:
+    pops = cube.band_sums(bands, [region_idx], [month_idx], [sex_idx])[0, 0, 0]
+    data_agepop = pd.DataFrame({"age_label": [population_data.band_label(b) for b in bands], "pop": pops})
+
+
+@st.cache_data(max_entries=1024)
+def region_series(_cube, version: tuple, region_idx: int, month_idx: int, sex_idx: int, bands, share: bool) -> list:
+    """
+    한 지역의 (나이 또는 연령대별) 값 — 큐브 행 슬라이스.
+    지역마다 따로 캐시하므로 비교 지역을 추가하면 새 지역만 계산됨.
+    _cube 는 해시하지 않고 version(파일 버전)으로 캐시 키를 구분.
+    """
+    if bands is None:
+        values = _cube.age_series(region_idx, month_idx, sex_idx).astype("float64")
+    else:
+        values = _cube.band_sums(list(bands), [region_idx], [month_idx], [sex_idx])[0, 0, 0].astype("float64")
+    if share:
+        total = _cube.totals[region_idx, month_idx, sex_idx]
+        values = values / total * 100 if total > 0 else values * 0
+    return values.tolist()
+
+
+# Plotly 라인 (연령대는 막대). 비교 지역이 있으면 지역별로 겹쳐 그림
+x_labels = list(data_agepop["age_label"])
+y_label = "비율(%)" if as_share else "인구수"
+version = data_version()
+bands_key = None if bands is None else tuple(bands)
+plot_df = pd.concat(
+    [
+        pd.DataFrame({
+            "age_label": x_labels,
+            "pop": region_series(cube, version, cube.region_index(r), month_idx, sex_idx, bands_key, as_share),
+            "지역": r,
+        })
+        for r in [sel_region] + compare_regions
+    ],
+    ignore_index=True,
+)
+title_regions = sel_region if not compare_regions else f"{sel_region} 외 {len(compare_regions)}개 지역"
+if bands is None:
+    fig = px.line(plot_df, x="age_label", y="pop", color="지역", markers=not compare_regions,
+                  title=f"{title_regions} - 연령별 인구 ({sel_year}, {sel_sex})",
+                  labels={"age_label":"연령(또는 연령구간)", "pop":y_label})
+else:
+    fig = px.bar(plot_df, x="age_label", y="pop", color="지역", barmode="group",
+                 title=f"{title_regions} - 연령대별 인구 ({sel_year}, {sel_sex})",
+                 labels={"age_label":"연령대", "pop":y_label})
+fig.update_layout(xaxis_tickangle= -45, showlegend=bool(compare_regions))
+fig.update_traces(hovertemplate="%{x}<br>" + ("비율: %{y:.2f}%" if as_share else "인구: %{y:,}"))
 
 # Show chart and table
 st.plotly_chart(fig, use_container_width=True)
@@ -163,6 +119,9 @@ st.plotly_chart(fig, use_container_width=True)
 with st.expander("데이터 테이블 보기"):
     st.dataframe(data_agepop[["age_label","pop"]].rename(columns={"age_label":"연령","pop":"인구수"}))
 
+with st.expander("긴 형식(지역 × 기준월 × 성별 × 연령) 표 보기"):
+    st.dataframe(cube.tidy(regions=[region_idx]), hide_index=True)
+
 # 간단한 통계
 st.markdown("**요약 통계(표본)**")
 st.write(data_agepop["pop"].describe().apply(lambda x: f"{x:,}" if pd.notna(x) else x).to_frame().T)
@@ -173,6 +132,52 @@ def df_to_csv_bytes(df):
     return df.to_csv(index=False).encode('utf-8-sig')
 
 csv_bytes = df_to_csv_bytes(data_agepop[["age_label","pop"]].rename(columns={"age_label":"연령","pop":"인구수"}))
-st.download_button("연령별 인구 CSV 다운로드", data=csv_bytes, file_name=f"{sel_region}_agepop_{sel_year}.csv", mime="text/csv")
+st.download_button("연령별 인구 CSV 다운로드", data=csv_bytes, file_name=f"{sel_region}_agepop_{sel_year}_{sel_sex}.csv", mime="text/csv")
+
+# 모든 지역 × 연령대 표 (한 번의 누적합 조회)
+if bands is not None:
+    st.markdown("**모든 지역 연령대별 인구**")
+    band_table = pd.DataFrame(
+        cube.band_sums(bands, None, [month_idx], [sex_idx])[:, 0, 0],
+        index=pd.Index(cube.labels, name="행정구역"),
+        columns=[population_data.band_label(b) for b in bands],
+    )
+    st.dataframe(band_table, use_container_width=True)
+    st.download_button(
+        "모든 지역 연령대 표 CSV 다운로드",
+        data=df_to_csv_bytes(band_table.reset_index()),
+        file_name=f"agebands_{sel_year}_{sel_sex}.csv",
+        mime="text/csv",
+    )
+
+# 대량 내보내기: 여러 지역 · 기준월 · 성별 · 연령(대)를 조각 단위로 파일에 바로 씀
+with st.expander("여러 지역 · 기준월 한꺼번에 내보내기 (Parquet / CSV zip)"):
+    ex_regions = st.multiselect("지역 (비우면 전체)", regions_display, key="export_regions")
+    ex_months = st.multiselect("기준월", cube.month_labels, default=[sel_year], key="export_months")
+    ex_sexes = st.multiselect("성별", cube.sexes, default=cube.sexes, key="export_sexes")
+    ex_use_bands = st.checkbox("현재 연령 구분(연령대)으로 합산", value=bands is not None, disabled=bands is None)
+    ex_fmt = st.radio(
+        "형식", list(population_export.FORMATS), format_func=lambda f: population_export.FORMATS[f][0], horizontal=True
+    )
+    ex_selection = {
+        "regions": [cube.region_index(r) for r in ex_regions] or None,
+        "months": [cube.month_index(m) for m in ex_months],
+        "sexes": [cube.sex_index(s) for s in ex_sexes],
+        "bands": bands if ex_use_bands else None,
+    }
+    n_rows = (
+        (len(ex_regions) or len(cube.labels)) * len(ex_months) * len(ex_sexes)
+        * (len(bands) if ex_use_bands else len(cube.ages))
+    )
+    st.caption(f"약 {n_rows:,}행")
+    if ex_months and ex_sexes:
+        _, ext, mime = population_export.FORMATS[ex_fmt]
+        # 버튼을 누를 때 만들어짐 (임시 파일에 조각 단위로 기록)
+        st.download_button(
+            "내보내기 파일 다운로드",
+            data=lambda: population_export.export_to_tempfile(ex_fmt, cube, **ex_selection),
+            file_name=f"population_export{ext}",
+            mime=mime,
+        )
 
 st.info("문제가 있거나 특정 형식(예: 연령이 행으로 있을 때, 또는 특정 컬럼명이 있을 때)로 맞춰서 더 튜닝하길 원하면 데이터 파일의 앞부분(예시 10행)을 붙여서 알려주세요.")
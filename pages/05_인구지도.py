@@ -0,0 +1,137 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+# 상위 폴더의 population_* 모듈 사용
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+import population_data  # noqa: E402
+import population_geo  # noqa: E402
+import population_indicators  # noqa: E402
+from population_cache import (  # noqa: E402
+    data_version,
+    load_district_geometry,
+    load_indicators,
+    load_population_cube,
+    load_region_tree,
+)
+
+st.set_page_config(page_title="인구 지도", layout="wide")
+st.title("🗺️ 서울 자치구 인구 지도")
+
+# ====== 데이터 로딩 (인구 큐브 / 지표 표 / 경계는 각각 한 번만 만들어 캐시) ======
+cube = load_population_cube()
+tree = load_region_tree()
+table = load_indicators()
+geometry = load_district_geometry()
+if cube is None or tree is None or table is None:
+    st.error("population.csv 파일을 찾지 못했습니다.")
+    st.stop()
+if geometry is None or len(geometry) == 0:
+    st.error("행정구역 경계 파일(seoul_districts.geojson)을 찾지 못했습니다.")
+    st.stop()
+
+if geometry.schematic:
+    st.caption(
+        "실제 경계 대신 25개 구를 대략적인 위치에 같은 크기 칸으로 배치한 타일 지도입니다. "
+        "원본 경계 파일을 python population_geo.py 로 변환해 앱 폴더에 두면 실제 경계로 그립니다."
+    )
+
+# ====== 조건 선택 ======
+BAND_COUNT, BAND_SHARE = "연령대 인구", "연령대 비율(%)"
+c1, c2, c3 = st.columns(3)
+month = c1.selectbox("기준월", cube.month_labels, index=len(cube.month_labels) - 1)
+indicator = c2.selectbox(
+    "색칠할 지표",
+    ["총인구", "고령인구 비율(%)"] + [i for i in population_indicators.INDICATORS if i not in ("총인구", "고령인구 비율(%)")]
+    + [BAND_COUNT, BAND_SHARE],
+)
+levels = list(geometry.levels)
+if len(levels) > 1:
+    level = c3.radio("경계 정밀도", levels, index=min(1, len(levels) - 1), horizontal=True)
+else:
+    level = levels[0]
+
+band, sex = None, "계"
+if indicator in (BAND_COUNT, BAND_SHARE):
+    b1, b2 = st.columns(2)
+    band_text = b1.text_input("연령대 (예: 0-14, 20-39, 65+)", value="20-39")
+    sex = b2.radio("성별", cube.sexes, index=0, horizontal=True)
+    try:
+        bands = population_data.parse_bands(band_text)
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
+    if len(bands) != 1:
+        st.error("연령대는 하나만 입력하세요.")
+        st.stop()
+    band = bands[0]
+
+
+# ====== 지표 값: 경계 피처 순서의 배열 하나 (지표를 바꾸면 이것만 다시 계산) ======
+@st.cache_data(max_entries=256)
+def feature_values(
+    _cube, _tree, _table, _geometry, data_key: tuple, geo_key: tuple, month: str, indicator: str, band, sex: str
+) -> list:
+    """
+    경계 피처 순서의 지표 값. _cube/_tree/_table(지표 표)/_geometry 는 해시하지 않고
+    data_key(인구 파일 버전)·geo_key(경계 파일 버전)로 캐시 키를 구분
+    """
+    nodes = np.array([-1 if _tree.node(c) is None else _tree.node(c) for c in _geometry.codes], dtype=np.int64)
+    found = nodes >= 0
+    values = np.full(len(nodes), np.nan)
+    if indicator in (BAND_COUNT, BAND_SHARE):
+        m, s = _cube.month_index(month), _cube.sex_index(sex)
+        rows = _tree.values[nodes[found], m, s]
+        lo, hi = band
+        counts = rows[:, lo:None if hi is None else hi + 1].sum(axis=1)
+        if indicator == BAND_SHARE:
+            totals = rows.sum(axis=1)
+            counts = np.where(totals > 0, counts / np.maximum(totals, 1) * 100, np.nan)
+        values[found] = counts
+        values[found & ~_tree.present[np.maximum(nodes, 0), m]] = np.nan
+    else:
+        column = _table[_table["기준월"] == month].set_index("코드")[indicator]
+        values = column.reindex(_geometry.codes).to_numpy(dtype=np.float64)
+    return values.tolist()
+
+
+geo_key = population_geo.file_version(geometry.files)
+values = np.array(
+    feature_values(cube, tree, table, geometry, data_version(), geo_key, month, indicator, band, sex), dtype=np.float64
+)
+label = indicator if band is None else f"{population_data.band_label(band)} {indicator} ({sex})"
+if np.isnan(values).all():
+    st.warning("경계 파일의 행정기관코드와 일치하는 인구 데이터가 없습니다.")
+    st.stop()
+
+# ====== 지도 (경계 GeoJSON 은 캐시된 객체를 그대로 사용) ======
+geojson = geometry.geojson(level)
+percent = "%" in label or indicator in ("유소년부양비", "노년부양비", "총부양비", "노령화지수", "중위연령")
+fig = go.Figure(go.Choropleth(
+    geojson=geojson,
+    featureidkey="properties.code",
+    locations=geometry.codes,
+    z=values,
+    text=geometry.names,
+    colorscale="YlOrRd",
+    marker_line_color="white",
+    marker_line_width=1,
+    colorbar=dict(title=label),
+    hovertemplate="%{text}<br>" + label + ": %{z:" + (",.2f" if percent else ",.0f") + "}<extra></extra>",
+))
+fig.update_geos(fitbounds="locations", visible=False)
+fig.update_layout(height=650, margin=dict(l=0, r=0, t=30, b=0), title=f"{month} · {label}")
+st.plotly_chart(fig, use_container_width=True)
+
+# ====== 표 ======
+view = pd.DataFrame({"행정구역": geometry.names, "코드": geometry.codes, label: values})
+view = view.sort_values(label, ascending=False, na_position="last").reset_index(drop=True)
+st.dataframe(view, hide_index=True, use_container_width=True)
+st.caption(
+    f"경계 파일: {geometry.path.name} · 피처 {len(geometry)}개 · "
+    f"{level} 정밀도 좌표 {population_geo.count_points(geojson):,}개 (미리 단순화한 파일)"
+)
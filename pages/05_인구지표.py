@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+import plotly.express as px
+import streamlit as st
+
+# 상위 폴더의 population_* 모듈 사용
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+import population_indicators  # noqa: E402
+from population_cache import load_indicators, load_population_cube  # noqa: E402
+
+st.set_page_config(page_title="지역별 인구 지표", layout="wide")
+st.title("📊 지역별 인구 지표 순위")
+st.caption("중위연령 · 부양비 · 노령화지수 · 고령인구 비율 · 전월 대비 증감 (모든 지역을 한 번에 계산해 캐시)")
+
+# ====== 데이터 로딩: 모든 지역 × 기준월 지표 표 (파일 버전당 한 번) ======
+cube = load_population_cube()
+table = load_indicators()
+if cube is None or table is None:
+    st.error("population.csv 파일을 찾지 못했습니다.")
+    st.stop()
+
+# ====== 조건 선택 ======
+c1, c2, c3 = st.columns(3)
+month = c1.selectbox("기준월", cube.month_labels, index=len(cube.month_labels) - 1)
+levels = [lv for lv in table["단계"].cat.categories if (table["단계"] == lv).any()]
+level = c2.selectbox("행정구역 단계", levels, index=min(1, len(levels) - 1))
+indicator = c3.selectbox("정렬 기준 지표", population_indicators.INDICATORS, index=1)
+
+c4, c5, c6 = st.columns(3)
+descending = c4.radio("정렬 순서", ["높은 순", "낮은 순"], horizontal=True) == "높은 순"
+top_n = c5.slider("그래프에 표시할 지역 수", 5, 50, 20)
+keyword = c6.text_input("지역 이름 검색", "")
+
+# ====== 순위 표 ======
+view = table[(table["기준월"] == month) & (table["단계"] == level)]
+if keyword:
+    view = view[view["행정구역"].str.contains(keyword, regex=False)]
+view = view.dropna(subset=[indicator]).sort_values(indicator, ascending=not descending)
+if view.empty:
+    st.info("조건에 맞는 지역이 없습니다.")
+    st.stop()
+if len(cube.month_labels) < 2:
+    st.caption("기준월이 하나뿐이라 전월 대비 증감은 비어 있습니다. population*.csv 파일을 더 추가하면 계산됩니다.")
+
+view = view.drop(columns=["단계", "기준월"]).reset_index(drop=True)
+view.insert(0, "순위", range(1, len(view) + 1))
+
+fig = px.bar(
+    view.head(top_n),
+    x=indicator,
+    y="행정구역",
+    orientation="h",
+    title=f"{month} {level} {indicator} {'상위' if descending else '하위'} {min(top_n, len(view))}",
+)
+fig.update_layout(yaxis=dict(autorange="reversed"), height=max(400, 22 * min(top_n, len(view))))
+st.plotly_chart(fig, use_container_width=True)
+
+# 표의 열 머리글을 눌러 다른 지표로도 정렬할 수 있음
+st.dataframe(view, hide_index=True, use_container_width=True)
+st.download_button(
+    "지표 표 CSV 다운로드",
+    data=view.to_csv(index=False).encode("utf-8-sig"),
+    file_name=f"population_indicators_{month}_{level}.csv",
+    mime="text/csv",
+)
+
+with st.expander("지표 설명"):
+    st.markdown(population_indicators.__doc__)
@@ -0,0 +1,130 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+# 상위 폴더의 population_* 모듈 사용
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from population_cache import load_population_cube, load_region_tree, region_picker  # noqa: E402
+
+st.set_page_config(page_title="인구 피라미드", layout="wide")
+st.title("👫 성별·연령 인구 피라미드")
+st.caption("왼쪽은 남자, 오른쪽은 여자. 두 지역 또는 두 기준월을 겹쳐서 비교할 수 있습니다.")
+
+# ====== 데이터 로딩: [지역, 월, 성별, 나이] 배열 (파일 버전당 한 번) ======
+cube = load_population_cube()
+tree = load_region_tree()
+if cube is None or tree is None or len(tree.roots) == 0:
+    st.error("population.csv 파일을 찾지 못했습니다.")
+    st.stop()
+
+MALE, FEMALE = cube.sex_index("남"), cube.sex_index("여")
+
+# ====== 비교 방식 / 대상 선택 ======
+mode = st.radio("비교 방식", ["한 지역", "두 지역 비교", "두 기준월 비교"], index=0, horizontal=True)
+share = st.checkbox("전체 인구 대비 비율(%)로 보기", value=mode == "두 지역 비교")
+
+st.markdown("**기준 지역**")
+node_a = region_picker(tree, key="pyramid_a")
+month_a = cube.month_index(
+    st.selectbox("기준월", cube.month_labels, index=len(cube.month_labels) - 1, key="pyramid_month_a")
+)
+series = [(node_a, month_a)]
+
+if mode == "두 지역 비교":
+    st.markdown("**비교 지역**")
+    node_b = region_picker(tree, key="pyramid_b")
+    series.append((node_b, month_a))
+elif mode == "두 기준월 비교":
+    if len(cube.month_labels) < 2:
+        st.info("기준월이 하나뿐입니다. population*.csv 파일을 더 추가하면 두 달을 비교할 수 있습니다.")
+    month_b = cube.month_index(
+        st.selectbox("비교 기준월", cube.month_labels, index=0, key="pyramid_month_b")
+    )
+    series.append((node_a, month_b))
+
+
+def series_name(node: int, month: int) -> str:
+    return f"{tree.names[node]} · {cube.month_labels[month]}"
+
+
+def male_female(node: int, month: int) -> tuple:
+    """(남자, 여자) 나이별 인구 — 트리 배열 슬라이스. share=True 면 전체 대비 %"""
+    male = tree.values[node, month, MALE].astype(np.float64)
+    female = tree.values[node, month, FEMALE].astype(np.float64)
+    if share:
+        total = male.sum() + female.sum()
+        scale = 100 / total if total > 0 else 0
+        male, female = male * scale, female * scale
+    return male, female
+
+
+for node, month in series:
+    if not tree.present[node, month]:
+        st.warning(f"{series_name(node, month)} 데이터가 없습니다.")
+        st.stop()
+
+# ====== 피라미드 그래프 ======
+unit = "%" if share else "명"
+fig = go.Figure()
+
+male, female = male_female(*series[0])
+name = series_name(*series[0])
+fig.add_trace(go.Bar(
+    y=cube.ages, x=-male, orientation="h", name=f"남 · {name}",
+    marker_color="#4c78a8", customdata=male,
+    hovertemplate=f"%{{y}}세 남: %{{customdata:,.{2 if share else 0}f}}{unit}<extra></extra>",
+))
+fig.add_trace(go.Bar(
+    y=cube.ages, x=female, orientation="h", name=f"여 · {name}",
+    marker_color="#e45756", customdata=female,
+    hovertemplate=f"%{{y}}세 여: %{{customdata:,.{2 if share else 0}f}}{unit}<extra></extra>",
+))
+
+# 비교 대상은 윤곽선(계단선)으로 겹쳐 그림
+if len(series) > 1:
+    male_b, female_b = male_female(*series[1])
+    name_b = series_name(*series[1])
+    for values, sign, label in ((male_b, -1, "남"), (female_b, 1, "여")):
+        fig.add_trace(go.Scatter(
+            y=cube.ages, x=sign * values, mode="lines", line=dict(shape="hvh", color="#222", width=1.5),
+            name=f"{label} · {name_b}", customdata=values,
+            hovertemplate=f"%{{y}}세 {label}: %{{customdata:,.{2 if share else 0}f}}{unit}<extra></extra>",
+        ))
+    peak = max(male.max(), female.max(), male_b.max(), female_b.max())
+else:
+    peak = max(male.max(), female.max())
+
+# X축 눈금은 양쪽 모두 양수로 표시
+ticks = np.linspace(0, peak, 5)
+fig.update_layout(
+    barmode="overlay",
+    bargap=0.05,
+    height=750,
+    xaxis=dict(
+        title=f"인구({unit})",
+        tickvals=np.concatenate([-ticks[:0:-1], ticks]),
+        ticktext=[f"{abs(v):,.{1 if share else 0}f}" for v in np.concatenate([-ticks[:0:-1], ticks])],
+    ),
+    yaxis=dict(title="나이(세)", dtick=10),
+    legend=dict(orientation="h", y=1.05),
+    margin=dict(l=40, r=20, t=40, b=40),
+)
+st.plotly_chart(fig, use_container_width=True)
+
+# ====== 요약 ======
+rows = []
+for node, month in series:
+    m = int(tree.values[node, month, MALE].sum())
+    f = int(tree.values[node, month, FEMALE].sum())
+    rows.append({
+        "대상": series_name(node, month),
+        "남자": m,
+        "여자": f,
+        "합계": m + f,
+        "성비(여 100명당 남)": round(m / f * 100, 1) if f else np.nan,
+    })
+st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
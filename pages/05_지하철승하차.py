@@ -1,73 +1,208 @@
+import hashlib
+import pathlib
+import sys
+import threading
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from pandas.api.types import union_categoricals
+
+# 상위 폴더의 subway_cube 모듈 사용
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+import subway_cube  # noqa: E402
+import subway_store  # noqa: E402
+from subway_store import COLUMNS  # noqa: E402
 
 st.set_page_config(page_title="지하철 승하차 분석", layout="wide")
 
-st.title("🚇 2025년 10월 지하철 승하차 TOP10 분석 대시보드")
+CHUNK_ROWS = 200_000        # 한 번에 파싱할 행 수 (메모리 상한)
+MAX_CACHED_UPLOADS = 4      # 세션 간 공유해서 보관할 업로드 파일 수
+
+
+# ---------------------------
+# 업로드 파싱 캐시 (내용 해시 기준, 모든 세션 공유)
+# ---------------------------
+def content_hash(uploaded_file) -> str:
+    """
+    업로드 파일 내용의 sha256.
+    같은 세션에서 같은 파일이면 다시 계산하지 않도록 file_id 별로 기억.
+    """
+    hashes = st.session_state.setdefault("upload_hashes", {})
+    if uploaded_file.file_id not in hashes:
+        with uploaded_file.getbuffer() as buf:
+            hashes[uploaded_file.file_id] = hashlib.sha256(buf).hexdigest()
+    return hashes[uploaded_file.file_id]
+
+
+def parse_upload(uploaded_file, on_progress=None) -> pd.DataFrame:
+    """
+    CSV를 CHUNK_ROWS 행씩 나눠 읽어서 작은 타입으로 바로 변환.
+    - 청크마다 압축 표현(int16 일자, category 역/노선, int32 인원)으로 변환
+    - 전체를 문자열(object)로 한 번에 올리지 않으므로 큰 파일도 메모리가 덜 튐
+    """
+    total_size = max(uploaded_file.size, 1)
+    uploaded_file.seek(0)
+
+    reader = pd.read_csv(
+        uploaded_file,
+        encoding="cp949",
+        usecols=COLUMNS,
+        chunksize=CHUNK_ROWS,
+        dtype={
+            "사용일자": "int32",
+            "노선명": "category",
+            "역명": "category",
+            "승차총승객수": "int32",
+            "하차총승객수": "int32",
+        },
+    )
+
+    chunks = []
+    for chunk in reader:
+        chunks.append(subway_store.compact_frame(chunk))
+        if on_progress is not None:
+            on_progress(min(uploaded_file.tell() / total_size, 1.0))
+
+    if not chunks:
+        return subway_store.compact_frame(pd.DataFrame(columns=COLUMNS))
+
+    # 청크마다 다른 category 목록을 하나로 합침
+    df = pd.DataFrame(
+        {
+            "day": pd.concat([c["day"] for c in chunks], ignore_index=True),
+            "노선명": union_categoricals([c["노선명"] for c in chunks]),
+            "역명": union_categoricals([c["역명"] for c in chunks]),
+            "승차총승객수": pd.concat([c["승차총승객수"] for c in chunks], ignore_index=True),
+            "하차총승객수": pd.concat([c["하차총승객수"] for c in chunks], ignore_index=True),
+        }
+    )
+    return df
+
+
+@st.cache_resource(max_entries=MAX_CACHED_UPLOADS, show_spinner=False)
+def _upload_slot(digest: str) -> dict:
+    """
+    내용 해시(digest)별 보관 칸 {"cube": 집계 큐브 또는 None, "lock": 파싱 잠금}.
+    칸만 캐시하고 파싱은 캐시 밖에서 하므로 진행 표시가 캐시 적중 때 다시 재생되지 않음.
+    """
+    return {"cube": None, "lock": threading.Lock()}
+
+
+def load_upload(uploaded_file) -> subway_cube.RidershipCube:
+    """
+    같은 내용의 파일은 (다른 세션이 올렸더라도) 한 번만 파싱해서 일자 × (호선, 역) 집계 큐브로 보관.
+    같은 해시를 여러 세션이 동시에 요청하면 한 세션만 파싱하고 나머지는 기다렸다가 재사용.
+    """
+    slot = _upload_slot(content_hash(uploaded_file))
+    with slot["lock"]:
+        if slot["cube"] is None:
+            progress = st.progress(0.0, text="CSV 파싱 중...")
+            df = parse_upload(uploaded_file, lambda ratio: progress.progress(ratio, text=f"CSV 파싱 중... {ratio:.0%}"))
+            progress.empty()
+            slot["cube"] = subway_cube.RidershipCube(df)
+        return slot["cube"]
+
+
+METRICS = {
+    "승하차 합계": "총승하차",
+    "승차": "승차총승객수",
+    "하차": "하차총승객수",
+}
+
+
+st.title("🚇 지하철 승하차 TOP N 분석 대시보드")
 
 st.write("CSV 파일을 업로드해주세요. (예: subway.csv)")
 
 uploaded_file = st.file_uploader("지하철 데이터 업로드", type=["csv"])
 
 if uploaded_file is not None:
-    df = pd.read_csv(uploaded_file, encoding="cp949")
+    # 내용 해시로 캐시된 집계 큐브 사용
+    cube = load_upload(uploaded_file)
 
-    # 날짜 변환
-    df["사용일자"] = pd.to_datetime(df["사용일자"].astype(str), format="%Y%m%d")
+    if cube.n_pairs == 0:
+        st.warning("업로드한 파일에 데이터가 없습니다.")
+        st.stop()
 
     # 사이드바 선택 UI
     st.sidebar.header("🔎 조건 선택")
-    
-    # 2025년 10월 날짜 범위
-    start_date = pd.to_datetime("2025-10-01")
-    end_date = pd.to_datetime("2025-10-31")
 
-    selected_date = st.sidebar.date_input(
-        "날짜 선택",
+    # 데이터에 들어있는 날짜 범위
+    available_dates = cube.dates
+    start_date = available_dates[0]
+    end_date = available_dates[-1]
+
+    selected_range = st.sidebar.date_input(
+        "기간 선택 (하루만 보려면 같은 날짜를 두 번 선택)",
         min_value=start_date,
         max_value=end_date,
-        value=start_date
+        value=(start_date, start_date),
     )
-
-    # 선택한 날짜에 맞춰 필터링
-    df_filtered_date = df[df["사용일자"] == pd.to_datetime(selected_date)]
-
-    # 호선 선택
-    lines = sorted(df_filtered_date["노선명"].unique())
-    selected_line = st.sidebar.selectbox("호선 선택", lines)
-
-    df_filtered = df_filtered_date[df_filtered_date["노선명"] == selected_line].copy()
-
-    if df_filtered.empty:
-        st.warning("해당 날짜와 호선에 대한 데이터가 없습니다.")
+    if isinstance(selected_range, (tuple, list)):
+        range_start, range_end = selected_range[0], selected_range[-1]
     else:
-        # 승하차 합산
-        df_filtered["승하차합"] = df_filtered["승차총승객수"] + df_filtered["하차총승객수"]
+        range_start = range_end = selected_range
+
+    # 호선 선택 (여러 개 가능)
+    lines = list(cube.lines)
+    selected_lines = st.sidebar.multiselect("호선 선택", lines, default=lines[:1])
+
+    metric_label = st.sidebar.radio("순위 기준", list(METRICS), index=0)
+    top_n = st.sidebar.slider("표시할 역 수 (TOP N)", min_value=5, max_value=50, value=10, step=5)
+
+    # 선택 기간의 일자 인덱스 × 선택 호선 → 상위 N개 역
+    lo, hi = cube.range_index(range_start, range_end)
+    top = cube.top_k(
+        range(lo, hi),
+        [cube.line_index(ln) for ln in selected_lines],
+        k=top_n,
+        metric=METRICS[metric_label],
+    )
 
-        # TOP 10 역 추출
-        top10 = df_filtered.sort_values("승하차합", ascending=False).head(10)
+    if top.empty:
+        st.warning("해당 기간과 호선에 대한 데이터가 없습니다.")
+    else:
+        value_col = METRICS[metric_label]
 
         # 색상 설정 (1등 빨강, 나머지는 파랑→흐려지는 그라데이션)
-        colors = ["red"] + [f"rgba(0,0,255,{1 - i*0.08})" for i in range(1, 10)]
+        n = len(top)
+        step = 0.08 * 9 / max(n - 1, 9)
+        colors = ["red"] + [f"rgba(0,0,255,{1 - i * step:.2f})" for i in range(1, n)]
+
+        period_text = (
+            f"{range_start}" if range_start == range_end else f"{range_start} ~ {range_end}"
+        )
+        line_text = ", ".join(selected_lines) if len(selected_lines) <= 3 else f"{len(selected_lines)}개 호선"
 
         fig = px.bar(
-            top10,
+            top,
             x="역명",
-            y="승하차합",
-            title=f"🚇 {selected_date} / {selected_line} 승하차 합산 TOP10",
-            text="승하차합"
+            y=value_col,
+            title=f"🚇 {period_text} / {line_text} {metric_label} TOP{top_n}",
+            text=value_col
         )
 
         fig.update_traces(marker_color=colors, textposition="outside")
 
         fig.update_layout(
             xaxis_title="역명",
-            yaxis_title="승하차 승객수 합계",
+            yaxis_title=f"{metric_label} 승객수",
             template="plotly_white",
         )
 
         st.plotly_chart(fig, use_container_width=True)
 
+        with st.expander("📋 TOP N 표 보기"):
+            st.dataframe(top, hide_index=True)
+
+    # 메모리 사용량 (디버그)
+    with st.sidebar.expander("🧰 메모리 사용량 (디버그)"):
+        st.caption(
+            f"업로드 캐시 항목 {content_hash(uploaded_file)[:12]} · {cube.nbytes / 1024 ** 2:,.2f} MB "
+            f"(최근 {MAX_CACHED_UPLOADS}개 파일까지 보관)"
+        )
+        st.dataframe(cube.memory_report().sort_values("bytes", ascending=False), hide_index=True)
+
 else:
     st.info("지하철 CSV 파일을 먼저 업로드해주세요.")
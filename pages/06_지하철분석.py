@@ -1,87 +1,104 @@
 import pathlib
+import sys
+import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import date
 
+# 상위 폴더의 subway_* 모듈 사용
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+import subway_store  # noqa: E402
+from subway_cache import load_cube, load_profiles, load_search_index  # noqa: E402
+
 # ---------------------------
-# 데이터 로딩 함수 (캐시 적용)
+# 막대 색상: 1등 빨간색, 나머지는 파란색 → 하늘색 그라데이션
 # ---------------------------
-@st.cache_data
-def load_data() -> pd.DataFrame:
-    # 현재 파일 기준으로 상위 폴더에 있는 subway.csv 읽기
-    csv_path = pathlib.Path(__file__).resolve().parent.parent / "subway.csv"
-
-    # 인코딩 에러 대비해서 cp949 / utf-8-sig 순차 시도
-    for enc in ["cp949", "utf-8-sig"]:
-        try:
-            df = pd.read_csv(csv_path, encoding=enc)
-            break
-        except UnicodeDecodeError:
-            continue
-
-    # 날짜 컬럼을 datetime으로 변환
-    df["date"] = pd.to_datetime(df["사용일자"].astype(str), format="%Y%m%d")
-
-    # 2025년 10월 데이터만 필터링
-    df = df[(df["date"].dt.year == 2025) & (df["date"].dt.month == 10)].copy()
-
-    # 총 승하차 인원 컬럼 추가 (승차 + 하차)
-    df["총승하차"] = df["승차총승객수"] + df["하차총승객수"]
+GRADIENT_START = "#005AFF"   # 진한 파란색 (0, 90, 255)
+GRADIENT_END = "#B4DCFF"     # 아주 연한 하늘색 (180, 220, 255)
+OTHERS_COLOR = "#BBBBBB"     # '기타' 막대
 
-    # 일자(일) 컬럼 추가
-    df["day"] = df["date"].dt.day
 
-    return df
-
-
-# ---------------------------
-# 파란색 그라데이션 색 생성 함수
-# ---------------------------
-def generate_blue_gradient(n: int):
+def rank_colorscale(n: int) -> list:
     """
-    n개의 파란색 계열 그라데이션 색상을 생성.
-    진한 파란색 → 연한 하늘색으로 점점 밝아짐.
+    순위(0 ~ n-1)를 색으로 바꾸는 colorscale.
+    막대마다 색 문자열을 보내는 대신 순위 숫자 배열 하나만 보내면 됨.
     """
-    if n <= 0:
-        return []
-
-    start = (0, 90, 255)     # 진한 파란색
-    end = (180, 220, 255)    # 아주 연한 하늘색
-
-    colors = []
-    for i in range(n):
-        ratio = i / (n - 1) if n > 1 else 0
-        r = int(start[0] + (end[0] - start[0]) * ratio)
-        g = int(start[1] + (end[1] - start[1]) * ratio)
-        b = int(start[2] + (end[2] - start[2]) * ratio)
-        colors.append(f"#{r:02X}{g:02X}{b:02X}")
-    return colors
+    if n <= 2:
+        return [[0, "#FF0000"], [0.5, "#FF0000"], [0.5, GRADIENT_START], [1, GRADIENT_START]]
+    first = 1 / (n - 1)
+    return [
+        [0, "#FF0000"],
+        [first / 2, "#FF0000"],
+        [first / 2, GRADIENT_START],
+        [first, GRADIENT_START],
+        [1, GRADIENT_END],
+    ]
 
 
 # ---------------------------
-# 상/중/하 등급 계산 함수
+# 막대그래프 캐시 (조회 조건 + 데이터 버전 기준, 모든 세션 공유)
 # ---------------------------
-def rank_to_level(value, series: pd.Series) -> str:
+@st.cache_resource(max_entries=512)
+def station_bar_figure(start: date, end: date, version: str, day_idx: int, line_idx: int, top_n: int):
     """
-    해당 값이 series 안에서 어느 정도 위치인지 보고
-    상/중/하 등급으로 반환.
-    - 상: 상위 1/3 이상
-    - 중: 중간 1/3
-    - 하: 하위 1/3
+    하루 × 호선 역별 총 승하차 막대그래프.
+    - top_n > 0 이면 상위 top_n 개 역 + 나머지를 '기타' 막대 하나로 묶음
+    - 숫자 배열은 int32 로 보내서 바이너리(base64)로 인코딩되게 함
+    - 막대 글자는 y 값으로 브라우저에서 만들고(texttemplate), 색은 순위 배열 + colorscale
+    반환: (figure, 전송 크기 bytes)
     """
-    if series.empty:
-        return "-"
-
-    q1 = series.quantile(1/3)
-    q2 = series.quantile(2/3)
-
-    if value >= q2:
-        return "상"
-    elif value >= q1:
-        return "중"
-    else:
-        return "하"
+    df_grouped = load_cube(start, end, version).line_day(day_idx, line_idx)
+
+    others = None
+    if 0 < top_n < len(df_grouped):
+        rest = df_grouped.iloc[top_n:]
+        others = (f"기타 ({len(rest)}개 역)", int(rest["총승하차"].sum()))
+        df_grouped = df_grouped.iloc[:top_n]
+
+    n = len(df_grouped)
+    names = df_grouped["역명"].tolist()
+    fig = go.Figure(
+        go.Bar(
+            x=names,
+            y=df_grouped["총승하차"].to_numpy(dtype=np.int32),
+            marker=dict(
+                color=np.arange(n, dtype=np.int16),
+                colorscale=rank_colorscale(n),
+                cmin=0,
+                cmax=max(n - 1, 1),
+            ),
+            texttemplate="%{y:,}",
+            hovertemplate="<b>%{x}</b><br>총 승하차 인원: %{y:,}명<extra></extra>",
+            showlegend=False,
+        )
+    )
+    if others is not None:
+        fig.add_trace(
+            go.Bar(
+                x=[others[0]],
+                y=np.array([others[1]], dtype=np.int32),
+                marker_color=OTHERS_COLOR,
+                texttemplate="%{y:,}",
+                hovertemplate="<b>%{x}</b><br>총 승하차 인원: %{y:,}명<extra></extra>",
+                showlegend=False,
+            )
+        )
+        names = names + [others[0]]
+
+    fig.update_layout(
+        template=go.layout.Template(),  # 기본 템플릿(수 KB) 대신 빈 템플릿, 테마는 Streamlit이 적용
+        barmode="relative",
+        xaxis_title="역명",
+        yaxis_title="총 승하차 인원 (명)",
+        xaxis_tickangle=-45,
+        xaxis=dict(categoryorder="array", categoryarray=names),
+        margin=dict(l=40, r=20, t=40, b=120),
+        hovermode="x unified",
+    )
+    return fig, len(pio.to_json(fig, validate=False))
 
 
 # ---------------------------
@@ -89,29 +106,39 @@ def rank_to_level(value, series: pd.Series) -> str:
 # ---------------------------
 def main():
     st.set_page_config(
-        page_title="지하철 이용 현황 분석 (2025년 10월)",
+        page_title="지하철 이용 현황 분석",
         layout="wide",
     )
 
-    st.title("🚇 지하철 이용 현황 분석 (2025년 10월)")
+    st.title("🚇 지하철 이용 현황 분석")
     st.markdown(
         """
-        2025년 10월 중 **하루**와 **호선**을 선택하면  
+        데이터 기간 중 **하루**와 **호선**을 선택하면  
         해당 조건에서 **승차 + 하차 인원이 가장 많은 역 순서**로 막대그래프를 보여줍니다.  
 
         아래에는 **역 이름으로 조회해서**  
         - 이 역이 **몇 호선인지**  
         - **월초 / 월중 / 월말** 기준으로 승·하차 평균  
-        - 같은 호선에서 이 역의 **승·하차 규모가 상/중/하 중 어디쯤인지**  
+        - 사이드바에서 고른 **분석 기간**의 승·하차 합계와 평균  
+        - **평일 / 주말 / 공휴일**(추석 연휴·대체공휴일 포함) 승·하차 평균 비교  
+        - 같은 호선에서 이 역의 **승·하차 규모가 상/중/하 중 어디쯤인지** (백분위 포함)  
+        - 호선별 **전체 역 순위표**  
+        - 일자별 승·하차 패턴이 **비슷한 역**과 역 유형(출퇴근형/여가형/이벤트형)  
         를 확인할 수 있는 기능도 있습니다.
         """
     )
 
-    # 데이터 로딩
-    df = load_data()
+    # 데이터 로딩 (저장소가 비어 있으면 subway.csv를 한 번 적재)
+    subway_store.ensure_store()
+    data_range = subway_store.available_range()
+    if data_range is None:
+        st.error("지하철 데이터가 없습니다. subway.csv를 다시 확인해주세요.")
+        return
+    version = subway_store.store_version()
+    cube = load_cube(*data_range, version)
 
-    if df.empty:
-        st.error("2025년 10월 데이터가 없습니다. subway.csv를 다시 확인해주세요.")
+    if cube.n_pairs == 0:
+        st.error("지하철 데이터가 없습니다. subway.csv를 다시 확인해주세요.")
         return
 
     # ---------------------------
@@ -119,92 +146,115 @@ def main():
     # ---------------------------
     st.sidebar.header("⚙️ 조건 선택")
 
-    # 사용 가능한 날짜(2025년 10월) 목록
-    available_dates = sorted(df["date"].dt.date.unique())
-    default_date = available_dates[0] if available_dates else date(2025, 10, 1)
+    # 사용 가능한 날짜 목록 (저장소 전체 기간)
+    available_dates = cube.dates
+    default_date = available_dates[0]
 
     selected_date = st.sidebar.selectbox(
-        "날짜 선택 (2025년 10월)",
+        "날짜 선택",
         options=available_dates,
         index=available_dates.index(default_date) if default_date in available_dates else 0,
         format_func=lambda d: d.strftime("%Y-%m-%d"),
     )
 
     # 사용 가능한 노선 목록
-    available_lines = sorted(df["노선명"].unique())
+    available_lines = list(cube.lines)
     selected_line = st.sidebar.selectbox(
         "호선 선택",
         options=available_lines,
         index=0,
     )
 
+    # 막대그래프 표시 방식 (역이 많은 호선은 상위 N개 + 기타로 가볍게)
+    bar_mode = st.sidebar.radio("막대그래프 표시", ["전체 역", "상위 N개 + 기타"], index=0)
+    bar_top_n = 0
+    if bar_mode == "상위 N개 + 기타":
+        bar_top_n = st.sidebar.slider("표시할 역 수 (N)", min_value=5, max_value=50, value=20, step=5)
+
+    # 분석 기간 (역별 기간 합계 / 역 상세에 사용)
+    selected_range = st.sidebar.date_input(
+        "분석 기간 선택",
+        value=(available_dates[0], available_dates[-1]),
+        min_value=available_dates[0],
+        max_value=available_dates[-1],
+    )
+    # 시작일만 고른 상태에서는 하루짜리 기간으로 처리
+    if isinstance(selected_range, (tuple, list)):
+        range_start = selected_range[0]
+        range_end = selected_range[-1]
+    else:
+        range_start = range_end = selected_range
+    range_lo, range_hi = cube.range_index(range_start, range_end)
+    range_text = f"{range_start.strftime('%Y-%m-%d')} ~ {range_end.strftime('%Y-%m-%d')}"
+
     st.sidebar.info(
         f"선택된 날짜: **{selected_date.strftime('%Y-%m-%d')}**\n\n"
-        f"선택된 노선: **{selected_line}**"
+        f"선택된 노선: **{selected_line}**\n\n"
+        f"분석 기간: **{range_text}**"
     )
 
+    # 메모리 사용량 (디버그)
+    with st.sidebar.expander("🧰 메모리 사용량 (디버그)"):
+        report = cube.memory_report()
+        st.write(f"큐브 캐시 항목: **{cube.nbytes / 1024 ** 2:,.2f} MB** (모든 세션 공유)")
+        st.dataframe(report.sort_values("bytes", ascending=False), hide_index=True)
+        st.write(f"로딩 시 원본 프레임: **{cube.source_memory.sum() / 1024 ** 2:,.2f} MB** (큐브 생성 후 해제)")
+        st.dataframe(cube.source_memory.rename("bytes"))
+
     # ---------------------------
     # 선택 조건에 따른 데이터 필터링 (그래프용)
     # ---------------------------
-    mask = (df["date"].dt.date == selected_date) & (df["노선명"] == selected_line)
-    df_filtered = df[mask].copy()
+    day_idx = cube.day_index(selected_date)
+    line_idx = cube.line_index(selected_line)
+    df_grouped = cube.line_day(day_idx, line_idx)
 
     st.subheader("📄 선택 조건 요약")
     st.write(
         f"- 날짜: **{selected_date.strftime('%Y-%m-%d')}**  \n"
         f"- 노선: **{selected_line}**  \n"
-        f"- 데이터 건수: **{len(df_filtered)}행**"
+        f"- 데이터 건수: **{len(df_grouped)}행**"
     )
 
-    if df_filtered.empty:
+    if df_grouped.empty:
         st.warning("선택한 날짜와 호선에 해당하는 데이터가 없습니다.")
     else:
-        # 역별 총 승하차 인원 집계
-        df_grouped = (
-            df_filtered.groupby("역명", as_index=False)["총승하차"]
-            .sum()
-            .sort_values("총승하차", ascending=False)
-        )
-
         # ---------------------------
         # Plotly 막대그래프 생성
         # ---------------------------
         st.subheader("🏆 역별 승·하차 합계 (내림차순)")
 
-        # 1등은 빨간색, 나머지는 파란색 → 하늘색 그라데이션
-        n = len(df_grouped)
-        if n > 0:
-            blue_grad = generate_blue_gradient(max(n - 1, 0))
-            colors = ["#FF0000"] + blue_grad  # 1등 빨간색
-        else:
-            colors = []
-
-        fig = px.bar(
-            df_grouped,
-            x="역명",
-            y="총승하차",
-            text="총승하차",
+        fig, payload = station_bar_figure(
+            *data_range, version, day_idx, line_idx, bar_top_n
         )
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"차트 전송 크기: 약 {payload / 1024:,.1f} KB")
 
-        # 각 막대 색상 적용
-        fig.update_traces(
-            marker_color=colors,
-            texttemplate="%{text:,}",
-            hovertemplate="<b>%{x}</b><br>총 승하차 인원: %{y:,}명<extra></extra>",
-        )
+        with st.expander("🔎 필터링된 데이터(상위 20행) 보기"):
+            st.dataframe(df_grouped.head(20))
 
-        fig.update_layout(
-            xaxis_title="역명",
-            yaxis_title="총 승하차 인원 (명)",
-            xaxis_tickangle=-45,
-            margin=dict(l=40, r=20, t=40, b=120),
-            hovermode="x unified",
-        )
+    # ---------------------------
+    # 분석 기간 역별 합계 (누적합 두 번 조회로 모든 역을 한 번에)
+    # ---------------------------
+    st.markdown("---")
+    st.subheader(f"📅 분석 기간 역별 승·하차 합계 ({range_text})")
 
-        st.plotly_chart(fig, use_container_width=True)
+    range_df = cube.range_sum(range_lo, range_hi)
+    range_df = range_df[range_df["rows"] > 0]
 
-        with st.expander("🔎 필터링된 원본 데이터(상위 20행) 보기"):
-            st.dataframe(df_filtered.head(20))
+    if range_df.empty:
+        st.info("선택한 기간에 해당하는 데이터가 없습니다.")
+    else:
+        range_table = pd.DataFrame(
+            {
+                "승차 합계": range_df["승차총승객수"],
+                "하차 합계": range_df["하차총승객수"],
+                "승하차 합계": range_df["승차총승객수"] + range_df["하차총승객수"],
+                "일평균 승차": (range_df["승차총승객수"] / range_df["days"]).round(1),
+                "일평균 하차": (range_df["하차총승객수"] / range_df["days"]).round(1),
+                "일수": range_df["days"],
+            }
+        ).sort_values("승하차 합계", ascending=False)
+        st.dataframe(range_table, use_container_width=True)
 
     # ============================================================
     # 🚉 역 입력 받아서 정보 조회하는 섹션 (여기부터 추가된 부분)
@@ -212,24 +262,31 @@ def main():
     st.markdown("---")
     st.subheader("🚉 역 기준 상세 분석")
 
-    # 역 목록 (오름차순)
-    station_list = sorted(df["역명"].unique())
+    # 역 검색 (예: 강남 / 이수 / ㄱㄴ) → 결과 목록에서 선택
+    search_index = load_search_index(*data_range, version)
+    query = st.text_input("역 검색 (역명 일부 또는 초성, 예: 강남 · 이수 · ㄱㄴ)", value="")
+    station_list = (
+        search_index.search(query, limit=50) if query.strip() else list(cube.stations)
+    )
+
+    if not station_list:
+        st.warning(f"'{query}' 에 해당하는 역이 없습니다.")
+        return
 
     selected_station = st.selectbox(
         "역을 선택하세요",
         options=station_list,
         index=0,
+        format_func=search_index.label,
     )
 
-    # 선택된 역에 대한 전체 (2025년 10월) 데이터
-    df_station = df[df["역명"] == selected_station].copy()
-
-    if df_station.empty:
+    station_idx = cube.station_index(selected_station)
+    if station_idx is None:
         st.warning("선택한 역에 대한 데이터가 없습니다.")
         return
 
     # 이 역이 포함된 호선 목록
-    lines_for_station = sorted(df_station["노선명"].unique())
+    lines_for_station = cube.station_lines(station_idx)
 
     st.write(
         f"**{selected_station}역**은(는) 다음 호선에 포함되어 있습니다: "
@@ -237,27 +294,30 @@ def main():
     )
 
     # ---------------------------
-    # 월초 / 월중 / 월말 구간 정의
+    # 월초 / 월중 / 월말 구간 정의 (일자 범위)
     # ---------------------------
-    def period_label(day: int) -> str:
-        if day <= 10:
-            return "월초 (1~10일)"
-        elif day <= 20:
-            return "월중 (11~20일)"
-        else:
-            return "월말 (21~말일)"
-
-    df_station["기간구분"] = df_station["day"].apply(period_label)
-
-    # 기간별 승차/하차 평균
-    period_avg = (
-        df_station.groupby("기간구분")[["승차총승객수", "하차총승객수"]]
-        .mean()
-        .round(1)
-        .reindex(["월초 (1~10일)", "월중 (11~20일)", "월말 (21~말일)"])
-    )
+    periods = [
+        ("월초 (1~10일)", 1, 10),
+        ("월중 (11~20일)", 11, 20),
+        ("월말 (21~말일)", 21, 31),
+    ]
+
+    # 기간별 승차/하차 평균 (행 단위 평균)
+    # 각 구간은 달마다 연속된 날짜 범위 → 누적합 조회로 모든 역을 한 번에 계산
+    period_rows = []
+    for label, first_day, last_day in periods:
+        totals = cube.period_sum(range_lo, range_hi, first_day, last_day).iloc[station_idx]
+        n_rows = totals["rows"]
+        period_rows.append(
+            {
+                "기간구분": label,
+                "승차총승객수": totals["승차총승객수"] / n_rows if n_rows else float("nan"),
+                "하차총승객수": totals["하차총승객수"] / n_rows if n_rows else float("nan"),
+            }
+        )
+    period_avg = pd.DataFrame(period_rows).set_index("기간구분").round(1)
 
-    st.markdown("#### 📆 월초·월중·월말 승·하차 평균 (2025년 10월 기준)")
+    st.markdown(f"#### 📆 월초·월중·월말 승·하차 평균 ({range_text})")
     st.dataframe(
         period_avg.rename(
             columns={
@@ -268,55 +328,110 @@ def main():
     )
 
     # ---------------------------
-    # 같은 호선 내에서 상/중/하 등급 계산
+    # 평일 / 주말 / 공휴일 비교 (로딩 시 계산해 둔 일유형별 평균 조회)
     # ---------------------------
-    st.markdown("#### 📊 같은 호선 내에서 이 역의 규모 (상/중/하)")
-
-    grade_rows = []
-    for line_name in lines_for_station:
-        # 해당 호선 전체역 데이터
-        df_line = df[df["노선명"] == line_name].copy()
-        if df_line.empty:
-            continue
-
-        # 호선 내 역별 총 승차/하차 합계
-        line_group = (
-            df_line.groupby("역명")[["승차총승객수", "하차총승객수"]]
-            .sum()
+    st.markdown("#### 🗓️ 평일 · 주말 · 공휴일 승·하차 평균 비교")
+
+    holidays = cube.calendar[cube.calendar["공휴일"]]
+    if not holidays.empty:
+        st.caption(
+            "공휴일: "
+            + ", ".join(
+                f"{d.strftime('%m/%d')}({name})"
+                for d, name in zip(holidays["날짜"], holidays["공휴일명"])
+            )
         )
 
-        if selected_station not in line_group.index:
-            continue
+    day_type_df = cube.day_type_table(station_idx)
+    st.dataframe(day_type_df)
+
+    fig_day_type = px.bar(
+        day_type_df.reset_index().melt(
+            id_vars="일유형",
+            value_vars=["승차 평균", "하차 평균"],
+            var_name="구분",
+            value_name="평균 인원",
+        ),
+        x="일유형",
+        y="평균 인원",
+        color="구분",
+        barmode="group",
+        text="평균 인원",
+    )
+    fig_day_type.update_traces(texttemplate="%{text:,.0f}")
+    fig_day_type.update_layout(
+        xaxis_title="일유형",
+        yaxis_title="일평균 인원 (명)",
+        margin=dict(l=40, r=20, t=20, b=40),
+    )
+    st.plotly_chart(fig_day_type, use_container_width=True)
 
-        station_totals = line_group.loc[selected_station]
+    with st.expander("🚇 호선별 평일 · 주말 · 공휴일 역당 일평균 보기"):
+        st.dataframe(cube.line_day_type)
 
-        # 상/중/하 등급
-        승차등급 = rank_to_level(
-            station_totals["승차총승객수"],
-            line_group["승차총승객수"],
-        )
-        하차등급 = rank_to_level(
-            station_totals["하차총승객수"],
-            line_group["하차총승객수"],
-        )
+    # ---------------------------
+    # 비슷한 패턴의 역 (미리 계산한 유사도 행렬 / 군집 조회)
+    # ---------------------------
+    st.markdown("#### 🧭 이 역과 일자별 패턴이 비슷한 역")
 
-        grade_rows.append(
+    profiles = load_profiles(*data_range, version)
+    similar_df = profiles.similar(station_idx, k=10)
+
+    st.write(f"**{selected_station}역**의 유형: **{profiles.cluster_of(station_idx)}**")
+
+    col_table, col_chart = st.columns([2, 3])
+    with col_table:
+        st.dataframe(similar_df, hide_index=True, use_container_width=True)
+    with col_chart:
+        # 자기 평균 대비 일자별 승차 비율 (1.0 = 평소 수준)
+        compare_names = [selected_station] + similar_df["역명"].head(3).tolist()
+        profile_df = pd.DataFrame(
             {
-                "호선": line_name,
-                "역명": selected_station,
-                "총 승차 인원 (월합계)": int(station_totals["승차총승객수"]),
-                "총 하차 인원 (월합계)": int(station_totals["하차총승객수"]),
-                "승차 규모": 승차등급,
-                "하차 규모": 하차등급,
-            }
+                name: profiles.board_shape[cube.station_index(name)]
+                for name in compare_names
+            },
+            index=pd.Index(cube.days.astype(object), name="날짜"),
+        )
+        fig_profile = px.line(
+            profile_df.reset_index().melt(id_vars="날짜", var_name="역명", value_name="평소 대비 승차"),
+            x="날짜",
+            y="평소 대비 승차",
+            color="역명",
+        )
+        fig_profile.update_layout(
+            yaxis_title="평소(기간 평균) 대비 승차 비율",
+            margin=dict(l=40, r=20, t=20, b=40),
         )
+        st.plotly_chart(fig_profile, use_container_width=True)
+
+    with st.expander("🧩 역 유형(군집)별 역 수와 대표 역 보기"):
+        st.dataframe(profiles.cluster_table(), hide_index=True)
+
+    # ---------------------------
+    # 같은 호선 내에서 상/중/하 등급 계산
+    # ---------------------------
+    st.markdown("#### 📊 같은 호선 내에서 이 역의 규모 (상/중/하)")
+
+    # 호선 내 순위표는 데이터 로딩 시 한 번만 계산해 둔 것을 조회
+    grade_df = cube.station_rank(station_idx)
 
-    if not grade_rows:
+    if grade_df.empty:
         st.info("해당 역에 대한 호선별 비교 데이터를 계산할 수 없습니다.")
     else:
-        grade_df = pd.DataFrame(grade_rows)
         st.dataframe(grade_df)
 
+    # ---------------------------
+    # 호선 전체 역 순위표
+    # ---------------------------
+    st.markdown("#### 🏅 호선별 전체 역 순위표")
+
+    league_line = st.selectbox(
+        "순위표를 볼 호선",
+        options=available_lines,
+        index=available_lines.index(lines_for_station[0]),
+    )
+    st.dataframe(cube.line_league(cube.line_index(league_line)), hide_index=True)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,99 @@
+import pathlib
+import sys
+import streamlit as st
+import plotly.express as px
+
+# 상위 폴더의 subway_* 모듈 사용
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+import subway_anomaly  # noqa: E402
+import subway_store  # noqa: E402
+from subway_cache import load_anomalies  # noqa: E402
+
+
+# ---------------------------
+# 메인 앱
+# ---------------------------
+def main():
+    st.set_page_config(
+        page_title="지하철 이상 승하차 탐지",
+        layout="wide",
+    )
+
+    st.title("🚨 지하철 이상 승하차 탐지")
+    st.markdown(
+        """
+        모든 역 × 모든 날짜를 한 번에 훑어서 **평소와 다르게 많거나 적었던 날**을 찾아줍니다.  
+
+        - 기준선: 역마다 **평일 / 주말 / 공휴일** 별 중앙값  
+        - 점수: 중앙값에서 벗어난 정도를 MAD(중앙값 절대편차)로 나눈 **robust z 점수**  
+        - 행사·축제(급증)나 공사·폐쇄(급감) 같은 날을 찾는 데 사용할 수 있습니다.
+        """
+    )
+
+    # 데이터 로딩 (저장소 전체 기간)
+    subway_store.ensure_store()
+    data_range = subway_store.available_range()
+    if data_range is None:
+        st.error("지하철 데이터가 없습니다. subway.csv를 다시 확인해주세요.")
+        return
+    version = subway_store.store_version()
+
+    # ---------------------------
+    # 사이드바 필터 UI
+    # ---------------------------
+    st.sidebar.header("⚙️ 조건 선택")
+
+    metric_label = st.sidebar.radio("기준 지표", list(subway_anomaly.METRICS), index=0)
+    threshold = st.sidebar.slider("이상치 기준 |z| 점수", min_value=2.0, max_value=10.0, value=3.5, step=0.5)
+    top_n = st.sidebar.slider("히트맵에 표시할 역 수", min_value=10, max_value=100, value=30, step=10)
+
+    result = load_anomalies(*data_range, version, subway_anomaly.METRICS[metric_label])
+
+    st.sidebar.info(
+        f"데이터 기간: **{data_range[0]} ~ {data_range[1]}**\n\n"
+        f"역 수: **{len(result.stations):,}개**, 날짜 수: **{len(result.days):,}일**"
+    )
+
+    # ---------------------------
+    # 이상치 목록
+    # ---------------------------
+    st.subheader(f"📋 이상 승하차 목록 (|z| ≥ {threshold})")
+
+    anomalies = result.table(threshold=threshold, limit=500)
+    if anomalies.empty:
+        st.info("기준을 넘는 이상치가 없습니다. 기준 점수를 낮춰보세요.")
+    else:
+        c1, c2, c3 = st.columns(3)
+        c1.metric("이상 역-일 수", f"{len(anomalies):,}")
+        c2.metric("급증", f"{(anomalies['구분'] == '급증').sum():,}")
+        c3.metric("급감", f"{(anomalies['구분'] == '급감').sum():,}")
+        st.dataframe(anomalies, hide_index=True, use_container_width=True)
+
+    # ---------------------------
+    # 히트맵 (역 × 날짜)
+    # ---------------------------
+    st.subheader(f"🗺️ 이상치 히트맵 (|z| 최댓값 상위 {top_n}개 역)")
+
+    heat = result.heatmap(top_n=top_n)
+    if heat.empty:
+        st.info("표시할 데이터가 없습니다.")
+        return
+
+    limit = max(threshold * 2, 5.0)
+    fig = px.imshow(
+        heat.clip(-limit, limit),
+        color_continuous_scale="RdBu_r",
+        zmin=-limit,
+        zmax=limit,
+        aspect="auto",
+        labels=dict(x="날짜", y="역명", color="z 점수"),
+    )
+    fig.update_layout(
+        height=max(400, 22 * len(heat)),
+        margin=dict(l=40, r=20, t=20, b=40),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import pathlib
+import sys
+from datetime import timedelta
+
+import streamlit as st
+import plotly.express as px
+
+# 상위 폴더의 subway_* 모듈 사용
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+import korean_calendar  # noqa: E402
+import subway_hourly  # noqa: E402
+import subway_store  # noqa: E402
+from subway_cache import load_hourly  # noqa: E402
+
+
+# ---------------------------
+# 메인 앱
+# ---------------------------
+def main():
+    st.set_page_config(
+        page_title="지하철 시간대별 분석",
+        layout="wide",
+    )
+
+    st.title("⏰ 지하철 시간대별 승하차 분석")
+    st.markdown(
+        """
+        역 × 시간대 히트맵으로 **어느 역이 몇 시에 붐비는지** 한눈에 확인합니다.
+
+        - 평일 / 주말 / 공휴일을 나눠서 출퇴근 피크와 여가 시간대를 비교할 수 있습니다.
+        - **비율(%)** 로 보면 규모가 다른 역끼리도 하루 중 몰리는 시간대를 비교할 수 있습니다.
+        """
+    )
+
+    # 데이터 로딩 (시간대별 저장소)
+    subway_store.ensure_store()
+    data_range = subway_store.available_range(subway_store.HOURLY_STORE_DIR)
+    if data_range is None:
+        st.info(
+            "시간대별 데이터가 아직 없습니다. 시간대별 승하차 CSV를 아래처럼 적재한 뒤 새로고침해주세요.\n\n"
+            "`python subway_store.py 시간대별.csv`"
+        )
+        return
+    version = subway_store.store_version(subway_store.HOURLY_STORE_DIR)
+    cube = load_hourly(*data_range, version)
+
+    # ---------------------------
+    # 사이드바 필터 UI
+    # ---------------------------
+    st.sidebar.header("⚙️ 조건 선택")
+
+    first_day, last_day = cube.days[0].astype(object), cube.days[-1].astype(object)
+    default_start = max(first_day, last_day - timedelta(days=30))
+    period = st.sidebar.date_input(
+        "분석 기간",
+        value=(default_start, last_day),
+        min_value=first_day,
+        max_value=last_day,
+    )
+    if not isinstance(period, (list, tuple)) or len(period) != 2:
+        st.sidebar.warning("시작일과 종료일을 모두 선택해주세요.")
+        return
+
+    day_type_label = st.sidebar.selectbox("일유형", ["전체"] + korean_calendar.DAY_TYPES, index=0)
+    metric_label = st.sidebar.radio("지표", list(subway_hourly.METRICS), index=0)
+    scale = st.sidebar.radio("표시 방식", ["일평균 인원", "비율(%)"], index=0, horizontal=True)
+    top_n = st.sidebar.slider("히트맵에 표시할 역 수", min_value=10, max_value=100, value=30, step=10)
+
+    day_type = None if day_type_label == "전체" else korean_calendar.DAY_TYPES.index(day_type_label)
+    metric = subway_hourly.METRICS[metric_label]
+    lo, hi = cube.range_index(*period)
+
+    st.sidebar.info(
+        f"데이터 기간: **{data_range[0]} ~ {data_range[1]}**\n\n"
+        f"역 수: **{len(cube.stations):,}개**, 큐브 메모리: **{cube.nbytes / 1024 ** 2:,.1f} MB**"
+    )
+
+    if lo >= hi:
+        st.warning("선택한 기간에 데이터가 없습니다.")
+        return
+
+    # ---------------------------
+    # 역 × 시 히트맵
+    # ---------------------------
+    st.subheader(f"🗺️ 역 × 시간대 히트맵 ({period[0]} ~ {period[1]}, {day_type_label}, {metric_label})")
+
+    heat = cube.heatmap(lo, hi, metric, day_type, top_n=top_n, share=scale == "비율(%)")
+    if heat.empty:
+        st.info("선택한 조건에 맞는 날이 없습니다.")
+        return
+
+    fig = px.imshow(
+        heat,
+        color_continuous_scale="YlOrRd",
+        aspect="auto",
+        labels=dict(x="시간대", y="역명", color=scale),
+    )
+    fig.update_layout(
+        height=max(400, 22 * len(heat)),
+        margin=dict(l=40, r=20, t=20, b=40),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    # ---------------------------
+    # 역별 피크 시간대
+    # ---------------------------
+    st.subheader("📋 역별 피크 시간대")
+
+    peak = cube.peak_table(lo, hi, metric, day_type)
+    st.dataframe(peak, hide_index=True, use_container_width=True)
+
+    # ---------------------------
+    # 전체 역 합계: 날짜 × 시
+    # ---------------------------
+    st.subheader("📅 날짜 × 시간대 (전체 역 합계)")
+
+    network = cube.network_heatmap(lo, hi, metric)
+    fig_net = px.imshow(
+        network,
+        color_continuous_scale="YlOrRd",
+        aspect="auto",
+        labels=dict(x="시간대", y="날짜", color="인원"),
+    )
+    fig_net.update_layout(
+        height=max(400, min(14 * len(network), 1200)),
+        margin=dict(l=40, r=20, t=20, b=40),
+    )
+    st.plotly_chart(fig_net, use_container_width=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import pathlib
+import sys
+from datetime import datetime
+
+import streamlit as st
+import plotly.express as px
+
+# 상위 폴더의 subway_* 모듈 사용
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+import subway_live  # noqa: E402
+import subway_store  # noqa: E402
+from subway_cache import load_live_feed  # noqa: E402
+
+DEFAULT_FEED_FILE = subway_store.BASE_DIR / "subway_live.csv"
+DEFAULT_PORT = 9099
+
+
+# ---------------------------
+# 메인 앱
+# ---------------------------
+def main():
+    st.set_page_config(
+        page_title="지하철 실시간 집계",
+        layout="wide",
+    )
+
+    st.title("📡 지하철 승하차 실시간 집계")
+    st.markdown(
+        f"""
+        저장소 합계에서 시작해서 **새로 들어오는 행만** 누적합니다. 전체 CSV를 다시 읽지 않습니다.
+
+        - 파일: 첫 줄이 헤더({", ".join(subway_store.COLUMNS)})인 CSV에 행을 계속 추가
+        - 소켓: `127.0.0.1:<포트>` 로 접속해서 같은 순서의 CSV 줄을 전송
+        - 화면은 집계가 바뀌었을 때만 다시 그립니다.
+        """
+    )
+
+    subway_store.ensure_store()
+    data_range = subway_store.available_range()
+    if data_range is None:
+        st.error("지하철 데이터가 없습니다. subway.csv를 다시 확인해주세요.")
+        return
+    version = subway_store.store_version()
+
+    # ---------------------------
+    # 사이드바: 피드 설정
+    # ---------------------------
+    st.sidebar.header("⚙️ 피드 설정")
+
+    kind = st.sidebar.radio("입력 방식", ["파일", "소켓"], index=0, horizontal=True)
+    if kind == "파일":
+        target = st.sidebar.text_input("피드 CSV 경로", value=str(DEFAULT_FEED_FILE))
+    else:
+        target = str(st.sidebar.number_input("포트", min_value=1024, max_value=65535, value=DEFAULT_PORT))
+    interval = st.sidebar.slider("새 행 확인 간격(초)", min_value=1, max_value=30, value=3)
+
+    try:
+        feed = load_live_feed(*data_range, version, kind, target)
+    except OSError as e:
+        st.error(f"피드를 시작할 수 없습니다: {e}")
+        return
+
+    feed.drain()
+    aggregates = feed.aggregates
+    st.session_state["live_version"] = aggregates.version
+
+    # ---------------------------
+    # 변경 감시 (작은 조각만 주기적으로 실행)
+    # ---------------------------
+    @st.fragment(run_every=interval)
+    def watch():
+        feed.drain()
+        if aggregates.version != st.session_state.get("live_version"):
+            st.rerun(scope="app")
+        st.caption(
+            f"{feed.source} · 마지막 확인 {datetime.now():%H:%M:%S} · "
+            f"대기열 {feed.queue.qsize():,}/{subway_live.QUEUE_SIZE:,}행 · "
+            f"중복 건너뜀 {aggregates.n_duplicates:,}행 · 형식 오류 {feed.n_rejected:,}행"
+        )
+
+    watch()
+
+    # ---------------------------
+    # 요약
+    # ---------------------------
+    stations = aggregates.station_totals()
+    last_day = aggregates.last_day
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("누적 행 수", f"{aggregates.n_rows:,}")
+    c2.metric("마지막 일자", f"{last_day // 10000}-{last_day // 100 % 100:02d}-{last_day % 100:02d}" if last_day else "-")
+    c3.metric("역 수", f"{len(stations):,}")
+
+    # ---------------------------
+    # 일자별 전체 합계
+    # ---------------------------
+    st.subheader("📈 일자별 전체 승하차")
+
+    daily = aggregates.daily_totals()
+    fig = px.line(
+        daily,
+        x="날짜",
+        y=["승차총승객수", "하차총승객수"],
+        markers=True,
+        labels={"value": "인원", "variable": "구분"},
+    )
+    fig.update_layout(height=350, margin=dict(l=40, r=20, t=20, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+    # ---------------------------
+    # 역별 누적 / 일평균
+    # ---------------------------
+    st.subheader("🏙️ 역별 누적 합계와 일평균")
+    st.dataframe(stations, hide_index=True, use_container_width=True)
+
+    # ---------------------------
+    # 호선 내 순위
+    # ---------------------------
+    st.subheader("🏅 호선 내 순위")
+
+    line = st.selectbox("호선 선택", aggregates.lines)
+    st.dataframe(aggregates.line_ranking(line), hide_index=True, use_container_width=True)
+
+    # ---------------------------
+    # 월초 / 월중 / 월말 구간 평균 (누적 합계 / 구간 일수)
+    # ---------------------------
+    st.subheader("📆 월초·월중·월말 승·하차 평균")
+
+    if not stations.empty:
+        station = st.selectbox("역 선택", stations["역명"].tolist())
+        st.dataframe(aggregates.period_averages(station))
+
+
+if __name__ == "__main__":
+    main()
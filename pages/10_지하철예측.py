@@ -0,0 +1,112 @@
+import pathlib
+import sys
+
+import streamlit as st
+import plotly.graph_objects as go
+
+# 상위 폴더의 subway_* 모듈 사용
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+import subway_store  # noqa: E402
+from subway_cache import load_forecast, load_search_index  # noqa: E402
+
+
+# ---------------------------
+# 메인 앱
+# ---------------------------
+def main():
+    st.set_page_config(
+        page_title="지하철 승하차 예측",
+        layout="wide",
+    )
+
+    st.title("🔮 지하철 역별 승하차 예측")
+    st.markdown(
+        """
+        모든 역에 대해 **요일 효과 + 추세 + 공휴일 효과** 모델을 한 번에 적합해서
+        다음 날 / 향후 며칠의 승하차 인원을 예측합니다.
+
+        - 음영은 학습 기간 잔차 기준 **95% 예측 구간**입니다.
+        - 데이터 기간이 짧으면 추세가 과하게 반영될 수 있으니 학습 오차(MAPE)를 함께 확인하세요.
+        """
+    )
+
+    subway_store.ensure_store()
+    data_range = subway_store.available_range()
+    if data_range is None:
+        st.error("지하철 데이터가 없습니다. subway.csv를 다시 확인해주세요.")
+        return
+    version = subway_store.store_version()
+
+    # ---------------------------
+    # 사이드바 필터 UI
+    # ---------------------------
+    st.sidebar.header("⚙️ 조건 선택")
+    horizon = st.sidebar.slider("예측 기간(일)", min_value=1, max_value=14, value=7)
+
+    model = load_forecast(*data_range, version)
+    st.sidebar.info(
+        f"학습 기간: **{model.days[0]} ~ {model.days[-1]}**\n\n"
+        f"역 수: **{len(model.stations):,}개**"
+    )
+
+    # ---------------------------
+    # 모든 역 예측표
+    # ---------------------------
+    st.subheader(f"📋 모든 역 예측 (다음 날 / 향후 {horizon}일)")
+    st.dataframe(model.table(horizon), hide_index=True, use_container_width=True)
+
+    # ---------------------------
+    # 역별 예측 그래프
+    # ---------------------------
+    st.markdown("---")
+    st.subheader("🚉 역별 예측")
+
+    search_index = load_search_index(*data_range, version)
+    query = st.text_input("역 검색 (역명 일부 또는 초성, 예: 강남 · 이수 · ㄱㄴ)", value="")
+    station_list = search_index.search(query, limit=50) if query.strip() else list(model.stations)
+    if not station_list:
+        st.warning(f"'{query}' 에 해당하는 역이 없습니다.")
+        return
+
+    selected_station = st.selectbox(
+        "역을 선택하세요",
+        options=station_list,
+        index=0,
+        format_func=search_index.label,
+    )
+    station_idx = model.station_index(selected_station)
+
+    frame = model.station_frame(station_idx, horizon)
+    actual = frame[frame["구분"] == "실제"]
+    fitted = frame[frame["구분"] == "적합"]
+    forecast = frame[frame["구분"] == "예측"]
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=list(forecast["날짜"]) + list(forecast["날짜"])[::-1],
+            y=list(forecast["상한"]) + list(forecast["하한"])[::-1],
+            fill="toself",
+            fillcolor="rgba(239, 85, 59, 0.15)",
+            line=dict(width=0),
+            hoverinfo="skip",
+            name="95% 구간",
+        )
+    )
+    fig.add_trace(go.Scatter(x=actual["날짜"], y=actual["인원"], mode="lines+markers", name="실제"))
+    fig.add_trace(go.Scatter(x=fitted["날짜"], y=fitted["인원"], mode="lines", line=dict(dash="dot"), name="적합"))
+    fig.add_trace(go.Scatter(x=forecast["날짜"], y=forecast["인원"], mode="lines+markers", name="예측"))
+    fig.update_layout(
+        height=450,
+        xaxis_title="날짜",
+        yaxis_title="승하차 인원",
+        margin=dict(l=40, r=20, t=20, b=40),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander("📐 모델 계수 보기 (월요일·평일 기준 대비 효과)"):
+        st.dataframe(model.coef_table(station_idx), use_container_width=True)
+
+
+if __name__ == "__main__":
+    main()
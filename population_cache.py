@@ -0,0 +1,91 @@
+"""
+인구 데이터 Streamlit 캐시 로더 + 공용 위젯 (여러 페이지 공유)
+
+population*.csv 파일 목록과 수정 시각(population_data.file_version)을 키로 써서
+파일이 바뀌거나 새 달 파일이 추가될 때만 다시 만든다.
+"""
+import pathlib
+
+import streamlit as st
+
+import population_data
+import population_geo
+import population_indicators
+import population_regions
+
+
+@st.cache_resource(show_spinner="인구 데이터를 불러오는 중...")
+def _load_cube(version: tuple) -> population_data.PopulationCube:
+    tables = [population_data.PopulationTable(path) for path, _, _ in version]
+    return population_data.PopulationCube(tables)
+
+
+def data_version():
+    """현재 population*.csv 파일 버전 (다른 캐시의 키로 사용). 파일이 없으면 None"""
+    paths = population_data.find_csvs()
+    return population_data.file_version(paths) if paths else None
+
+
+def load_population_cube():
+    """[지역, 월, 성별, 나이] 인구 큐브 (파일이 없으면 None)"""
+    version = data_version()
+    return _load_cube(version) if version else None
+
+
+@st.cache_resource
+def _load_tree(version: tuple) -> population_regions.RegionTree:
+    return population_regions.RegionTree(_load_cube(version))
+
+
+def load_region_tree():
+    """시도 → 시군구 → 읍면동 트리 (하위 합계 포함). 파일이 없으면 None"""
+    version = data_version()
+    return _load_tree(version) if version else None
+
+
+@st.cache_resource
+def _load_geometry(version: tuple) -> population_geo.DistrictGeometry:
+    return population_geo.DistrictGeometry({name: pathlib.Path(path) for name, path, _ in version})
+
+
+def load_district_geometry():
+    """
+    행정구역 경계 (population_geo). 정밀도 단계별로 미리 만든 GeoJSON 을 파일 버전당 한 번 읽어 둠
+    (지표를 바꿔도 다시 만들지 않음). 경계 파일이 없으면 None
+    """
+    files = population_geo.find_geojson()
+    return _load_geometry(population_geo.file_version(files)) if files else None
+
+
+def region_picker(tree: population_regions.RegionTree, key: str = "region", container=None) -> int:
+    """
+    시도 → 시군구 → 읍면동 단계별 선택 상자. 선택한 트리 노드 번호를 반환.
+    단계마다 그 노드의 자식 목록만 보여주므로 읍면동 전체 파일도 목록이 짧게 유지됨.
+    """
+    cols = (container or st).columns(3)
+    node = cols[0].selectbox("시도", list(tree.roots), format_func=tree.short_name, key=f"{key}_level_0")
+    level = 1
+    while len(tree.children(node)) and level < len(cols):
+        options = [node] + list(tree.children(node))
+        choice = cols[level].selectbox(
+            tree.child_level_name(node),
+            options,
+            format_func=lambda i, parent=node: "전체" if i == parent else tree.short_name(i),
+            key=f"{key}_level_{level}",
+        )
+        if choice == node:
+            break
+        node = choice
+        level += 1
+    return int(node)
+
+
+@st.cache_resource(show_spinner="지역별 지표를 계산하는 중...")
+def _load_indicators(version: tuple):
+    return population_indicators.indicator_table(_load_tree(version), _load_cube(version))
+
+
+def load_indicators():
+    """모든 지역 × 기준월 인구 지표 표 (population_indicators). 파일이 없으면 None"""
+    version = data_version()
+    return _load_indicators(version) if version else None
@@ -0,0 +1,348 @@
+"""
+연령별 인구 CSV 로더 (행정안전부 주민등록 인구통계 형식)
+
+- 인코딩은 파일 앞부분 바이트로 한 번만 판별 (cp949 → utf-8-sig → utf-8 → euc-kr)
+- "9,313,532" 같은 쉼표 숫자는 pandas C 파서(thousands=",")로 한 번에 정수 변환
+- 숫자 컬럼 전체를 [행정구역, 컬럼] int32 행렬 하나로 보관하고,
+  화면에서는 행/열 번호로 슬라이스만 한다 (문자열 재파싱 없음)
+- 컬럼 이름 해석(ColumnSchema)은 파일 버전당 한 번만 하고, 여러 달 파일을
+  [지역, 월, 성별, 나이] 한 배열(PopulationCube)로 합친다.
+"""
+import codecs
+import pathlib
+import re
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = pathlib.Path(__file__).resolve().parent
+
+# population.csv 를 찾는 순서 (앱 루트, pages/, 업로드 환경, 실행 위치)
+CSV_CANDIDATES = [
+    BASE_DIR / "population.csv",
+    BASE_DIR / "pages" / "population.csv",
+    BASE_DIR / "data" / "population.csv",
+    pathlib.Path("/mnt/data/population.csv"),
+    pathlib.Path("population.csv").resolve(),
+]
+
+ENCODINGS = ["cp949", "utf-8-sig", "utf-8", "euc-kr"]
+REGION_COL = "행정구역"
+SNIFF_BYTES = 1 << 16
+
+SEXES = ["계", "남", "여"]
+
+# 컬럼 이름: "<YYYY>년<M>월_<계|남|여>_<항목>" (항목 = N세, N세 이상, 총인구수, 연령구간인구수)
+_COLUMN = re.compile(r"^(\d{4})년(\d{1,2})월_(계|남|여)_(.+)$")
+_AGE = re.compile(r"^(\d+)세( 이상)?$")
+# 행정구역 라벨: "서울특별시 종로구 (1111000000)"
+_REGION = re.compile(r"^(.*?)\s*\((\d+)\)$")
+
+
+def find_csv(candidates=CSV_CANDIDATES):
+    """처음으로 존재하는 population.csv 경로 (없으면 None)"""
+    for p in candidates:
+        if pathlib.Path(p).exists():
+            return pathlib.Path(p)
+    return None
+
+
+def find_csvs(candidates=CSV_CANDIDATES) -> list:
+    """
+    population.csv 와 같은 폴더의 population*.csv 전체 (여러 달 스냅샷을 함께 읽을 때).
+    예: population.csv, population_202509.csv, ...
+    """
+    first = find_csv(candidates)
+    if first is None:
+        return []
+    return sorted(first.parent.glob("population*.csv"))
+
+
+def file_version(paths: list) -> tuple:
+    """캐시 키: (경로, 크기, 수정 시각) 목록 → 파일이 추가/변경되면 바뀜"""
+    return tuple((str(p), p.stat().st_size, p.stat().st_mtime_ns) for p in paths)
+
+
+def sniff_encoding(path) -> str:
+    """파일 앞부분만 읽어서 디코딩되는 첫 인코딩을 반환"""
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    for enc in ENCODINGS:
+        try:
+            # 점진 디코더: 앞부분만 읽어서 잘린 마지막 글자는 오류로 보지 않음
+            codecs.getincrementaldecoder(enc)().decode(head, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"{path} 파일의 인코딩을 확인할 수 없습니다.")
+
+
+class PopulationTable:
+    def __init__(self, path):
+        """
+        path: population.csv 경로
+        첫 번째 문자열 컬럼(보통 '행정구역')을 지역 라벨로, 나머지 숫자 컬럼을 int32 행렬로 보관
+        """
+        self.path = pathlib.Path(path)
+        self.encoding = sniff_encoding(self.path)
+
+        df = pd.read_csv(self.path, encoding=self.encoding, thousands=",")
+        df.columns = [str(c).strip() for c in df.columns]
+
+        self.region_col = REGION_COL if REGION_COL in df.columns else df.columns[0]
+        numeric = df.drop(columns=[self.region_col]).apply(pd.to_numeric, errors="coerce")
+
+        self.regions = df[self.region_col].astype(str).str.strip().to_numpy(dtype=object)
+        self.columns = list(numeric.columns)
+        self.values = numeric.fillna(0).to_numpy(dtype=np.int32)  # [지역, 컬럼]
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.regions.nbytes
+
+
+def parse_region(label: str) -> tuple:
+    """'서울특별시 종로구 (1111000000)' → ('서울특별시 종로구', 1111000000). 코드가 없으면 -1"""
+    m = _REGION.match(str(label).strip())
+    if not m:
+        return " ".join(str(label).split()), -1
+    return " ".join(m.group(1).split()), int(m.group(2))
+
+
+def month_label(ym: int) -> str:
+    return f"{ym // 100}년{ym % 100:02d}월"
+
+
+class ColumnSchema:
+    def __init__(self, columns: list):
+        """
+        컬럼 이름 목록을 한 번 해석해서 (월, 성별, 나이) 좌표로 바꿔 둠.
+        - age_*   : 연령 컬럼 (컬럼 번호, 월 번호, 성별 번호, 나이)
+        - total_* : 총인구수 컬럼 (컬럼 번호, 월 번호, 성별 번호)
+        나머지 컬럼(연령구간인구수 등)은 무시
+        """
+        age, total = [], []
+        months = set()
+        for j, name in enumerate(columns):
+            m = _COLUMN.match(str(name))
+            if not m:
+                continue
+            ym = int(m.group(1)) * 100 + int(m.group(2))
+            sex = SEXES.index(m.group(3))
+            field = m.group(4).strip()
+            a = _AGE.match(field)
+            if a:
+                age.append((j, ym, sex, int(a.group(1))))
+                months.add(ym)
+            elif field == "총인구수":
+                total.append((j, ym, sex))
+                months.add(ym)
+
+        self.months = sorted(months)
+        month_pos = {ym: i for i, ym in enumerate(self.months)}
+        self.max_age = max((a for _, _, _, a in age), default=-1)
+        # 마지막 나이 컬럼이 'N세 이상' 인지
+        self.open_ended = any(
+            str(columns[j]).endswith("이상") for j, _, _, a in age if a == self.max_age
+        )
+
+        age = np.array(age, dtype=np.int64).reshape(-1, 4)
+        total = np.array(total, dtype=np.int64).reshape(-1, 3)
+        self.age_col, self.age_sex, self.age = age[:, 0], age[:, 2], age[:, 3]
+        self.age_month = np.array([month_pos[ym] for ym in age[:, 1]], dtype=np.int64)
+        self.total_col, self.total_sex = total[:, 0], total[:, 2]
+        self.total_month = np.array([month_pos[ym] for ym in total[:, 1]], dtype=np.int64)
+
+    def __bool__(self) -> bool:
+        return len(self.age_col) > 0
+
+
+class PopulationCube:
+    def __init__(self, tables: list):
+        """
+        tables: PopulationTable 목록 (월이 다른 파일 여러 개를 함께 넣을 수 있음)
+        지역은 행정구역 코드로 맞춰 합치고(코드가 없으면 이름), 처음 나온 순서를 유지.
+        - values  : [지역, 월, 성별, 나이] int32 (나이 마지막 칸은 보통 '100세 이상')
+        - totals  : [지역, 월, 성별] int32 (총인구수 컬럼, 없으면 연령 합계)
+        - present : [지역, 월] 그 달 파일에 지역 행이 있었는지
+        """
+        schemas = [ColumnSchema(t.columns) for t in tables]
+        if not any(schemas):
+            raise ValueError("연령별 인구 컬럼(예: 2025년10월_계_0세)을 찾지 못했습니다.")
+
+        # 지역 사전 (코드 → 위치)
+        keys, labels, names, codes = {}, [], [], []
+        table_rows = []
+        for table in tables:
+            rows = []
+            for label in table.regions:
+                name, code = parse_region(label)
+                key = code if code >= 0 else name
+                if key not in keys:
+                    keys[key] = len(labels)
+                    labels.append(str(label).strip())
+                    names.append(name)
+                    codes.append(code)
+                rows.append(keys[key])
+            table_rows.append(np.array(rows, dtype=np.int64))
+
+        self.labels = np.array(labels, dtype=object)
+        self.names = np.array(names, dtype=object)
+        self.codes = np.array(codes, dtype=np.int64)
+        self.months = sorted({ym for schema in schemas for ym in schema.months})
+        self.month_labels = [month_label(ym) for ym in self.months]
+        self.sexes = list(SEXES)
+        n_ages = max(schema.max_age for schema in schemas) + 1
+        self.ages = np.arange(n_ages)
+        open_ended = any(schema.open_ended for schema in schemas)
+        self.age_labels = [f"{a}세" for a in self.ages]
+        if open_ended:
+            self.age_labels[-1] = f"{self.ages[-1]}세 이상"
+
+        shape = (len(labels), len(self.months), len(SEXES), n_ages)
+        self.values = np.zeros(shape, dtype=np.int32)
+        self.totals = np.zeros(shape[:3], dtype=np.int32)
+        self.present = np.zeros(shape[:2], dtype=bool)
+        has_total = np.zeros(shape[:3], dtype=bool)
+
+        month_pos = {ym: i for i, ym in enumerate(self.months)}
+        for table, schema, rows in zip(tables, schemas, table_rows):
+            if not schema:
+                continue
+            to_cube = np.array([month_pos[ym] for ym in schema.months], dtype=np.int64)
+            r = rows[:, None]
+            self.values[r, to_cube[schema.age_month], schema.age_sex, schema.age] = table.values[:, schema.age_col]
+            self.totals[r, to_cube[schema.total_month], schema.total_sex] = table.values[:, schema.total_col]
+            has_total[r, to_cube[schema.total_month], schema.total_sex] = True
+            self.present[r, to_cube] = True
+
+        # 총인구수 컬럼이 없는 칸은 연령 합계로 채움
+        age_sum = self.values.sum(axis=-1, dtype=np.int64).astype(np.int32)
+        self.totals = np.where(has_total, self.totals, age_sum)
+
+        # 나이 방향 누적합 (맨 앞 0칸): 연령대 합계 = cum[hi + 1] - cum[lo]
+        self.age_cum = np.zeros(shape[:3] + (n_ages + 1,), dtype=np.int64)
+        np.cumsum(self.values, axis=-1, out=self.age_cum[..., 1:])
+
+        self._label_index = {label: i for i, label in enumerate(self.labels)}
+        self._code_index = {int(c): i for i, c in enumerate(self.codes) if c >= 0}
+
+    # ---------------------------
+    # 기본 정보
+    # ---------------------------
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.totals.nbytes + self.present.nbytes + self.age_cum.nbytes
+
+    def region_index(self, label: str):
+        return self._label_index.get(label)
+
+    def code_index(self, code: int):
+        return self._code_index.get(int(code))
+
+    def month_index(self, label: str) -> int:
+        return self.month_labels.index(label)
+
+    def sex_index(self, sex: str) -> int:
+        return self.sexes.index(sex)
+
+    # ---------------------------
+    # 조회
+    # ---------------------------
+    def age_series(self, region: int, month: int = -1, sex: int = 0) -> np.ndarray:
+        """한 지역 × 월 × 성별의 나이별 인구 (배열 슬라이스, 복사 없음)"""
+        return self.values[region, month, sex]
+
+    def _positions(self, regions=None, months=None, sexes=None, ages=None) -> list:
+        """축별 위치 목록 (None 이면 전체)"""
+        return [
+            np.arange(n) if sel is None else np.asarray(sel, dtype=np.int64)
+            for sel, n in zip((regions, months, sexes, ages), self.values.shape)
+        ]
+
+    def select(self, regions=None, months=None, sexes=None, ages=None) -> np.ndarray:
+        """위치 목록으로 [지역, 월, 성별, 나이] 부분 배열을 꺼냄 (None 이면 전체)"""
+        return self.values[np.ix_(*self._positions(regions, months, sexes, ages))]
+
+    def band_sums(self, bands: list, regions=None, months=None, sexes=None) -> np.ndarray:
+        """
+        연령대별 합계 [지역, 월, 성별, 연령대].
+        bands: [(시작 나이, 끝 나이), ...] 양끝 포함, 끝 나이 None 이면 마지막 나이까지.
+        누적합 두 번 조회로 계산하므로 연령대 수·지역 수와 상관없이 한 번의 배열 연산.
+        """
+        last = len(self.ages) - 1
+        lo = np.array([min(a, last + 1) for a, _ in bands], dtype=np.int64)
+        hi = np.array([last if b is None else min(b, last) for _, b in bands], dtype=np.int64)
+        hi = np.maximum(hi, lo - 1)  # 빈 구간은 0
+        r, m, s = self._positions(regions, months, sexes)[:3]
+        cum = self.age_cum[np.ix_(r, m, s)]
+        return cum[..., hi + 1] - cum[..., lo]
+
+    def tidy(self, regions=None, months=None, sexes=None, ages=None) -> pd.DataFrame:
+        """
+        긴 형식 표: 행정구역 / 코드 / 기준월 / 성별 / 연령 / 인구수.
+        문자열 컬럼은 category(사전 인코딩)로, 값은 int32 그대로.
+        """
+        index = self._positions(regions, months, sexes, ages)
+        block = self.values[np.ix_(*index)]
+        r, m, s, a = (np.asarray(g).ravel() for g in np.indices(block.shape))
+
+        def category(labels, positions, codes):
+            return pd.Categorical.from_codes(codes, categories=pd.Index(np.asarray(labels, dtype=object)[positions]))
+
+        return pd.DataFrame(
+            {
+                "행정구역": category(self.labels, index[0], r),
+                "코드": self.codes[index[0]][r],
+                "기준월": category(self.month_labels, index[1], m),
+                "성별": category(self.sexes, index[2], s),
+                "연령": self.ages[index[3]][a].astype(np.int16),
+                "인구수": block.ravel(),
+            }
+        )
+
+
+# ---------------------------
+# 연령대 정의
+# ---------------------------
+def parse_bands(text: str) -> list:
+    """
+    '0-6, 7-12, 13-64, 65+' → [(0, 6), (7, 12), (13, 64), (65, None)]
+    구분자는 쉼표(쉼표가 없으면 공백), 범위는 - 또는 ~, 'N+' 또는 'N세 이상' 은 N세 이상.
+    형식이 틀리면 ValueError
+    """
+    bands = []
+    tokens = text.split(",") if "," in text else text.split()
+    for token in (t.strip() for t in tokens):
+        if not token:
+            continue
+        m = re.fullmatch(r"(\d+)\s*(?:\+|세?\s*이상)", token)
+        if m:
+            bands.append((int(m.group(1)), None))
+            continue
+        m = re.fullmatch(r"(\d+)세?\s*[-~]\s*(\d+)세?", token)
+        if m and int(m.group(1)) <= int(m.group(2)):
+            bands.append((int(m.group(1)), int(m.group(2))))
+            continue
+        m = re.fullmatch(r"(\d+)세?", token)
+        if m:
+            bands.append((int(m.group(1)), int(m.group(1))))
+            continue
+        raise ValueError(f"연령대 형식을 이해할 수 없습니다: '{token}' (예: 0-6, 7-12, 65+)")
+    if not bands:
+        raise ValueError("연령대를 하나 이상 입력해주세요. (예: 0-6, 7-12, 65+)")
+    return bands
+
+
+def cohort_bands(width: int, max_age: int, open_from: int = None) -> list:
+    """width 세 단위 연령대 (마지막은 open_from 세 이상, 기본 = max_age)"""
+    open_from = max_age if open_from is None else open_from
+    bands = [(a, min(a + width - 1, open_from - 1)) for a in range(0, open_from, width)]
+    return bands + [(open_from, None)]
+
+
+def band_label(band: tuple) -> str:
+    lo, hi = band
+    if hi is None:
+        return f"{lo}세 이상"
+    return f"{lo}세" if lo == hi else f"{lo}~{hi}세"
@@ -0,0 +1,150 @@
+"""
+인구 큐브 대량 내보내기 (Parquet / CSV 묶음 zip)
+
+원하는 지역 · 기준월 · 성별 · 연령(1세 또는 연령대) 조합을 긴 형식 표로 내보낸다.
+전체를 한 번에 DataFrame/문자열로 만들지 않고, 기준월마다 지역을 CHUNK_REGIONS 개씩
+잘라 만든 작은 표를 바로 파일에 이어 쓴다.
+
+    Parquet : 조각마다 row group 하나 (pyarrow.parquet.ParquetWriter)
+    CSV zip : 기준월마다 CSV 하나 (population_<기준월>.csv, utf-8-sig), zip 안에 이어 쓰기
+
+페이지에서는 디스크 임시 파일에 쓴 뒤 읽기 전용 파일 객체로 넘기고,
+터미널에서는 파일로 바로 쓴다.
+
+사용법 (터미널):
+    python population_export.py 출력.parquet [--months 2025년10월 ...] [--bands "0-14, 15-64, 65+"]
+    python population_export.py 출력.zip --sexes 남 여
+"""
+import argparse
+import io
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+import population_data
+
+CHUNK_REGIONS = 500
+FORMATS = {"parquet": ("Parquet", ".parquet", "application/octet-stream"), "zip": ("CSV 묶음 (zip)", ".zip", "application/zip")}
+
+
+def _chunk_frame(cube, regions, month, sexes, bands) -> pd.DataFrame:
+    """지역 묶음 × 기준월 하나 × 성별들 긴 형식 표 (연령대가 있으면 연령 대신 연령대)"""
+    if bands is None:
+        return cube.tidy(regions=regions, months=[month], sexes=sexes)
+
+    block = cube.band_sums(bands, regions, [month], sexes)[:, 0]          # [지역, 성별, 연령대]
+    r, s, b = (g.ravel() for g in np.indices(block.shape))
+    regions, sexes = np.asarray(regions), np.asarray(sexes)
+    return pd.DataFrame(
+        {
+            "행정구역": pd.Categorical.from_codes(r, categories=pd.Index(np.asarray(cube.labels, dtype=object)[regions])),
+            "코드": cube.codes[regions][r],
+            "기준월": pd.Categorical.from_codes(np.zeros_like(r), categories=[cube.month_labels[month]]),
+            "성별": pd.Categorical.from_codes(s, categories=pd.Index(np.asarray(cube.sexes, dtype=object)[sexes])),
+            "연령대": pd.Categorical.from_codes(b, categories=[population_data.band_label(x) for x in bands]),
+            "인구수": block.ravel(),
+        }
+    )
+
+
+def iter_chunks(cube, regions=None, months=None, sexes=None, bands=None, chunk_regions: int = CHUNK_REGIONS):
+    """(기준월 번호, 긴 형식 조각 표) 를 차례로 내줌. None 이면 그 축 전체"""
+    regions, months, sexes = cube._positions(regions, months, sexes)[:3]
+    for month in months:
+        for start in range(0, len(regions), chunk_regions):
+            yield int(month), _chunk_frame(cube, regions[start:start + chunk_regions], month, sexes, bands)
+
+
+def write_parquet(target, cube, regions=None, months=None, sexes=None, bands=None) -> int:
+    """조각마다 row group 하나로 Parquet 작성. 쓴 행 수 반환"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    text = pa.dictionary(pa.int32(), pa.string())
+    schema = pa.schema([
+        ("행정구역", text),
+        ("코드", pa.int64()),
+        ("기준월", text),
+        ("성별", text),
+        ("연령", pa.int16()) if bands is None else ("연령대", text),
+        ("인구수", pa.int64() if bands is not None else pa.int32()),
+    ])
+    n_rows = 0
+    with pq.ParquetWriter(target, schema, compression="zstd") as writer:
+        for _, frame in iter_chunks(cube, regions, months, sexes, bands):
+            writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+            n_rows += len(frame)
+    return n_rows
+
+
+def write_csv_zip(target, cube, regions=None, months=None, sexes=None, bands=None) -> int:
+    """기준월마다 CSV 파일 하나를 zip 안에 조각 단위로 이어 씀. 쓴 행 수 반환"""
+    n_rows = 0
+    current, text = None, None
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for month, frame in iter_chunks(cube, regions, months, sexes, bands):
+            if month != current:
+                if text is not None:
+                    text.close()
+                current = month
+                member = archive.open(f"population_{cube.month_labels[month]}.csv", "w", force_zip64=True)
+                text = io.TextIOWrapper(member, encoding="utf-8-sig", newline="")
+                frame.to_csv(text, index=False)
+            else:
+                frame.to_csv(text, index=False, header=False)
+            n_rows += len(frame)
+        if text is not None:
+            text.close()
+    return n_rows
+
+
+def export(fmt: str, target, cube, **selection) -> int:
+    """fmt: 'parquet' 또는 'zip'. target: 경로 또는 바이너리 파일 객체"""
+    if fmt == "parquet":
+        return write_parquet(target, cube, **selection)
+    if fmt == "zip":
+        return write_csv_zip(target, cube, **selection)
+    raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+
+def export_to_tempfile(fmt: str, cube, **selection) -> io.BufferedReader:
+    """
+    디스크 임시 파일에 조각 단위로 내보낸 뒤 읽기 전용으로 다시 연 파일 객체를 반환
+    (st.download_button 이 받는 BufferedReader). 결과 전체를 메모리에 만들지 않음.
+    경로는 바로 지우므로(POSIX) 파일 객체가 닫히면 디스크 공간도 반환됨
+    """
+    with tempfile.NamedTemporaryFile(suffix=FORMATS[fmt][1], delete=False) as out:
+        export(fmt, out, cube, **selection)
+    reader = open(out.name, "rb")
+    try:
+        os.unlink(out.name)
+    except OSError:
+        pass  # 열린 파일을 지울 수 없는 OS 에서는 임시 폴더에 남김
+    return reader
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인구 큐브를 Parquet 또는 CSV zip 으로 내보내기")
+    parser.add_argument("output", help="출력 파일 (.parquet 또는 .zip)")
+    parser.add_argument("--months", nargs="*", help="기준월 (예: 2025년10월, 기본: 전체)")
+    parser.add_argument("--sexes", nargs="*", help="성별 (계/남/여, 기본: 전체)")
+    parser.add_argument("--bands", help="연령대 (예: '0-14, 15-64, 65+', 기본: 1세 단위)")
+    args = parser.parse_args()
+
+    fmt = "zip" if args.output.endswith(".zip") else "parquet"
+    tables = [population_data.PopulationTable(p) for p in population_data.find_csvs()]
+    cube = population_data.PopulationCube(tables)
+    selection = {
+        "months": None if not args.months else [cube.month_index(m) for m in args.months],
+        "sexes": None if not args.sexes else [cube.sex_index(s) for s in args.sexes],
+        "bands": None if not args.bands else population_data.parse_bands(args.bands),
+    }
+    n_rows = export(fmt, args.output, cube, **selection)
+    print(f"{args.output}: {n_rows:,}행")
+
+
+if __name__ == "__main__":
+    main()
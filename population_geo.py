@@ -0,0 +1,234 @@
+"""
+행정구역 경계(GeoJSON) 로딩 · 코드 연결 (인구 지도용)
+
+- 경계 파일은 앱 폴더에서 찾음. 실제 경계(seoul_districts*.geojson)가 있으면 그것을,
+  없으면 함께 배포되는 서울 25개 구 타일 지도(seoul_district_tiles.geojson, 도식)를 사용
+- 정밀도 단계별 파일은 미리 만들어 둔다 (앱 실행 중에는 단순화하지 않음):
+
+      seoul_districts.fine.geojson / .medium.geojson / .coarse.geojson
+
+  단계별 파일이 없으면 <이름>.geojson 하나를 단일 단계로 사용.
+  함께 배포되는 타일 지도는 꼭짓점 4개짜리 사각형이라 단순화해도 같은 파일이 되므로
+  단계별 파일 없이 seoul_district_tiles.geojson 하나만 둔다 (실제 경계를 넣을 때 단계별로 생성)
+- 피처의 행정기관코드는 10자리 정수 'code' 속성 하나로 통일되어 있어야 함
+  (예: SIG_CD 11110 → 1111000000). 인구 표의 '행정구역 (코드)' 와 같은 값으로 연결
+
+원본 경계에서 단계별 파일 만들기 (터미널, 한 번만):
+    python population_geo.py 원본.geojson [--out seoul_districts]
+"""
+import argparse
+import json
+import pathlib
+
+import numpy as np
+
+BASE_DIR = pathlib.Path(__file__).resolve().parent
+
+# 경계 파일 이름 (확장자 제외), 앞에서부터 처음 찾은 것을 사용
+GEOJSON_CANDIDATES = [
+    BASE_DIR / "seoul_districts",
+    BASE_DIR / "data" / "seoul_districts",
+    BASE_DIR / "seoul_district_tiles",
+]
+
+# 단계 이름: (파일 접미사, 단순화 허용 오차(도), 좌표 소수 자릿수) — 오프라인 생성용
+GEOMETRY_LEVELS = {
+    "상세": ("fine", 0.0, 6),
+    "보통": ("medium", 0.0003, 5),
+    "간략": ("coarse", 0.0015, 4),
+}
+SINGLE_LEVEL = "기본"
+
+CODE_PROPERTIES = ["code", "adm_cd", "ADM_CD", "adm_cd2", "SIG_CD", "sig_cd", "EMD_CD", "emd_cd"]
+NAME_PROPERTIES = ["name", "adm_nm", "ADM_NM", "SIG_KOR_NM", "sig_kor_nm", "EMD_KOR_NM"]
+
+
+def level_files(stem: pathlib.Path) -> dict:
+    """{단계 이름: 파일 경로}. 단계별 파일이 없으면 <stem>.geojson 하나를 SINGLE_LEVEL 로"""
+    found = {
+        name: stem.with_name(f"{stem.name}.{suffix}.geojson")
+        for name, (suffix, _, _) in GEOMETRY_LEVELS.items()
+        if stem.with_name(f"{stem.name}.{suffix}.geojson").exists()
+    }
+    if not found and stem.with_suffix(".geojson").exists():
+        found[SINGLE_LEVEL] = stem.with_suffix(".geojson")
+    return found
+
+
+def find_geojson(candidates=GEOJSON_CANDIDATES) -> dict:
+    """처음으로 존재하는 경계 파일들의 {단계 이름: 경로} (없으면 빈 사전)"""
+    for stem in candidates:
+        found = level_files(stem)
+        if found:
+            return found
+    return {}
+
+
+def file_version(files: dict) -> tuple:
+    """캐시 키용 (단계, 경로, 수정 시각) 목록"""
+    return tuple((name, str(path), path.stat().st_mtime_ns) for name, path in files.items())
+
+
+def normalize_code(value) -> int:
+    """행정기관코드를 10자리 정수로 (5자리 시군구 코드 등은 뒤를 0으로 채움). 실패하면 -1"""
+    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    if not digits or len(digits) > 10:
+        return -1
+    return int(digits.ljust(10, "0"))
+
+
+def _first_property(props: dict, names: list):
+    for name in names:
+        if props.get(name) not in (None, ""):
+            return props[name]
+    return None
+
+
+# ---------------------------
+# 단순화
+# ---------------------------
+def simplify_ring(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Douglas-Peucker 로 닫힌 고리 단순화 (처음/끝 점 유지, 최소 4점)"""
+    n = len(points)
+    if tolerance <= 0 or n <= 4:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    # 닫힌 고리는 시작점과 가장 먼 점으로 나눠서 두 구간을 처리
+    far = int(np.argmax(((points - points[0]) ** 2).sum(axis=1)))
+    keep[far] = True
+    stack = [(0, far), (far, n - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+        a, b = points[lo], points[hi]
+        seg = points[lo + 1:hi]
+        ab = b - a
+        length = np.hypot(*ab)
+        if length == 0:
+            dist = np.hypot(*(seg - a).T)
+        else:
+            dist = np.abs(ab[0] * (seg[:, 1] - a[1]) - ab[1] * (seg[:, 0] - a[0])) / length
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = lo + 1 + i
+            keep[mid] = True
+            stack.extend([(lo, mid), (mid, hi)])
+    out = points[keep]
+    return out if len(out) >= 4 else points
+
+
+def _map_polygons(geometry: dict, func) -> dict:
+    """Polygon / MultiPolygon 의 각 고리에 func 적용"""
+    if geometry["type"] == "Polygon":
+        coords = [func(ring) for ring in geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        coords = [[func(ring) for ring in poly] for poly in geometry["coordinates"]]
+    else:
+        raise ValueError(f"지원하지 않는 도형 종류: {geometry['type']}")
+    return {"type": geometry["type"], "coordinates": coords}
+
+
+def count_points(geojson: dict) -> int:
+    total = 0
+    for feature in geojson["features"]:
+        geometry = feature["geometry"]
+        polys = [geometry["coordinates"]] if geometry["type"] == "Polygon" else geometry["coordinates"]
+        total += sum(len(ring) for poly in polys for ring in poly)
+    return total
+
+
+# ---------------------------
+# 경계 데이터 (앱에서 사용, 미리 만든 파일을 그대로 읽음)
+# ---------------------------
+class DistrictGeometry:
+    def __init__(self, files: dict):
+        """files: {단계 이름: GeoJSON 경로} (find_geojson). 피처마다 'code'(10자리), 'name' 속성"""
+        self.files = dict(files)
+        self.levels = {}
+        for name, path in self.files.items():
+            with open(path, encoding="utf-8") as f:
+                self.levels[name] = json.load(f)
+
+        for name, geojson in self.levels.items():
+            if not all("code" in (f.get("properties") or {}) for f in geojson["features"]):
+                raise ValueError(
+                    f"{self.files[name]} 에 10자리 'code' 속성이 없습니다. "
+                    "python population_geo.py 로 단계별 파일을 만들어 주세요."
+                )
+        first = next(iter(self.levels.values()))
+        self.schematic = bool(first.get("properties", {}).get("schematic", False))
+        self.codes = np.array([f["properties"]["code"] for f in first["features"]], dtype=np.int64)
+        self.names = [f["properties"]["name"] for f in first["features"]]
+        for name, geojson in self.levels.items():
+            codes = [f["properties"]["code"] for f in geojson["features"]]
+            if codes != self.codes.tolist():
+                raise ValueError(f"{self.files[name]} 의 피처 순서/코드가 다른 단계와 다릅니다.")
+
+    @property
+    def path(self) -> pathlib.Path:
+        return next(iter(self.files.values()))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def geojson(self, level: str) -> dict:
+        """단계별 FeatureCollection (미리 단순화된 파일 그대로)"""
+        return self.levels[level]
+
+
+# ---------------------------
+# 단계별 파일 만들기 (오프라인)
+# ---------------------------
+def normalize_features(raw: dict) -> list:
+    """원본 피처 → 'code'(10자리) / 'name' 속성만 남긴 피처 목록 (코드 없는 피처는 제외)"""
+    features = []
+    for feature in raw["features"]:
+        props = feature.get("properties") or {}
+        code = normalize_code(_first_property(props, CODE_PROPERTIES))
+        if code < 0 or feature.get("geometry") is None:
+            continue
+        name = _first_property(props, NAME_PROPERTIES) or str(code)
+        features.append({
+            "type": "Feature",
+            "properties": {"code": code, "name": str(name)},
+            "geometry": feature["geometry"],
+        })
+    return sorted(features, key=lambda f: f["properties"]["code"])
+
+
+def simplified(features: list, tolerance: float, digits: int, properties: dict = None) -> dict:
+    """허용 오차로 단순화하고 좌표 자릿수를 줄인 FeatureCollection"""
+
+    def ring(coords):
+        points = simplify_ring(np.asarray(coords, dtype=np.float64)[:, :2], tolerance)
+        return np.round(points, digits).tolist()
+
+    out = [dict(f, geometry=_map_polygons(f["geometry"], ring)) for f in features]
+    collection = {"type": "FeatureCollection", "features": out}
+    if properties:
+        collection["properties"] = properties
+    return collection
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원본 경계 GeoJSON에서 정밀도 단계별 파일 만들기")
+    parser.add_argument("source", help="원본 GeoJSON (행정기관코드 속성 포함)")
+    parser.add_argument("--out", default=str(GEOJSON_CANDIDATES[0]), help="출력 이름 (확장자 제외)")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as f:
+        raw = json.load(f)
+    features = normalize_features(raw)
+    stem = pathlib.Path(args.out)
+    for name, (suffix, tolerance, digits) in GEOMETRY_LEVELS.items():
+        collection = simplified(features, tolerance, digits, raw.get("properties"))
+        out_path = stem.with_name(f"{stem.name}.{suffix}.geojson")
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(collection, f, ensure_ascii=False, separators=(",", ":"))
+        print(f"{out_path}: {name} · 피처 {len(features)}개 · 좌표 {count_points(collection):,}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+지역별 인구 지표 (모든 지역 × 모든 기준월, 배열 연산 한 번)
+
+- 중위연령      : 나이 방향 누적합이 절반을 넘는 나이 (해당 나이 안에서 선형 보간)
+- 유소년부양비  : 0~14세 / 15~64세 × 100
+- 노년부양비    : 65세 이상 / 15~64세 × 100
+- 총부양비      : 유소년 + 노년부양비
+- 노령화지수    : 65세 이상 / 0~14세 × 100
+- 고령인구 비율 : 65세 이상 / 전체 × 100
+- 전월 대비 증감: 바로 앞 달과 비교. 두 달 모두 자료가 있고 실제로 이어진 달일 때만
+                  계산 (첫 달, 빠진 달 다음, 한쪽 자료가 없는 지역은 빈 값)
+"""
+import numpy as np
+import pandas as pd
+
+import population_regions
+
+YOUTH = (0, 14)
+WORKING = (15, 64)
+ELDERLY = 65
+
+# 화면/정렬에 쓰는 지표 이름 (순서대로 표에 표시)
+INDICATORS = [
+    "총인구",
+    "중위연령",
+    "고령인구 비율(%)",
+    "유소년부양비",
+    "노년부양비",
+    "총부양비",
+    "노령화지수",
+    "전월 대비 증감",
+    "전월 대비 증감률(%)",
+]
+
+
+def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """num / den × 100 (분모 0 은 NaN)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den > 0, num / den * 100, np.nan)
+
+
+def compute(values: np.ndarray, present: np.ndarray = None, months: list = None) -> dict:
+    """
+    values : [지역, 월, 나이] 인구 (보통 성별 '계')
+    present: [지역, 월] 자료가 있는 칸 (없으면 모두 있음)
+    months : 기준월 YYYYMM 정수 목록 (없으면 모두 이어진 달로 봄)
+    반환값 : {지표 이름: [지역, 월] 배열}
+    """
+    values = values.astype(np.int64)
+    n_ages = values.shape[-1]
+    cum = np.zeros(values.shape[:-1] + (n_ages + 1,), dtype=np.int64)
+    np.cumsum(values, axis=-1, out=cum[..., 1:])
+    total = cum[..., -1]
+
+    def band(lo, hi=None):
+        hi = n_ages - 1 if hi is None else min(hi, n_ages - 1)
+        return cum[..., hi + 1] - cum[..., lo]
+
+    youth, working, elderly = band(*YOUTH), band(*WORKING), band(ELDERLY)
+
+    # 중위연령: cum[k] < 절반 <= cum[k+1] 인 나이 k, 그 안에서 선형 보간
+    half = total / 2
+    k = np.clip((cum[..., 1:] < half[..., None]).sum(axis=-1), 0, n_ages - 1)
+    before = np.take_along_axis(cum, k[..., None], axis=-1)[..., 0]
+    at_k = np.take_along_axis(values, k[..., None], axis=-1)[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        median = np.where(total > 0, k + np.where(at_k > 0, (half - before) / at_k, 0.5), np.nan)
+
+    # 전월 대비: 두 달 모두 자료가 있고 바로 이어진 달인 칸만 (나머지는 NaN)
+    if present is None:
+        present = np.ones(total.shape, dtype=bool)
+    comparable = present[:, 1:] & present[:, :-1]
+    if months is not None:
+        serial = np.array([ym // 100 * 12 + ym % 100 for ym in months], dtype=np.int64)
+        comparable &= (np.diff(serial) == 1)[None, :]
+    change = np.full(total.shape, np.nan)
+    change[:, 1:] = np.where(comparable, total[:, 1:] - total[:, :-1], np.nan)
+    change_pct = np.full(total.shape, np.nan)
+    change_pct[:, 1:] = np.where(comparable, _ratio(change[:, 1:], total[:, :-1]), np.nan)
+
+    youth_dep = _ratio(youth, working)
+    old_dep = _ratio(elderly, working)
+    return {
+        "총인구": total,
+        "중위연령": median,
+        "고령인구 비율(%)": _ratio(elderly, total),
+        "유소년부양비": youth_dep,
+        "노년부양비": old_dep,
+        "총부양비": youth_dep + old_dep,
+        "노령화지수": _ratio(elderly, youth),
+        "전월 대비 증감": change,
+        "전월 대비 증감률(%)": change_pct,
+    }
+
+
+def indicator_table(tree, cube) -> pd.DataFrame:
+    """
+    트리의 모든 노드(가상 합계 노드 포함) × 모든 기준월 지표 표 (긴 형식).
+    컬럼: 행정구역, 코드, 단계, 기준월, INDICATORS...
+    """
+    total_sex = cube.sex_index("계")
+    result = compute(tree.values[:, :, total_sex, :], tree.present, cube.months)
+
+    n_nodes, n_months = len(tree), len(cube.month_labels)
+    node = np.repeat(np.arange(n_nodes), n_months)
+    month = np.tile(np.arange(n_months), n_nodes)
+    present = tree.present[node, month]
+
+    table = pd.DataFrame(
+        {
+            "행정구역": tree.names[node],
+            "코드": tree.codes[node],
+            "단계": pd.Categorical.from_codes(tree.levels[node], categories=population_regions.LEVELS),
+            "기준월": pd.Categorical.from_codes(month, categories=cube.month_labels),
+        }
+    )
+    for name in INDICATORS:
+        values = result[name][node, month]
+        table[name] = values.astype(np.int64) if name == "총인구" else np.round(values, 2)
+    return table[present].reset_index(drop=True)
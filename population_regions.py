@@ -0,0 +1,149 @@
+"""
+행정구역 트리 (시도 → 시군구 → 읍면동)
+
+행정구역 라벨에 들어 있는 10자리 행정기관코드로 계층을 만든다.
+
+    SS GGG DDD RR  (SS=시도, GGG=시군구, DDD=읍면동, RR=리)
+    1100000000 서울특별시 / 1111000000 종로구 / 1111051500 청운효자동
+
+- 부모 = 코드를 뒤에서부터 잘라서 처음 만나는 존재하는 코드
+  (일반구는 상위 시로: 4111100000 장안구 → 4111000000 수원시 → 4100000000 경기도)
+- 파일에 상위 행이 없으면(예: 읍면동만 있는 파일) 가상 노드를 만들고
+  하위 합계로 채움. 파일에 있는 행은 그 값을 그대로 사용
+- 모든 노드의 자식 합계(child_sum)를 아래 단계부터 한 번에 미리 계산
+- 코드 → 노드 번호 사전으로 O(1) 조회, 자식 목록은 노드별로 미리 계산
+"""
+import numpy as np
+
+LEVELS = ["시도", "시군구", "읍면동"]
+
+
+def code_level(code: int) -> int:
+    """0=시도, 1=시군구(일반구 포함), 2=읍면동"""
+    if code % 10 ** 8 == 0:
+        return 0
+    if code % 10 ** 5 == 0:
+        return 1
+    return 2
+
+
+def _ancestor_codes(code: int) -> list:
+    """가까운 상위 코드 후보 (시군구 → 일반구의 상위 시 → 시도)"""
+    candidates = [code // 10 ** 5 * 10 ** 5, code // 10 ** 6 * 10 ** 6, code // 10 ** 8 * 10 ** 8]
+    return [c for c in dict.fromkeys(candidates) if c != code]
+
+
+class RegionTree:
+    def __init__(self, cube):
+        """cube: population_data.PopulationCube"""
+        codes = [int(c) for c in cube.codes]
+        names = list(cube.names)
+        rows = list(range(len(codes)))
+        index = {c: i for i, c in enumerate(codes) if c >= 0}
+
+        # 빠진 상위 노드(시도, 읍면동의 시군구)는 가상 노드로 추가
+        for i in range(len(codes)):
+            code = codes[i]
+            if code < 0:
+                continue
+            level = code_level(code)
+            words = names[i].split()
+            needed = []
+            if level >= 1:
+                needed.append((code // 10 ** 8 * 10 ** 8, " ".join(words[:1])))
+            if level == 2:
+                needed.append((code // 10 ** 5 * 10 ** 5, " ".join(words[:-1])))
+            for parent_code, parent_name in needed:
+                if parent_code not in index:
+                    index[parent_code] = len(codes)
+                    codes.append(parent_code)
+                    names.append(parent_name)
+                    rows.append(-1)
+
+        n = len(codes)
+        self.codes = np.array(codes, dtype=np.int64)
+        self.names = np.array(names, dtype=object)
+        self.rows = np.array(rows, dtype=np.int64)      # 큐브 행 번호 (가상 노드는 -1)
+        self.synthetic = self.rows < 0
+        self.levels = np.array([code_level(c) if c >= 0 else 0 for c in codes], dtype=np.int8)
+        self._code_index = index
+
+        # 부모 / 깊이
+        self.parent = np.full(n, -1, dtype=np.int64)
+        for i, code in enumerate(codes):
+            if code < 0:
+                continue
+            for anc in _ancestor_codes(code):
+                if anc in index:
+                    self.parent[i] = index[anc]
+                    break
+        self.depth = np.zeros(n, dtype=np.int64)
+        for i in range(n):
+            p = self.parent[i]
+            while p >= 0:
+                self.depth[i] += 1
+                p = self.parent[p]
+
+        # 자식 목록 (코드순)
+        order = np.lexsort((self.codes, self.parent))
+        bounds = np.searchsorted(self.parent[order], np.arange(-1, n + 1))
+        self.roots = order[bounds[0]:bounds[1]]
+        self._children = [order[bounds[i + 1]:bounds[i + 2]] for i in range(n)]
+
+        # 값: 실제 행은 그대로, 가상 노드는 자식 합계 (깊은 단계부터 위로)
+        shape = (n,) + cube.values.shape[1:]
+        self.values = np.zeros(shape, dtype=np.int64)
+        real = np.flatnonzero(~self.synthetic)
+        self.values[real] = cube.values[self.rows[real]]
+        self.present = np.zeros((n, cube.present.shape[1]), dtype=bool)
+        self.present[real] = cube.present[self.rows[real]]
+
+        # 자식 합계(child_sum)는 모든 노드에 대해 미리 계산
+        self.child_sum = np.zeros_like(self.values)
+        for d in range(int(self.depth.max(initial=0)), 0, -1):
+            nodes = np.flatnonzero(self.depth == d)
+            parents = self.parent[nodes]
+            np.add.at(self.child_sum, parents, self.values[nodes])
+            syn = self.synthetic[parents]
+            if syn.any():
+                fill = np.unique(parents[syn])
+                self.values[fill] = self.child_sum[fill]
+                np.logical_or.at(self.present, parents[syn], self.present[nodes[syn]])
+
+    # ---------------------------
+    # 조회
+    # ---------------------------
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def node(self, code: int):
+        """행정기관코드 → 노드 번호 (없으면 None)"""
+        return self._code_index.get(int(code))
+
+    def children(self, i: int) -> np.ndarray:
+        return self._children[i]
+
+    def path(self, i: int) -> list:
+        """루트(시도)부터 이 노드까지의 노드 번호 목록"""
+        out = [i]
+        while self.parent[out[-1]] >= 0:
+            out.append(int(self.parent[out[-1]]))
+        return out[::-1]
+
+    def short_name(self, i: int) -> str:
+        """부모 이름을 뺀 이름 (예: 서울특별시 종로구 → 종로구)"""
+        name = self.names[i]
+        p = self.parent[i]
+        if p >= 0 and name.startswith(self.names[p]):
+            return name[len(self.names[p]):].strip() or name
+        return name
+
+    def full_name(self, i: int) -> str:
+        """표시용 이름 (코드 포함, 가상 노드는 '합계' 표시)"""
+        suffix = " · 하위 합계" if self.synthetic[i] else ""
+        return f"{self.names[i]} ({self.codes[i]}){suffix}"
+
+    def child_level_name(self, i: int) -> str:
+        """자식 노드의 단계 이름 (시군구 / 읍면동)"""
+        kids = self.children(i)
+        return LEVELS[int(self.levels[kids[0]])] if len(kids) else ""
@@ -0,0 +1,176 @@
+"""
+지하철 역 검색 인덱스
+
+- 앞부분 일치 (예: "강남" → 강남, 강남구청 ...)
+- 부분 일치   (예: "이수" → 총신대입구(이수))
+- 초성 검색   (예: "ㄱㄴ" → 강남, 건대입구 ...)
+- 호선마다 이름이 다른 환승역은 TRANSFER_ALIASES 로 하나의 역으로 합침
+
+인덱스는 데이터 로딩 시 한 번 만들고, 조회는
+앞부분 일치 = 정렬된 키에서 이진 탐색, 부분/초성 일치 = 한 덩어리 문자열에서 str.find
+로 처리해서 역이 수천 개여도 파이썬 반복문으로 전체를 훑지 않는다.
+"""
+import bisect
+import re
+
+# 원래 역명 → 대표 역명 (같은 환승역인데 호선마다 이름이 다른 경우)
+# 이름만 같고 다른 역(예: 5호선 양평 / 중앙선 양평)은 여기에 넣지 않는다.
+TRANSFER_ALIASES = {
+    "이수": "총신대입구(이수)",
+}
+
+CHOSUNG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+_CHOSUNG_SET = set(CHOSUNG)
+_SEP = "\n"
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화: 공백/괄호/구두점 제거, 영문 소문자"""
+    return re.sub(r"[\s()\[\].·,\-]", "", str(text)).lower()
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절은 초성으로, 나머지 글자는 그대로"""
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(CHOSUNG[code // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_chosung_query(query: str) -> bool:
+    """초성(자음)이 하나라도 섞여 있으면 초성 검색으로 처리"""
+    return any(ch in _CHOSUNG_SET for ch in query)
+
+
+def _char_match(query: str, text: str) -> bool:
+    """초성 섞인 검색어가 text 어딘가와 맞는지 (음절은 그대로, 자음은 초성으로 비교)"""
+    n = len(query)
+    for start in range(len(text) - n + 1):
+        for q, t in zip(query, text[start:start + n]):
+            if q != t and not (q in _CHOSUNG_SET and to_chosung(t) == q):
+                break
+        else:
+            return True
+    return False
+
+
+class _PrefixIndex:
+    """정렬된 키에서 이진 탐색으로 앞부분 일치 검색"""
+
+    def __init__(self, keys: list, owners: list):
+        order = sorted(range(len(keys)), key=lambda k: keys[k])
+        self.keys = [keys[k] for k in order]
+        self.owners = [owners[k] for k in order]
+
+    def find(self, query: str, limit: int) -> list:
+        hits = []
+        i = bisect.bisect_left(self.keys, query)
+        while i < len(self.keys) and self.keys[i].startswith(query) and len(hits) < limit:
+            hits.append(self.owners[i])
+            i += 1
+        return hits
+
+
+class _SubstringIndex:
+    """키 목록을 한 문자열로 이어 붙여서 str.find 로 부분 일치 검색"""
+
+    def __init__(self, keys: list, owners: list):
+        self.blob = _SEP.join(keys)
+        self.owners = owners
+        self.starts = []
+        pos = 0
+        for key in keys:
+            self.starts.append(pos)
+            pos += len(key) + 1
+
+    def find(self, query: str, limit: int) -> list:
+        hits = []
+        pos = self.blob.find(query)
+        while pos != -1 and len(hits) < limit:
+            hits.append(self.owners[bisect.bisect_right(self.starts, pos) - 1])
+            pos = self.blob.find(query, pos + 1)
+        return hits
+
+
+class StationSearchIndex:
+    def __init__(self, stations, lines_by_station: dict = None, aliases: dict = None):
+        """
+        stations: 대표 역명 목록
+        lines_by_station: {대표 역명: [호선, ...]} (결과 표시용)
+        aliases: {대표 역명: [합쳐진 다른 이름, ...]} (이 이름으로도 검색됨)
+        """
+        self.stations = list(stations)
+        self.lines = [list((lines_by_station or {}).get(name, [])) for name in self.stations]
+        self._position = {name: i for i, name in enumerate(self.stations)}
+        aliases = aliases or {}
+
+        # 검색 키: 대표 이름(주 키) / 괄호 안 부이름, 합쳐진 다른 이름(보조 키)
+        main_keys = [normalize(name) for name in self.stations]
+        sub_keys, sub_owners = [], []
+        for i, name in enumerate(self.stations):
+            names = re.findall(r"\(([^)]*)\)", name) + list(aliases.get(name, []))
+            for key in dict.fromkeys(normalize(n) for n in names if n):
+                sub_keys.append(key)
+                sub_owners.append(i)
+
+        all_keys = main_keys + sub_keys
+        all_owners = list(range(len(main_keys))) + sub_owners
+        chosung_keys = [to_chosung(k) for k in all_keys]
+
+        self._keys_by_station = [[] for _ in self.stations]
+        for key, owner in zip(all_keys, all_owners):
+            self._keys_by_station[owner].append(key)
+        self._main_prefix = _PrefixIndex(main_keys, list(range(len(main_keys))))
+        self._sub_prefix = _PrefixIndex(sub_keys, sub_owners)
+        self._text = _SubstringIndex(all_keys, all_owners)
+        self._chosung_prefix = _PrefixIndex(chosung_keys, all_owners)
+        self._chosung = _SubstringIndex(chosung_keys, all_owners)
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """
+        검색어에 맞는 대표 역명 목록.
+        - 일반 검색어: 역명 앞부분 일치 → 부이름 앞부분 일치 → 부분 일치
+        - 초성 섞인 검색어(예: ㄱㄴ, 강ㄴ): 초성 앞부분 일치 → 초성 부분 일치
+        """
+        q = normalize(query)
+        if not q:
+            return self.stations[:limit]
+
+        if is_chosung_query(q):
+            cq = to_chosung(q)
+            candidates = [self._chosung_prefix.find(cq, limit * 5), self._chosung.find(cq, limit * 5)]
+        else:
+            candidates = [
+                self._main_prefix.find(q, limit),
+                self._sub_prefix.find(q, limit),
+                self._text.find(q, limit * 2),
+            ]
+
+        # 음절이 섞인 초성 검색어는 음절까지 맞는지 한 번 더 확인
+        check = is_chosung_query(q) and any(ch not in _CHOSUNG_SET for ch in q)
+
+        found = []
+        seen = set()
+        for group in candidates:
+            for i in group:
+                if i in seen:
+                    continue
+                if check and not any(_char_match(q, key) for key in self._keys_by_station[i]):
+                    continue
+                seen.add(i)
+                found.append(i)
+                if len(found) >= limit:
+                    return [self.stations[k] for k in found]
+        return [self.stations[k] for k in found]
+
+    def label(self, name: str) -> str:
+        """선택 목록에 보여줄 이름 (예: 서울역 · 1호선, 4호선)"""
+        i = self._position[name]
+        return f"{name} · {', '.join(self.lines[i])}" if self.lines[i] else name
@@ -0,0 +1,126 @@
+"""
+역 × 일자 승하차 이상치 탐지
+
+역마다, 일유형(평일/주말/공휴일)마다 중앙값과 MAD(중앙값 절대편차)로
+견고한 기준선을 잡고, 모든 역-일에 대해 robust z 점수를 한 번에 계산한다.
+
+    z = (실제 - 중앙값) / (1.4826 × MAD)
+
+- 일유형별 표본이 너무 적으면(min_days 미만) 그 역의 전체 기간 기준선을 사용
+- MAD가 0에 가까운 역은 중앙값의 5% 를 최소 편차로 사용 (z 폭주 방지)
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import korean_calendar
+
+METRICS = {
+    "승하차 합계": "총승하차",
+    "승차": "승차총승객수",
+    "하차": "하차총승객수",
+}
+
+MAD_SCALE = 1.4826      # 정규분포에서 MAD → 표준편차 환산
+MIN_SCALE_RATIO = 0.05  # 최소 편차 = 중앙값 × 5%
+
+
+def _robust_baseline(values: np.ndarray):
+    """[일자, 역] 배열의 열(역)별 중앙값, MAD 기반 편차, 표본 수 (NaN 제외)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)  # 데이터 없는 역
+        median = np.nanmedian(values, axis=0)
+        mad = np.nanmedian(np.abs(values - median), axis=0) * MAD_SCALE
+    count = np.sum(~np.isnan(values), axis=0)
+    return median, mad, count
+
+
+class AnomalyResult:
+    def __init__(self, cube, metric: str = "총승하차", min_days: int = 3):
+        """
+        cube: subway_cube.RidershipCube
+        metric: "승차총승객수" / "하차총승객수" / "총승하차"
+        """
+        self.days = cube.days
+        self.stations = cube.stations
+        self.calendar = cube.calendar
+        self.metric = metric
+
+        # 역 × 일자 행렬 (누적합 차분, 데이터 없는 날은 NaN)
+        board = np.diff(cube.board_cum, axis=0)
+        alight = np.diff(cube.alight_cum, axis=0)
+        values = {
+            "승차총승객수": board,
+            "하차총승객수": alight,
+            "총승하차": board + alight,
+        }[metric].astype(np.float64)
+        values[np.diff(cube.rows_cum, axis=0) == 0] = np.nan
+
+        # 역 전체 기간 기준선 (일유형 표본이 부족할 때 사용)
+        all_median, all_mad, _ = _robust_baseline(values)
+
+        median = np.empty_like(values)
+        scale = np.empty_like(values)
+        for k in range(len(korean_calendar.DAY_TYPES)):
+            cols = cube.day_type == k
+            if not cols.any():
+                continue
+            med, mad, count = _robust_baseline(values[cols])
+            few = count < min_days
+            med = np.where(few, all_median, med)
+            mad = np.where(few, all_mad, mad)
+            median[cols] = med
+            scale[cols] = mad
+
+        scale = np.fmax(scale, np.fmax(np.abs(median) * MIN_SCALE_RATIO, 1.0))
+
+        self.values = values
+        self.median = median
+        self.z = (values - median) / scale
+
+    def peak_z(self) -> np.ndarray:
+        """역별 |z| 최댓값 (데이터 없는 역은 0)"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return np.nan_to_num(np.nanmax(np.abs(self.z), axis=0))
+
+    def table(self, threshold: float = 3.5, limit: int = 200) -> pd.DataFrame:
+        """|z| >= threshold 인 역-일을 |z| 큰 순서로"""
+        abs_z = np.nan_to_num(np.abs(self.z))
+        day_idx, st_idx = np.nonzero(abs_z >= threshold)
+        order = np.argsort(-abs_z[day_idx, st_idx], kind="stable")[:limit]
+        day_idx, st_idx = day_idx[order], st_idx[order]
+
+        actual = self.values[day_idx, st_idx]
+        base = self.median[day_idx, st_idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.where(base > 0, (actual - base) / base * 100, np.nan)
+
+        return pd.DataFrame(
+            {
+                "역명": self.stations[st_idx],
+                "날짜": self.days[day_idx].astype(object),
+                "요일": self.calendar["요일"].to_numpy()[day_idx],
+                "일유형": self.calendar["일유형"].astype(str).to_numpy()[day_idx],
+                "실제 인원": actual.astype(np.int64),
+                "기준(중앙값)": base.round(0).astype(np.int64),
+                "변화율(%)": change.round(1),
+                "z 점수": self.z[day_idx, st_idx].round(2),
+                "구분": np.where(self.z[day_idx, st_idx] > 0, "급증", "급감"),
+            }
+        )
+
+    def heatmap(self, top_n: int = 30) -> pd.DataFrame:
+        """|z| 최댓값 상위 top_n 개 역의 역 × 날짜 z 점수 표"""
+        peak = self.peak_z()
+        top_n = min(top_n, len(peak))
+        if top_n == 0:
+            return pd.DataFrame()
+        top = np.argpartition(-peak, top_n - 1)[:top_n]
+        top = top[np.argsort(-peak[top], kind="stable")]
+        return pd.DataFrame(
+            self.z[:, top].T.round(2),
+            index=pd.Index(self.stations[top], name="역명"),
+            columns=[d.strftime("%Y-%m-%d") for d in self.days.astype(object)],
+        )
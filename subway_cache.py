@@ -0,0 +1,116 @@
+"""
+지하철 데이터 Streamlit 캐시 로더 (여러 페이지 공유)
+
+같은 함수를 여러 페이지에서 불러야 캐시 항목도 하나만 생긴다.
+모두 저장소 버전(subway_store.store_version)을 인자로 받아서,
+새 파티션이 추가되면 자동으로 다시 만들어진다.
+"""
+import threading
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+import station_search
+import subway_anomaly
+import subway_cube
+import subway_forecast
+import subway_hourly
+import subway_live
+import subway_similarity
+import subway_store
+
+
+def load_data(start: date, end: date) -> pd.DataFrame:
+    """
+    월별 Parquet 저장소에서 start~end 기간에 걸치는 파티션만 읽어서
+    압축 표현(int16 일자, category 역/노선, int32 인원)으로 반환.
+    큐브를 만들 때만 잠깐 쓰고 버리므로 따로 캐시하지 않음.
+    """
+    return subway_store.compact_frame(subway_store.read_range(start, end))
+
+
+@st.cache_resource
+def load_cube(start: date, end: date, version: str) -> subway_cube.RidershipCube:
+    """
+    일자 × (호선, 역) 집계 큐브. 데이터 버전당 한 번만 만들고
+    모든 세션이 같은 배열을 공유(읽기 전용)한다.
+    """
+    return subway_cube.RidershipCube(load_data(start, end), station_search.TRANSFER_ALIASES)
+
+
+@st.cache_resource
+def load_search_index(start: date, end: date, version: str) -> station_search.StationSearchIndex:
+    """역 검색 인덱스 (앞부분/부분/초성 검색, 환승역 통합). 데이터 버전당 한 번 생성."""
+    cube = load_cube(start, end, version)
+    return station_search.StationSearchIndex(
+        cube.stations,
+        {name: cube.station_lines(i) for i, name in enumerate(cube.stations)},
+        cube.station_aliases,
+    )
+
+
+@st.cache_resource
+def load_anomalies(start: date, end: date, version: str, metric: str) -> subway_anomaly.AnomalyResult:
+    """역 × 일자 robust z 점수. 데이터 버전 × 지표마다 한 번 계산."""
+    return subway_anomaly.AnomalyResult(load_cube(start, end, version), metric)
+
+
+@st.cache_resource
+def load_profiles(start: date, end: date, version: str) -> subway_similarity.StationProfiles:
+    """역 패턴 유사도 행렬 + 군집. 데이터 버전당 한 번 계산."""
+    return subway_similarity.StationProfiles(load_cube(start, end, version))
+
+
+@st.cache_resource
+def load_forecast(start: date, end: date, version: str) -> subway_forecast.StationForecast:
+    """모든 역의 요일 + 추세 예측 계수. 데이터 버전당 한 번 적합."""
+    return subway_forecast.StationForecast(load_cube(start, end, version))
+
+
+@st.cache_resource
+def load_hourly(start: date, end: date, version: str) -> subway_hourly.HourlyCube:
+    """
+    일자 × 역 × 시 큐브 (시간대별 저장소).
+    version 은 subway_store.store_version(subway_store.HOURLY_STORE_DIR).
+    """
+    df = subway_store.compact_hourly_frame(subway_store.read_hourly_range(start, end))
+    return subway_hourly.HourlyCube(df, station_search.TRANSFER_ALIASES)
+
+
+_LIVE_FEEDS_LOCK = threading.Lock()
+
+
+@st.cache_resource
+def _live_feeds() -> dict:
+    """{(종류, 대상): (키, LiveFeed)} — 파일/포트마다 실행 중인 피드 하나만 유지 (모든 세션 공유)"""
+    return {}
+
+
+def load_live_feed(start: date, end: date, version: str, kind: str, target: str) -> subway_live.LiveFeed:
+    """
+    실시간 피드 (모든 세션 공유). 저장소 큐브 합계로 시작해서 새 행만 누적.
+    kind: "파일" → target = CSV 경로, "소켓" → target = 포트 번호
+    같은 파일/포트의 기간·저장소 버전이 바뀌면 그 대상의 이전 피드만 멈추고(스레드/포트 반환) 새로 시작.
+    다른 대상을 보는 세션의 피드는 그대로 둠.
+    """
+    key = (start, end, version)
+    feeds = _live_feeds()
+    with _LIVE_FEEDS_LOCK:
+        current = feeds.get((kind, target))
+        if current is not None and current[0] == key:
+            return current[1]
+        if current is not None:
+            current[1].stop()
+            del feeds[(kind, target)]
+
+        aggregates = subway_live.LiveAggregates.from_cube(
+            load_cube(start, end, version), station_search.TRANSFER_ALIASES
+        )
+        feed = subway_live.LiveFeed(aggregates)
+        if kind == "소켓":
+            feed.start_socket(port=int(target))
+        else:
+            feed.start_file(target)
+        feeds[(kind, target)] = (key, feed)
+        return feed
@@ -0,0 +1,401 @@
+"""
+지하철 승하차 집계 큐브 (일자 × (호선, 역))
+
+데이터를 불러올 때 한 번만 만들어 두고, 화면에서는 배열 슬라이스로 조회한다.
+
+- 일자/호선/역 이름은 정수 코드로 바꿔서(사전 인코딩) 라벨 배열에 보관
+- 실제로 존재하는 (호선, 역) 조합만 열로 두어서 호선 × 역 전체를 펼치지 않음
+- board / alight : [일자, 조합] 크기의 int32 배열
+- present        : 해당 일자에 그 조합의 행이 있었는지 여부
+- line_rank      : 호선 내 역별 기간 합계의 백분위/상·중·하 등급 (미리 계산)
+- *_cum          : 역 × 일자 누적합 (임의 기간 합계 = 누적합 두 번 조회)
+- calendar       : 일자별 달력 차원 (평일/주말/공휴일), 일유형별 평균표
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+import korean_calendar
+
+
+def _encode(values: pd.Series, aliases: dict = None):
+    """
+    문자열 컬럼 → (정수 코드, 이름순 라벨 배열). category 컬럼이면 문자열로 풀지 않음.
+    aliases 가 있으면 라벨을 대표 이름으로 바꿔서 같은 코드로 합침.
+    """
+    cat = values.astype("category").cat.remove_unused_categories()
+    labels = np.asarray(cat.cat.categories, dtype=object)
+    if aliases:
+        labels = np.array([aliases.get(name, name) for name in labels], dtype=object)
+    uniq, remap = np.unique(labels, return_inverse=True)
+    return remap[cat.cat.codes.to_numpy()], uniq.astype(object)
+
+
+class RidershipCube:
+    def __init__(self, df: pd.DataFrame, station_aliases: dict = None):
+        """
+        df: subway_store.compact_frame 형식
+            (day: 1970-01-01 기준 일수, 노선명, 역명, 승차총승객수, 하차총승객수)
+        station_aliases: {원래 역명: 대표 역명}
+            호선마다 이름이 다른 환승역을 하나의 역으로 합칠 때 사용
+        """
+        # 원본 프레임 메모리 (디버그용 기록, 프레임 자체는 보관하지 않음)
+        self.source_memory = df.memory_usage(deep=True, index=False)
+
+        day_values, day_codes = np.unique(df["day"].to_numpy(), return_inverse=True)
+        line_codes, lines = _encode(df["노선명"])
+        station_codes, stations = _encode(df["역명"], station_aliases)
+
+        # 대표 역명 → 합쳐진 원래 역명 목록 (검색용)
+        self.station_aliases = {}
+        raw_names = set(df["역명"].astype("category").cat.categories)
+        for raw, canonical in (station_aliases or {}).items():
+            if raw != canonical and raw in raw_names:
+                self.station_aliases.setdefault(canonical, []).append(raw)
+
+        # (호선, 역) 조합 코드: 실제 존재하는 조합만 사용
+        pair_keys = line_codes.astype(np.int64) * max(len(stations), 1) + station_codes
+        pair_values, pair_codes = np.unique(pair_keys, return_inverse=True)
+
+        n_days = len(day_values)
+        n_pairs = len(pair_values)
+
+        # 날짜 라벨
+        self.days = day_values.astype(np.int64).astype("datetime64[D]")
+        self.lines = np.asarray(lines, dtype=object)
+        self.stations = np.asarray(stations, dtype=object)
+        self.pair_line = (pair_values // max(len(stations), 1)).astype(np.int32)
+        self.pair_station = (pair_values % max(len(stations), 1)).astype(np.int32)
+
+        # 같은 (일자, 조합)이 여러 행이면 합산
+        flat = day_codes.astype(np.int64) * n_pairs + pair_codes
+        size = n_days * n_pairs
+        self.board = self._accumulate(flat, df["승차총승객수"].to_numpy(), size).reshape(n_days, n_pairs)
+        self.alight = self._accumulate(flat, df["하차총승객수"].to_numpy(), size).reshape(n_days, n_pairs)
+        self.present = (np.bincount(flat, minlength=size) > 0).reshape(n_days, n_pairs)
+
+        # 월 전체 합계 (조합별)
+        self.board_total = self.board.sum(axis=0, dtype=np.int64)
+        self.alight_total = self.alight.sum(axis=0, dtype=np.int64)
+
+        # 라벨 → 코드 사전
+        self._day_index = {d: i for i, d in enumerate(self.days.astype(object))}
+        self._line_index = {name: i for i, name in enumerate(self.lines)}
+        self._station_index = {name: i for i, name in enumerate(self.stations)}
+
+        # 호선별 / 역별 조합 목록 (pair 코드 배열)
+        self._line_pairs = self._group_pairs(self.pair_line, len(self.lines))
+        self._station_pairs = self._group_pairs(self.pair_station, len(self.stations))
+
+        # 호선 내 순위표 (조합 코드 순서와 같은 행 순서)
+        self.line_rank = self._build_line_rank()
+
+        # 역 × 일자 누적합 (맨 앞에 0행을 두어 cum[hi] - cum[lo] 로 기간 합계)
+        self.board_cum = self._station_cumsum(self.board)
+        self.alight_cum = self._station_cumsum(self.alight)
+        self.rows_cum = self._station_cumsum(self.present).astype(np.int32)
+        self.days_cum = self._cumsum_days(np.diff(self.rows_cum, axis=0) > 0).astype(np.int32)
+
+        # 달력 차원 (로딩 시 한 번 결합) + 일유형별 평균
+        self.calendar = korean_calendar.build_calendar(self.days)
+        self.day_type = self.calendar["일유형"].cat.codes.to_numpy()
+        self.station_day_type, self.line_day_type = self._build_day_type_avg()
+
+    @staticmethod
+    def _accumulate(flat: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+        return np.bincount(flat, weights=values, minlength=size).astype(np.int32)
+
+    @staticmethod
+    def _group_pairs(codes: np.ndarray, n: int) -> list:
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(n + 1))
+        return [order[bounds[i]:bounds[i + 1]] for i in range(n)]
+
+    def _station_cumsum(self, values: np.ndarray) -> np.ndarray:
+        """[일자, 조합] 값을 역 단위로 합친 뒤 일자 방향 누적합 ([일자+1, 역])"""
+        per_station = np.zeros((values.shape[0], len(self.stations)), dtype=np.int64)
+        np.add.at(per_station, (slice(None), self.pair_station), values)
+        return self._cumsum_days(per_station)
+
+    @staticmethod
+    def _cumsum_days(per_station: np.ndarray) -> np.ndarray:
+        """이미 역 단위인 [일자, 역] 값의 일자 방향 누적합 ([일자+1, 역])"""
+        cum = np.zeros((per_station.shape[0] + 1, per_station.shape[1]), dtype=np.int64)
+        np.cumsum(per_station, axis=0, out=cum[1:])
+        return cum
+
+    def _build_day_type_avg(self):
+        """
+        평일/주말/공휴일별 평균을 역 단위, 호선 단위로 한 번에 계산.
+        [일자, 일유형] 원-핫 행렬과의 곱으로 모든 역/호선의 유형별 합계를 구함.
+        - 역: 일평균 (여러 호선이면 합산한 하루 인원 기준)
+        - 호선: 역당 일평균 (호선 합계 / 역-일 행 수)
+        """
+        onehot = (self.day_type[:, None] == np.arange(len(korean_calendar.DAY_TYPES))).astype(np.int64)
+
+        # 역 단위 [역, 일유형]
+        st_board = np.diff(self.board_cum, axis=0).T @ onehot
+        st_alight = np.diff(self.alight_cum, axis=0).T @ onehot
+        st_days = np.diff(self.days_cum, axis=0).T @ onehot
+
+        # 호선 단위 [호선, 일유형]
+        n_lines = len(self.lines)
+        ln_board = np.zeros((n_lines, onehot.shape[1]), dtype=np.int64)
+        ln_alight = np.zeros_like(ln_board)
+        ln_rows = np.zeros_like(ln_board)
+        np.add.at(ln_board, self.pair_line, self.board.T.astype(np.int64) @ onehot)
+        np.add.at(ln_alight, self.pair_line, self.alight.T.astype(np.int64) @ onehot)
+        np.add.at(ln_rows, self.pair_line, self.present.T.astype(np.int64) @ onehot)
+
+        def to_frame(board, alight, count, index, count_label):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                board_avg = np.where(count > 0, board / count, np.nan)
+                alight_avg = np.where(count > 0, alight / count, np.nan)
+            columns = {}
+            for k, name in enumerate(korean_calendar.DAY_TYPES):
+                columns[(name, "승차 평균")] = board_avg[:, k].round(1)
+                columns[(name, "하차 평균")] = alight_avg[:, k].round(1)
+                columns[(name, count_label)] = count[:, k]
+            return pd.DataFrame(columns, index=index)
+
+        station_avg = to_frame(st_board, st_alight, st_days, pd.Index(self.stations, name="역명"), "일수")
+        line_avg = to_frame(ln_board, ln_alight, ln_rows, pd.Index(self.lines, name="호선"), "역-일 수")
+        return station_avg, line_avg
+
+    def _build_line_rank(self) -> pd.DataFrame:
+        """
+        모든 (호선, 역) 조합에 대해 호선 내 승차/하차 합계의 위치를 한 번에 계산.
+        - 백분위: 같은 호선에서 이 역 이하인 역의 비율 (%)
+        - 규모: 호선 내 1/3, 2/3 분위수 기준 상/중/하
+        """
+        rank = pd.DataFrame(
+            {
+                "호선": self.lines[self.pair_line],
+                "역명": self.stations[self.pair_station],
+                "총 승차 인원 (월합계)": self.board_total,
+                "총 하차 인원 (월합계)": self.alight_total,
+            }
+        )
+        by_line = rank.groupby("호선", sort=False)
+
+        for kind in ["승차", "하차"]:
+            col = f"총 {kind} 인원 (월합계)"
+            values = rank[col]
+            q1 = rank["호선"].map(by_line[col].quantile(1 / 3))
+            q2 = rank["호선"].map(by_line[col].quantile(2 / 3))
+
+            rank[f"{kind} 순위"] = by_line[col].rank(method="min", ascending=False).astype(int)
+            rank[f"{kind} 백분위"] = (by_line[col].rank(method="max", pct=True) * 100).round(1)
+            rank[f"{kind} 규모"] = np.where(values >= q2, "상", np.where(values >= q1, "중", "하"))
+
+        return rank
+
+    # ---------------------------
+    # 기본 정보
+    # ---------------------------
+    @property
+    def n_pairs(self) -> int:
+        return len(self.pair_line)
+
+    @property
+    def dates(self) -> list:
+        """datetime.date 목록 (오름차순)"""
+        return list(self.days.astype(object))
+
+    @property
+    def day_of_month(self) -> np.ndarray:
+        """일자별 '일' (1~31)"""
+        return (self.days - self.days.astype("datetime64[M]")).astype(int) + 1
+
+    def day_index(self, d):
+        return self._day_index.get(d)
+
+    def line_index(self, name: str):
+        return self._line_index.get(name)
+
+    def station_index(self, name: str):
+        return self._station_index.get(name)
+
+    def line_pairs(self, line_idx: int) -> np.ndarray:
+        return self._line_pairs[line_idx]
+
+    def station_pairs(self, station_idx: int) -> np.ndarray:
+        return self._station_pairs[station_idx]
+
+    def station_lines(self, station_idx: int) -> list:
+        """역이 속한 호선 이름 목록 (이름순)"""
+        return sorted(self.lines[self.pair_line[self.station_pairs(station_idx)]])
+
+    def memory_report(self) -> pd.DataFrame:
+        """큐브가 들고 있는 배열/표별 메모리 사용량(bytes)"""
+        rows = []
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                size = value.nbytes
+                if value.dtype == object:
+                    size += sum(sys.getsizeof(v) for v in value)
+                rows.append((name, str(value.dtype), str(value.shape), size))
+            elif isinstance(value, pd.DataFrame):
+                rows.append((name, "DataFrame", str(value.shape), int(value.memory_usage(deep=True).sum())))
+            elif isinstance(value, dict):
+                size = sys.getsizeof(value) + sum(sys.getsizeof(k) for k in value)
+                rows.append((name, "dict", f"({len(value)},)", size))
+            elif isinstance(value, list):
+                size = sys.getsizeof(value) + sum(getattr(v, "nbytes", 0) for v in value)
+                rows.append((name, "list", f"({len(value)},)", size))
+        return pd.DataFrame(rows, columns=["항목", "dtype", "shape", "bytes"])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.memory_report()["bytes"].sum())
+
+    # ---------------------------
+    # 조회
+    # ---------------------------
+    def line_day(self, day_idx: int, line_idx: int) -> pd.DataFrame:
+        """
+        하루 × 호선 기준 역별 승·하차 (총승하차 내림차순).
+        해당 일자에 행이 없는 역은 제외.
+        """
+        pairs = self.line_pairs(line_idx)
+        pairs = pairs[self.present[day_idx, pairs]]
+        board = self.board[day_idx, pairs]
+        alight = self.alight[day_idx, pairs]
+        total = board.astype(np.int64) + alight
+
+        order = np.argsort(-total, kind="stable")
+        pairs = pairs[order]
+        return pd.DataFrame(
+            {
+                "역명": self.stations[self.pair_station[pairs]],
+                "승차총승객수": board[order],
+                "하차총승객수": alight[order],
+                "총승하차": total[order],
+            }
+        )
+
+    def range_index(self, start, end):
+        """
+        날짜 구간 [start, end] (양끝 포함) → 일자 인덱스 구간 [lo, hi)
+        데이터가 없는 날짜가 끼어 있어도 그대로 동작.
+        """
+        lo = int(np.searchsorted(self.days, np.datetime64(start, "D"), side="left"))
+        hi = int(np.searchsorted(self.days, np.datetime64(end, "D"), side="right"))
+        return lo, max(lo, hi)
+
+    def range_sum(self, lo: int, hi: int) -> pd.DataFrame:
+        """
+        일자 구간 [lo, hi) 의 모든 역 승차/하차 합계.
+        rows: 합산된 행 수, days: 데이터가 있는 날짜 수
+        """
+        return pd.DataFrame(
+            {
+                "승차총승객수": self.board_cum[hi] - self.board_cum[lo],
+                "하차총승객수": self.alight_cum[hi] - self.alight_cum[lo],
+                "rows": self.rows_cum[hi] - self.rows_cum[lo],
+                "days": self.days_cum[hi] - self.days_cum[lo],
+            },
+            index=pd.Index(self.stations, name="역명"),
+        )
+
+    def period_sum(self, lo: int, hi: int, first_day: int, last_day: int) -> pd.DataFrame:
+        """
+        일자 구간 [lo, hi) 중 매월 first_day~last_day 일에 해당하는 날의 합계.
+        달마다 연속 구간이므로 (월 수 × 2) 번의 누적합 조회로 끝남.
+        """
+        total = self.range_sum(lo, lo)
+        if lo >= hi:
+            return total
+
+        months = np.unique(self.days[lo:hi].astype("datetime64[M]"))
+        for month in months:
+            month_start = month.astype("datetime64[D]")
+            next_month = (month + 1).astype("datetime64[D]")
+            a_date = month_start + (first_day - 1)
+            b_date = min(month_start + last_day, next_month)
+            a = max(lo, int(np.searchsorted(self.days, a_date, side="left")))
+            b = min(hi, int(np.searchsorted(self.days, b_date, side="left")))
+            if a < b:
+                total += self.range_sum(a, b)
+        return total
+
+    def day_type_table(self, station_idx: int) -> pd.DataFrame:
+        """
+        역의 평일/주말/공휴일 일평균과, 역이 속한 호선의 역당 일평균을 나란히 비교.
+        index: 일유형
+        """
+        row = self.station_day_type.iloc[station_idx]
+        table = pd.DataFrame(
+            {
+                "승차 평균": [row[(t, "승차 평균")] for t in korean_calendar.DAY_TYPES],
+                "하차 평균": [row[(t, "하차 평균")] for t in korean_calendar.DAY_TYPES],
+                "일수": [int(row[(t, "일수")]) for t in korean_calendar.DAY_TYPES],
+            },
+            index=pd.Index(korean_calendar.DAY_TYPES, name="일유형"),
+        )
+        for line_name in self.station_lines(station_idx):
+            line_row = self.line_day_type.loc[line_name]
+            table[f"{line_name} 역당 승차 평균"] = [
+                line_row[(t, "승차 평균")] for t in korean_calendar.DAY_TYPES
+            ]
+        return table
+
+    def top_k(self, day_idx, line_idx, k: int = 10, metric: str = "총승하차") -> pd.DataFrame:
+        """
+        임의의 일자 집합 × 호선 집합에서 역별 합계 상위 k개.
+        metric: "승차총승객수" / "하차총승객수" / "총승하차"
+        전체 정렬 대신 argpartition 으로 상위 k개만 고른 뒤 그 k개만 정렬.
+        """
+        day_idx = np.asarray(day_idx, dtype=np.int64)
+        line_idx = list(line_idx)
+        pairs = (
+            np.concatenate([self.line_pairs(i) for i in line_idx])
+            if line_idx
+            else np.array([], dtype=np.int64)
+        )
+
+        # 선택 일자 × 선택 조합 합계 → 역 단위로 합산
+        block = np.ix_(day_idx, pairs)
+        n_st = len(self.stations)
+        codes = self.pair_station[pairs]
+        board = np.bincount(codes, weights=self.board[block].sum(axis=0, dtype=np.int64), minlength=n_st)
+        alight = np.bincount(codes, weights=self.alight[block].sum(axis=0, dtype=np.int64), minlength=n_st)
+        seen = np.bincount(codes, weights=self.present[block].sum(axis=0), minlength=n_st) > 0
+
+        values = {
+            "승차총승객수": board,
+            "하차총승객수": alight,
+            "총승하차": board + alight,
+        }[metric]
+
+        candidates = np.flatnonzero(seen)
+        if 0 < k < len(candidates):
+            part = np.argpartition(-values[candidates], k - 1)[:k]
+            candidates = candidates[part]
+        top = candidates[np.argsort(-values[candidates], kind="stable")]
+
+        return pd.DataFrame(
+            {
+                "역명": self.stations[top],
+                "승차총승객수": board[top].astype(np.int64),
+                "하차총승객수": alight[top].astype(np.int64),
+                "총승하차": (board[top] + alight[top]).astype(np.int64),
+            }
+        )
+
+    def line_league(self, line_idx: int) -> pd.DataFrame:
+        """호선 내 전체 역 순위표 (총 승차 인원 내림차순)"""
+        return (
+            self.line_rank.iloc[self.line_pairs(line_idx)]
+            .sort_values("승차 순위", kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def station_rank(self, station_idx: int) -> pd.DataFrame:
+        """역이 속한 모든 호선에서의 순위/백분위/등급 (호선 이름순)"""
+        return (
+            self.line_rank.iloc[self.station_pairs(station_idx)]
+            .sort_values("호선")
+            .reset_index(drop=True)
+        )
@@ -0,0 +1,139 @@
+"""
+역별 승하차 예측 (요일 효과 + 추세, 모든 역 한 번에 최소제곱)
+
+모든 역이 같은 설계 행렬을 쓴다.
+    y(t) = 절편 + 추세 × t + 요일 효과(화~일, 월요일 기준) + 공휴일 효과
+
+- 역마다 데이터가 없는 날은 가중치 0 으로 빼고 정규방정식을 역 단위로 쌓아서
+  np.linalg.solve 한 번으로 모든 역의 계수를 구한다 (파이썬 반복문 없음).
+- 계수가 불안정해지지 않도록 절편을 뺀 계수에 작은 릿지(RIDGE)를 더함
+- 예측 구간: 학습 잔차 표준편차 × 1.96 (정규분포 95% 가정)
+"""
+import numpy as np
+import pandas as pd
+
+import korean_calendar
+
+RIDGE = 1e-3
+Z_95 = 1.96
+
+
+def design_matrix(days: np.ndarray, origin: np.datetime64, span: int) -> np.ndarray:
+    """
+    날짜 배열(datetime64[D]) → [일자, 특징] 행렬
+    특징: 절편, 추세(t / span), 요일 더미 6개(화~일), 공휴일 더미
+    """
+    days = np.asarray(days, dtype="datetime64[D]")
+    t = (days - origin).astype(np.int64) / max(span, 1)
+    weekday = (days.astype(np.int64) + 3) % 7  # 0=월요일
+    holiday = korean_calendar.build_calendar(days)["공휴일"].to_numpy()
+    columns = [np.ones(len(days)), t]
+    columns += [(weekday == k).astype(np.float64) for k in range(1, 7)]
+    columns.append(holiday.astype(np.float64))
+    return np.column_stack(columns)
+
+
+FEATURES = ["절편", "추세"] + [f"{name}요일" for name in korean_calendar.WEEKDAY_NAMES[1:]] + ["공휴일"]
+
+
+class StationForecast:
+    def __init__(self, cube):
+        """cube: subway_cube.RidershipCube (역 × 일자 누적합 사용)"""
+        self.stations = cube.stations
+        self.station_index = cube.station_index
+        self.days = cube.days
+        self.origin = cube.days[0]
+        self.span = len(cube.days)
+
+        board = np.diff(cube.board_cum, axis=0).astype(np.float64)     # [일자, 역]
+        alight = np.diff(cube.alight_cum, axis=0).astype(np.float64)
+        weight = (np.diff(cube.rows_cum, axis=0) > 0).astype(np.float64)
+
+        self.x = design_matrix(self.days, self.origin, self.span)       # [일자, 특징]
+        y = np.stack([board, alight], axis=-1)                          # [일자, 역, 승/하차]
+
+        # 역별 정규방정식 (XᵀWX) β = XᵀWy 를 한 번에 쌓아서 풂
+        xtwx = np.einsum("dp,ds,dq->spq", self.x, weight, self.x)
+        penalty = np.eye(self.x.shape[1]) * RIDGE * np.maximum(weight.sum(axis=0), 1)[:, None, None]
+        penalty[:, 0, 0] = 0
+        xtwy = np.einsum("dp,ds,dsk->spk", self.x, weight, y)
+        self.coef = np.linalg.solve(xtwx + penalty + np.eye(self.x.shape[1]) * 1e-9, xtwy)  # [역, 특징, 승/하차]
+
+        # 학습 구간 잔차 → 예측 구간 폭, 평균 절대 백분율 오차
+        fitted = np.einsum("dp,spk->dsk", self.x, self.coef)
+        resid = (y - fitted) * weight[..., None]
+        n = np.maximum(weight.sum(axis=0), 1)[:, None]
+        dof = np.maximum(n - self.x.shape[1], 1)
+        self.sigma = np.sqrt((resid ** 2).sum(axis=0) / dof)            # [역, 승/하차]
+        # 승차+하차 합계의 폭은 합계 잔차로 계산 (두 잔차는 같은 방향으로 움직여 독립 가정이면 너무 좁음)
+        self.sigma_total = np.sqrt((resid.sum(axis=-1) ** 2).sum(axis=0) / dof[:, 0])  # [역]
+        total = y.sum(axis=-1)
+        scored = (weight > 0) & (total > 0)
+        ape = np.abs(resid.sum(axis=-1)) / np.where(scored, total, 1)
+        count = scored.sum(axis=0)
+        self.mape = np.where(count > 0, np.where(scored, ape, 0).sum(axis=0) / np.maximum(count, 1) * 100, np.nan)
+
+        self.fitted = fitted.astype(np.float32)
+        self.actual = np.where(weight > 0, total, np.nan).astype(np.float32)  # [일자, 역]
+
+    def future_days(self, horizon: int) -> np.ndarray:
+        """마지막 데이터 다음 날부터 horizon 일"""
+        return self.days[-1] + np.arange(1, horizon + 1)
+
+    def predict(self, days: np.ndarray) -> np.ndarray:
+        """날짜 배열에 대한 모든 역 예측 [일자, 역, 승/하차] (음수는 0)"""
+        x = design_matrix(days, self.origin, self.span)
+        return np.clip(np.einsum("dp,spk->dsk", x, self.coef), 0, None)
+
+    def table(self, horizon: int = 7) -> pd.DataFrame:
+        """모든 역의 다음 날 / 향후 horizon 일 합계 예측 (향후 합계 내림차순)"""
+        pred = self.predict(self.future_days(horizon)).sum(axis=-1)    # [일자, 역]
+        last_week = np.nansum(self.actual[-7:], axis=0, dtype=np.float64)
+        out = pd.DataFrame(
+            {
+                "역명": self.stations,
+                "다음 날 예측": pred[0].round(0).astype(np.int64),
+                f"향후 {horizon}일 합계 예측": pred.sum(axis=0).round(0).astype(np.int64),
+                "최근 7일 실제 합계": np.round(last_week).astype(np.int64),
+                "학습 오차(MAPE %)": np.round(self.mape, 1),
+            }
+        )
+        return out.sort_values(f"향후 {horizon}일 합계 예측", ascending=False, kind="stable").reset_index(drop=True)
+
+    def station_frame(self, station_idx: int, horizon: int = 7) -> pd.DataFrame:
+        """한 역의 실제값·적합값(학습 기간) + 향후 예측과 95% 구간 (승차+하차 합계, 긴 형식)"""
+        future = self.future_days(horizon)
+        pred = self.predict(future)[:, station_idx].sum(axis=-1)
+        sigma = float(self.sigma_total[station_idx])
+        fitted = self.fitted[:, station_idx].sum(axis=-1)
+
+        history = [
+            pd.DataFrame(
+                {
+                    "날짜": self.days.astype(object),
+                    "구분": label,
+                    "인원": values.round(0),
+                    "하한": np.nan,
+                    "상한": np.nan,
+                }
+            )
+            for label, values in (("실제", self.actual[:, station_idx]), ("적합", fitted))
+        ]
+        forecast = pd.DataFrame(
+            {
+                "날짜": future.astype(object),
+                "구분": "예측",
+                "인원": pred.round(0),
+                "하한": np.clip(pred - Z_95 * sigma, 0, None).round(0),
+                "상한": (pred + Z_95 * sigma).round(0),
+            }
+        )
+        return pd.concat(history + [forecast], ignore_index=True)
+
+    def coef_table(self, station_idx: int) -> pd.DataFrame:
+        """한 역의 계수 (승차/하차)"""
+        return pd.DataFrame(
+            self.coef[station_idx].round(1),
+            index=pd.Index(FEATURES, name="항목"),
+            columns=["승차", "하차"],
+        )
@@ -0,0 +1,206 @@
+"""
+지하철 시간대별 승하차 큐브 (일자 × 역 × 시)
+
+시간대별 원본(역-일마다 승차 24칸, 하차 24칸)은 일별 원본보다 20배 이상 커서
+화면에서 매번 프레임을 묶지 않고, 로딩 시 한 번 정수 배열과 집계표를 만들어 둔다.
+
+- board / alight   : [일자, 역, 시] int32 (일자 축이 맨 앞 → 기간 슬라이스가 연속 메모리)
+- present          : [일자, 역] 그 역-일에 행이 있었는지
+- month_type_*     : [월, 일유형, 역, 시] 합계 / [월, 일유형, 역] 일수
+- network_hour_*   : [일자, 시] 전체 역 합계 (일자 × 시 히트맵용)
+
+임의 기간 합계 = 기간 안에 통째로 들어가는 달은 월 집계표, 양 끝 자투리 일자만 원본 배열.
+1년치를 조회해도 원본 배열은 최대 두 달 남짓만 더한다.
+"""
+import numpy as np
+import pandas as pd
+
+import korean_calendar
+from subway_cube import _encode
+from subway_store import ALIGHT_HOURLY, BOARD_HOURLY, HOURS
+
+# 화면 표시 순서: 첫차 시간대(04시)부터 다음 날 03시까지
+DISPLAY_HOURS = HOURS[4:] + HOURS[:4]
+HOUR_LABELS = [f"{h:02d}시" for h in HOURS]
+
+METRICS = {
+    "승하차 합계": "총승하차",
+    "승차": "승차",
+    "하차": "하차",
+}
+
+
+class HourlyCube:
+    def __init__(self, df: pd.DataFrame, station_aliases: dict = None):
+        """
+        df: subway_store.compact_hourly_frame 형식
+            (day, 노선명, 역명, 승차_00 ~ 승차_23, 하차_00 ~ 하차_23)
+        station_aliases: {원래 역명: 대표 역명} (환승역 통합, RidershipCube 와 동일)
+        """
+        day_values, day_codes = np.unique(df["day"].to_numpy(), return_inverse=True)
+        station_codes, stations = _encode(df["역명"], station_aliases)
+
+        n_days, n_stations, n_hours = len(day_values), len(stations), len(HOURS)
+        self.days = day_values.astype(np.int64).astype("datetime64[D]")
+        self.stations = np.asarray(stations, dtype=object)
+        self._station_index = {name: i for i, name in enumerate(self.stations)}
+
+        # 같은 (일자, 역)이 여러 행이면(여러 호선) 합산
+        flat = day_codes.astype(np.int64) * n_stations + station_codes
+        size = n_days * n_stations
+        self.board = self._accumulate(flat, df[BOARD_HOURLY].to_numpy(), size).reshape(n_days, n_stations, n_hours)
+        self.alight = self._accumulate(flat, df[ALIGHT_HOURLY].to_numpy(), size).reshape(n_days, n_stations, n_hours)
+        self.present = (np.bincount(flat, minlength=size) > 0).reshape(n_days, n_stations)
+
+        # 달력 (일유형 코드: 0=평일, 1=주말, 2=공휴일)
+        self.calendar = korean_calendar.build_calendar(self.days)
+        self.day_type = self.calendar["일유형"].cat.codes.to_numpy()
+
+        # 월 경계: month_start[m] ~ month_start[m+1] 이 m번째 달의 일자 코드 범위
+        months = self.days.astype("datetime64[M]")
+        self.months = np.unique(months)
+        self.month_start = np.searchsorted(months, self.months).tolist() + [n_days]
+
+        # 월 × 일유형 집계표
+        n_months, n_types = len(self.months), len(korean_calendar.DAY_TYPES)
+        self.month_type_board = np.zeros((n_months, n_types, n_stations, n_hours), dtype=np.int64)
+        self.month_type_alight = np.zeros_like(self.month_type_board)
+        self.month_type_days = np.zeros((n_months, n_types, n_stations), dtype=np.int32)
+        for m in range(n_months):
+            a, b = self.month_start[m], self.month_start[m + 1]
+            for t in range(n_types):
+                sel = np.flatnonzero(self.day_type[a:b] == t) + a
+                if len(sel):
+                    self.month_type_board[m, t] = self.board[sel].sum(axis=0, dtype=np.int64)
+                    self.month_type_alight[m, t] = self.alight[sel].sum(axis=0, dtype=np.int64)
+                    self.month_type_days[m, t] = self.present[sel].sum(axis=0)
+
+        # 전체 역 합계 [일자, 시]
+        self.network_hour_board = self.board.sum(axis=1, dtype=np.int64)
+        self.network_hour_alight = self.alight.sum(axis=1, dtype=np.int64)
+
+    @staticmethod
+    def _accumulate(flat: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+        """[행, 시] 값을 flat 코드별로 합산 → [size, 시] int32"""
+        out = np.empty((size, values.shape[1]), dtype=np.int32)
+        for h in range(values.shape[1]):
+            out[:, h] = np.bincount(flat, weights=values[:, h], minlength=size)
+        return out
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [
+            self.board, self.alight, self.present,
+            self.month_type_board, self.month_type_alight, self.month_type_days,
+            self.network_hour_board, self.network_hour_alight,
+        ]
+        return sum(a.nbytes for a in arrays)
+
+    def station_index(self, name: str) -> int:
+        return self._station_index[name]
+
+    def range_index(self, start, end) -> tuple:
+        """start~end(양끝 포함) 날짜 → 일자 코드 구간 [lo, hi)"""
+        lo = int(np.searchsorted(self.days, np.datetime64(start, "D"), side="left"))
+        hi = int(np.searchsorted(self.days, np.datetime64(end, "D"), side="right"))
+        return lo, hi
+
+    def range_sum(self, lo: int, hi: int, day_type: int = None) -> tuple:
+        """
+        일자 코드 [lo, hi) 의 역 × 시 합계.
+        day_type 을 주면 그 일유형(0=평일, 1=주말, 2=공휴일) 날만.
+        반환값: (승차 [역, 시] int64, 하차 [역, 시] int64, 역별 일수 [역])
+        """
+        types = list(range(len(korean_calendar.DAY_TYPES))) if day_type is None else [day_type]
+        n_stations, n_hours = self.board.shape[1:]
+        board = np.zeros((n_stations, n_hours), dtype=np.int64)
+        alight = np.zeros_like(board)
+        days = np.zeros(n_stations, dtype=np.int64)
+
+        # 통째로 들어가는 달: month_start[m_lo] >= lo, month_start[m_hi] <= hi
+        m_lo = int(np.searchsorted(self.month_start, lo, side="left"))
+        m_hi = int(np.searchsorted(self.month_start, hi, side="right")) - 1
+        if m_lo < m_hi:
+            board += self.month_type_board[m_lo:m_hi, types].sum(axis=(0, 1))
+            alight += self.month_type_alight[m_lo:m_hi, types].sum(axis=(0, 1))
+            days += self.month_type_days[m_lo:m_hi, types].sum(axis=(0, 1))
+            edges = [(lo, self.month_start[m_lo]), (self.month_start[m_hi], hi)]
+        else:
+            edges = [(lo, hi)]
+
+        # 양 끝 자투리 일자
+        for a, b in edges:
+            if a >= b:
+                continue
+            sel = np.flatnonzero(np.isin(self.day_type[a:b], types)) + a
+            if len(sel):
+                board += self.board[sel].sum(axis=0, dtype=np.int64)
+                alight += self.alight[sel].sum(axis=0, dtype=np.int64)
+                days += self.present[sel].sum(axis=0)
+        return board, alight, days
+
+    def _metric(self, board: np.ndarray, alight: np.ndarray, metric: str) -> np.ndarray:
+        return {"승차": board, "하차": alight, "총승하차": board + alight}[metric]
+
+    def station_hour(self, lo: int, hi: int, metric: str = "총승하차", day_type: int = None) -> pd.DataFrame:
+        """역 × 시 일평균 인원표 (열은 DISPLAY_HOURS 순서, 데이터 없는 역 제외)"""
+        board, alight, days = self.range_sum(lo, hi, day_type)
+        values = self._metric(board, alight, metric)
+        keep = days > 0
+        avg = values[keep] / days[keep, None]
+        return pd.DataFrame(
+            avg[:, DISPLAY_HOURS].round(0).astype(np.int64),
+            index=pd.Index(self.stations[keep], name="역명"),
+            columns=[HOUR_LABELS[h] for h in DISPLAY_HOURS],
+        )
+
+    def heatmap(
+        self, lo: int, hi: int, metric: str = "총승하차", day_type: int = None, top_n: int = 30, share: bool = False
+    ) -> pd.DataFrame:
+        """
+        일평균 인원 상위 top_n 개 역의 역 × 시 표.
+        share=True 이면 역마다 하루 합계 대비 시간대 비율(%)로 바꿔서 규모가 다른 역의 패턴 비교.
+        """
+        table = self.station_hour(lo, hi, metric, day_type)
+        total = table.to_numpy().sum(axis=1)
+        top_n = min(top_n, len(table))
+        if top_n == 0:
+            return table
+        top = np.argpartition(-total, top_n - 1)[:top_n]
+        top = top[np.argsort(-total[top], kind="stable")]
+        table = table.iloc[top]
+        if share:
+            sums = table.to_numpy().sum(axis=1, keepdims=True)
+            table = pd.DataFrame(
+                np.where(sums > 0, table.to_numpy() / np.maximum(sums, 1) * 100, 0).round(1),
+                index=table.index,
+                columns=table.columns,
+            )
+        return table
+
+    def peak_table(self, lo: int, hi: int, metric: str = "총승하차", day_type: int = None) -> pd.DataFrame:
+        """역별 가장 붐비는 시간대와 그 시간대 일평균 인원 / 하루 중 비율"""
+        table = self.station_hour(lo, hi, metric, day_type)
+        values = table.to_numpy()
+        peak = values.argmax(axis=1) if len(values) else np.array([], dtype=np.int64)
+        peak_value = values[np.arange(len(values)), peak]
+        total = values.sum(axis=1)
+        out = pd.DataFrame(
+            {
+                "역명": table.index,
+                "피크 시간대": table.columns.to_numpy()[peak],
+                "피크 일평균 인원": peak_value,
+                "하루 일평균 인원": total,
+                "피크 비율(%)": np.where(total > 0, peak_value / np.maximum(total, 1) * 100, 0).round(1),
+            }
+        )
+        return out.sort_values("피크 일평균 인원", ascending=False, kind="stable").reset_index(drop=True)
+
+    def network_heatmap(self, lo: int, hi: int, metric: str = "총승하차") -> pd.DataFrame:
+        """전체 역 합계의 날짜 × 시 표 (1년치도 365 × 24 칸)"""
+        values = self._metric(self.network_hour_board[lo:hi], self.network_hour_alight[lo:hi], metric)
+        return pd.DataFrame(
+            values[:, DISPLAY_HOURS],
+            index=pd.Index(self.days[lo:hi].astype(object), name="날짜"),
+            columns=[HOUR_LABELS[h] for h in DISPLAY_HOURS],
+        )
@@ -0,0 +1,406 @@
+"""
+지하철 승하차 실시간 피드 집계
+
+운영사 피드 대신 아래 두 가지로 일별 승하차 행을 받는다.
+    (1) 뒤에 계속 행이 붙는 CSV 파일 (첫 줄 헤더, 추가된 줄만 읽음)
+    (2) 로컬 TCP 소켓 (한 줄 = 사용일자,노선명,역명,승차총승객수,하차총승객수)
+
+- 수집 스레드는 새 행을 크기 제한 큐(QUEUE_SIZE)에 넣는다. 큐가 차면 수집이 멈추고
+  (파일은 읽던 위치에서 대기, 소켓은 TCP 흐름 제어) 행을 버리지 않는다.
+- 화면에서 drain() 으로 큐를 비우면서 누적 합계/일수만 갱신한다 (전체 CSV 재집계 없음).
+  역마다 월초/월중/월말 구간별 합계/일수도 함께 누적해 구간 평균을 바로 조회한다.
+- 이미 집계된 (일자, 호선, 역) 행은 건너뜀 (저장소와 같은 규칙, 재시작해도 중복 없음)
+- version 은 집계가 바뀔 때만 올라가므로 화면은 version 이 바뀔 때만 다시 그린다.
+"""
+import csv
+import pathlib
+import queue
+import socketserver
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from subway_store import COLUMNS
+
+QUEUE_SIZE = 10_000      # 수집 큐 최대 행 수
+DRAIN_BATCH = 50_000     # drain() 한 번에 꺼내는 최대 행 수
+POLL_SECONDS = 1.0       # 파일 끝에서 새 줄을 기다리는 간격
+
+# 월초 / 월중 / 월말 구간 (이름, 첫 일자, 끝 일자) — 지하철 분석 화면과 같은 구분
+PERIODS = [
+    ("월초 (1~10일)", 1, 10),
+    ("월중 (11~20일)", 11, 20),
+    ("월말 (21~말일)", 21, 31),
+]
+
+
+def parse_row(fields: list, positions: list):
+    """CSV 필드 → (사용일자, 노선명, 역명, 승차, 하차). 형식이 틀리면 None"""
+    try:
+        ymd, line, station, board, alight = (fields[p] for p in positions)
+        return (
+            int(ymd),
+            line.strip(),
+            station.strip(),
+            int(str(board).replace(",", "")),
+            int(str(alight).replace(",", "")),
+        )
+    except (IndexError, ValueError):
+        return None
+
+
+def period_of(ymd: int) -> int:
+    """사용일자(YYYYMMDD) → PERIODS 번호"""
+    day = ymd % 100
+    for i, (_, _, last_day) in enumerate(PERIODS):
+        if day <= last_day:
+            return i
+    return len(PERIODS) - 1
+
+
+def _grow(values: np.ndarray, size: int) -> np.ndarray:
+    """size 개가 들어가도록 배열을 두 배씩 늘림"""
+    if size <= len(values):
+        return values
+    out = np.zeros(max(size, len(values) * 2), dtype=values.dtype)
+    out[:len(values)] = values
+    return out
+
+
+class LiveAggregates:
+    def __init__(self, station_aliases: dict = None):
+        """station_aliases: {원래 역명: 대표 역명} (환승역 통합, RidershipCube 와 동일)"""
+        self.aliases = dict(station_aliases or {})
+
+        # (호선, 역) 조합 / 역 코드 사전 (새 이름이 오면 코드를 뒤에 추가)
+        self._pair_index = {}
+        self._station_index = {}
+        self.pair_line = []
+        self.pair_station = []
+        self.stations = []
+
+        # 누적 합계 / 일수 (코드 순서, 필요할 때 두 배씩 늘림)
+        self._pair_board = np.zeros(64, dtype=np.int64)
+        self._pair_alight = np.zeros(64, dtype=np.int64)
+        self._station_board = np.zeros(64, dtype=np.int64)
+        self._station_alight = np.zeros(64, dtype=np.int64)
+        self._station_days = np.zeros(64, dtype=np.int64)
+
+        # 역 × 구간(월초/월중/월말) 누적 합계 / 일수 (역 코드 × len(PERIODS) + 구간 번호)
+        self._period_board = np.zeros(64 * len(PERIODS), dtype=np.int64)
+        self._period_alight = np.zeros(64 * len(PERIODS), dtype=np.int64)
+        self._period_days = np.zeros(64 * len(PERIODS), dtype=np.int64)
+
+        self._seen_pair_days = set()     # (사용일자, 조합 코드)
+        self._seen_station_days = set()  # (사용일자, 역 코드)
+        self.day_totals = {}             # 사용일자 → [승차, 하차]
+
+        self.n_rows = 0
+        self.n_duplicates = 0
+        self.version = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cube(cls, cube, station_aliases: dict = None) -> "LiveAggregates":
+        """저장소 큐브(subway_cube.RidershipCube)의 합계로 시작값을 채움"""
+        agg = cls(station_aliases)
+        ymd = [d.year * 10000 + d.month * 100 + d.day for d in cube.dates]
+        day_idx, pair_idx = np.nonzero(cube.present)
+        rows = [
+            (ymd[d], cube.lines[cube.pair_line[p]], cube.stations[cube.pair_station[p]],
+             int(cube.board[d, p]), int(cube.alight[d, p]))
+            for d, p in zip(day_idx, pair_idx)
+        ]
+        agg.add_rows(rows)
+        return agg
+
+    def _pair_code(self, line: str, station: str) -> int:
+        key = (line, station)
+        code = self._pair_index.get(key)
+        if code is None:
+            code = self._pair_index[key] = len(self.pair_line)
+            self.pair_line.append(line)
+            self.pair_station.append(station)
+        return code
+
+    def _station_code(self, station: str) -> int:
+        code = self._station_index.get(station)
+        if code is None:
+            code = self._station_index[station] = len(self.stations)
+            self.stations.append(station)
+        return code
+
+    def add_rows(self, rows: list) -> int:
+        """(사용일자, 노선명, 역명, 승차, 하차) 행들을 누적. 반환값: 실제로 반영한 행 수"""
+        pair_codes, station_codes, period_codes, board, alight = [], [], [], [], []
+        new_station_day, new_period_day = [], []
+        with self._lock:
+            for ymd, line, station, b, a in rows:
+                station = self.aliases.get(station, station)
+                pc = self._pair_code(line, station)
+                if (ymd, pc) in self._seen_pair_days:
+                    self.n_duplicates += 1
+                    continue
+                self._seen_pair_days.add((ymd, pc))
+
+                sc = self._station_code(station)
+                period_code = sc * len(PERIODS) + period_of(ymd)
+                if (ymd, sc) not in self._seen_station_days:
+                    self._seen_station_days.add((ymd, sc))
+                    new_station_day.append(sc)
+                    new_period_day.append(period_code)
+
+                total = self.day_totals.setdefault(ymd, [0, 0])
+                total[0] += b
+                total[1] += a
+                pair_codes.append(pc)
+                station_codes.append(sc)
+                period_codes.append(period_code)
+                board.append(b)
+                alight.append(a)
+
+            if not pair_codes:
+                return 0
+
+            n_pairs, n_stations = len(self.pair_line), len(self.stations)
+            self._pair_board = _grow(self._pair_board, n_pairs)
+            self._pair_alight = _grow(self._pair_alight, n_pairs)
+            self._station_board = _grow(self._station_board, n_stations)
+            self._station_alight = _grow(self._station_alight, n_stations)
+            self._station_days = _grow(self._station_days, n_stations)
+            self._period_board = _grow(self._period_board, n_stations * len(PERIODS))
+            self._period_alight = _grow(self._period_alight, n_stations * len(PERIODS))
+            self._period_days = _grow(self._period_days, n_stations * len(PERIODS))
+
+            np.add.at(self._pair_board, pair_codes, board)
+            np.add.at(self._pair_alight, pair_codes, alight)
+            np.add.at(self._station_board, station_codes, board)
+            np.add.at(self._station_alight, station_codes, alight)
+            np.add.at(self._station_days, new_station_day, 1)
+            np.add.at(self._period_board, period_codes, board)
+            np.add.at(self._period_alight, period_codes, alight)
+            np.add.at(self._period_days, new_period_day, 1)
+
+            self.n_rows += len(pair_codes)
+            self.version += 1
+            return len(pair_codes)
+
+    # ---------------------------
+    # 조회 (누적값 스냅샷)
+    # ---------------------------
+    @property
+    def last_day(self):
+        return max(self.day_totals) if self.day_totals else None
+
+    @property
+    def lines(self) -> list:
+        return sorted(set(self.pair_line))
+
+    def station_totals(self) -> pd.DataFrame:
+        """역별 누적 합계와 일평균 (총승하차 내림차순)"""
+        with self._lock:
+            n = len(self.stations)
+            board = self._station_board[:n].copy()
+            alight = self._station_alight[:n].copy()
+            days = self._station_days[:n].copy()
+            names = list(self.stations)
+        total = board + alight
+        out = pd.DataFrame(
+            {
+                "역명": names,
+                "승차총승객수": board,
+                "하차총승객수": alight,
+                "총승하차": total,
+                "일수": days,
+                "일평균 승하차": np.where(days > 0, total / np.maximum(days, 1), 0).round(0).astype(np.int64),
+            }
+        )
+        return out.sort_values("총승하차", ascending=False, kind="stable").reset_index(drop=True)
+
+    def line_ranking(self, line: str) -> pd.DataFrame:
+        """호선 내 역별 누적 합계 순위"""
+        with self._lock:
+            n = len(self.pair_line)
+            codes = [i for i in range(n) if self.pair_line[i] == line]
+            board = self._pair_board[codes].copy()
+            alight = self._pair_alight[codes].copy()
+            names = [self.pair_station[i] for i in codes]
+        out = pd.DataFrame(
+            {
+                "역명": names,
+                "승차총승객수": board,
+                "하차총승객수": alight,
+                "총승하차": board + alight,
+            }
+        )
+        out = out.sort_values("총승하차", ascending=False, kind="stable").reset_index(drop=True)
+        out.insert(0, "순위", out["총승하차"].rank(method="min", ascending=False).astype(int))
+        return out
+
+    def period_averages(self, station: str) -> pd.DataFrame:
+        """역의 월초/월중/월말 구간별 일평균 승·하차 (누적 합계 / 구간 일수). index: 기간구분"""
+        station = self.aliases.get(station, station)
+        with self._lock:
+            sc = self._station_index.get(station)
+            if sc is None:
+                board = alight = days = np.zeros(len(PERIODS), dtype=np.int64)
+            else:
+                cells = slice(sc * len(PERIODS), (sc + 1) * len(PERIODS))
+                board = self._period_board[cells].copy()
+                alight = self._period_alight[cells].copy()
+                days = self._period_days[cells].copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = pd.DataFrame(
+                {
+                    "기간구분": [label for label, _, _ in PERIODS],
+                    "승차 평균": np.where(days > 0, board / days, np.nan),
+                    "하차 평균": np.where(days > 0, alight / days, np.nan),
+                    "일수": days,
+                }
+            )
+        return out.set_index("기간구분").round(1)
+
+    def daily_totals(self) -> pd.DataFrame:
+        """일자별 전체 승하차 합계 (날짜순)"""
+        with self._lock:
+            items = sorted(self.day_totals.items())
+        return pd.DataFrame(
+            {
+                "날짜": pd.to_datetime([ymd for ymd, _ in items], format="%Y%m%d"),
+                "승차총승객수": [total[0] for _, total in items],
+                "하차총승객수": [total[1] for _, total in items],
+            }
+        )
+
+
+class ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    """포트 재사용을 켠 서버 (표준 라이브러리 클래스 설정은 건드리지 않음)"""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class LiveFeed:
+    def __init__(self, aggregates: LiveAggregates, queue_size: int = QUEUE_SIZE):
+        self.aggregates = aggregates
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.n_rejected = 0
+        self.source = ""
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _put(self, row) -> bool:
+        """큐가 차면 자리가 날 때까지 대기 (멈춤 요청이 오면 False)"""
+        while not self._stop.is_set():
+            try:
+                self.queue.put(row, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(self, max_rows: int = DRAIN_BATCH) -> int:
+        """큐에 쌓인 행을 꺼내서 집계에 반영. 반환값: 반영한 행 수"""
+        rows = []
+        while len(rows) < max_rows:
+            try:
+                rows.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return self.aggregates.add_rows(rows) if rows else 0
+
+    # ---------------------------
+    # 수집: 파일 꼬리 읽기
+    # ---------------------------
+    def start_file(self, path, encoding: str = "utf-8", poll: float = POLL_SECONDS) -> None:
+        """path 에 새로 붙는 줄을 계속 읽어서 큐에 넣는 스레드 시작"""
+        if self.running:
+            return
+        self._reset()
+        self.source = f"파일: {path}"
+        self._thread = threading.Thread(
+            target=self._tail_file, args=(pathlib.Path(path), encoding, poll), daemon=True
+        )
+        self._thread.start()
+
+    def _tail_file(self, path: pathlib.Path, encoding: str, poll: float) -> None:
+        positions = None
+        offset = 0
+        while not self._stop.is_set():
+            if not path.exists():
+                time.sleep(poll)
+                continue
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while not self._stop.is_set():
+                    raw = f.readline()
+                    if not raw.endswith(b"\n"):
+                        # 아직 다 쓰이지 않은 줄은 다음에 다시 읽음
+                        f.seek(offset)
+                        break
+                    offset += len(raw)
+                    fields = next(csv.reader([raw.decode(encoding, errors="replace").lstrip("\ufeff")]), [])
+                    if positions is None:
+                        # 첫 줄 헤더에서 컬럼 위치를 찾음 (헤더가 아니면 기본 순서)
+                        if all(c in fields for c in COLUMNS):
+                            positions = [fields.index(c) for c in COLUMNS]
+                            continue
+                        positions = list(range(len(COLUMNS)))
+                    row = parse_row(fields, positions)
+                    if row is None:
+                        self.n_rejected += 1
+                    elif not self._put(row):
+                        return
+            time.sleep(poll)
+
+    # ---------------------------
+    # 수집: 로컬 소켓
+    # ---------------------------
+    def start_socket(self, host: str = "127.0.0.1", port: int = 9099) -> None:
+        """host:port 로 접속한 클라이언트가 보내는 줄을 큐에 넣는 서버 시작"""
+        if self.running:
+            return
+        self._reset()
+        feed = self
+        positions = list(range(len(COLUMNS)))
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    fields = next(csv.reader([raw.decode("utf-8", errors="replace").lstrip("\ufeff")]), [])
+                    if not fields or fields[:len(COLUMNS)] == COLUMNS:
+                        continue  # 빈 줄 / 헤더
+                    row = parse_row(fields, positions)
+                    if row is None:
+                        feed.n_rejected += 1
+                    elif not feed._put(row):
+                        return
+
+        self._server = ThreadingTCPServer((host, port), Handler)
+        self.source = f"소켓: {host}:{port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def _reset(self) -> None:
+        """멈춘 피드를 다시 시작할 수 있도록 상태 초기화 (큐·집계는 유지)"""
+        self._stop.clear()
+        self._thread = None
+        self._server = None
+
+    def stop(self, timeout: float = POLL_SECONDS + 1.0) -> None:
+        """수집 스레드/서버를 멈추고 끝날 때까지 기다림 (이후 start_* 로 다시 시작 가능)"""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,142 @@
+"""
+역별 일자 승하차 패턴 유사도 / 군집
+
+- 역마다 [승차 일자별 값, 하차 일자별 값] 을 자기 평균으로 나눈 '모양' 벡터를 만들고
+  (규모가 아닌 패턴 비교), 중심화 + 길이 1로 정규화
+- 유사도 행렬 = 정규화 벡터끼리의 내적 (코사인 유사도, 모든 역 한 번에)
+- k-means(numpy) 로 군집을 나누고, 군집 중심의 특징으로 이름을 붙임
+    · 이벤트형: 특정 날에 튀는 정도(최대/중앙값)가 가장 큰 군집
+    · 여가형  : 주말·공휴일 / 평일 비율이 가장 큰 군집
+    · 출퇴근형: 나머지 (평일에 많은 역)
+"""
+import numpy as np
+import pandas as pd
+
+
+def _kmeans(x: np.ndarray, k: int, seed: int = 0, n_iter: int = 50) -> np.ndarray:
+    """k-means++ 초기화 + Lloyd 반복 (모든 점 × 중심 거리를 행렬 연산으로)"""
+    n = len(x)
+    k = min(k, n)
+    rng = np.random.default_rng(seed)
+
+    centers = [x[rng.integers(n)]]
+    for _ in range(1, k):
+        d2 = np.min(((x[:, None, :] - np.asarray(centers)[None]) ** 2).sum(-1), axis=1)
+        prob = d2 / d2.sum() if d2.sum() > 0 else np.full(n, 1 / n)
+        centers.append(x[rng.choice(n, p=prob)])
+    centers = np.asarray(centers)
+
+    labels = np.zeros(n, dtype=np.int64)
+    for it in range(n_iter):
+        # |x - c|^2 = |x|^2 - 2 x·c + |c|^2
+        dist = (x ** 2).sum(1)[:, None] - 2 * x @ centers.T + (centers ** 2).sum(1)[None]
+        new_labels = dist.argmin(axis=1)
+        if it > 0 and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for c in range(k):
+            members = labels == c
+            if members.any():
+                centers[c] = x[members].mean(axis=0)
+    return labels
+
+
+class StationProfiles:
+    def __init__(self, cube, n_clusters: int = 3, seed: int = 0):
+        """cube: subway_cube.RidershipCube"""
+        self.stations = cube.stations
+        self.days = cube.days
+
+        board = np.diff(cube.board_cum, axis=0).T.astype(np.float64)   # [역, 일자]
+        alight = np.diff(cube.alight_cum, axis=0).T.astype(np.float64)
+        has_data = (np.diff(cube.rows_cum, axis=0) > 0).T
+
+        # 자기 평균 대비 비율 (데이터 없는 날은 평균 = 1.0 으로 채움)
+        def shape(values):
+            n = has_data.sum(axis=1, keepdims=True)
+            mean = np.where(n > 0, np.where(has_data, values, 0).sum(axis=1, keepdims=True) / np.maximum(n, 1), 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(mean > 0, values / mean, 1.0)
+            return np.where(has_data, ratio, 1.0)
+
+        self.board_shape = shape(board).astype(np.float32)
+        self.alight_shape = shape(alight).astype(np.float32)
+
+        # 중심화 + 정규화 → 내적이 곧 상관계수 형태의 유사도
+        features = np.hstack([self.board_shape, self.alight_shape]).astype(np.float64)
+        features -= features.mean(axis=1, keepdims=True)
+        norm = np.linalg.norm(features, axis=1, keepdims=True)
+        features = np.where(norm > 0, features / np.where(norm > 0, norm, 1), 0)
+        self.features = features.astype(np.float32)
+        self.similarity = self.features @ self.features.T
+
+        # 군집 + 이름 붙이기
+        self.labels = _kmeans(self.features.astype(np.float64), n_clusters, seed=seed)
+        self.cluster_names = self._name_clusters(cube)
+
+    def _name_clusters(self, cube) -> dict:
+        """군집 번호 → 이름 (군집 중심의 주말비율 / 튀는 정도로 판단)"""
+        total = self.board_shape + self.alight_shape
+        off_day = cube.day_type != 0  # 주말 + 공휴일
+        weekend_ratio = (
+            total[:, off_day].mean(axis=1) / np.maximum(total[:, ~off_day].mean(axis=1), 1e-9)
+            if off_day.any() and (~off_day).any()
+            else np.ones(len(total))
+        )
+        peak_ratio = total.max(axis=1) / np.maximum(np.median(total, axis=1), 1e-9)
+
+        clusters = sorted(set(self.labels.tolist()))
+        stats = {
+            c: (peak_ratio[self.labels == c].mean(), weekend_ratio[self.labels == c].mean())
+            for c in clusters
+        }
+
+        names = {}
+        remaining = list(clusters)
+        if len(remaining) >= 3:
+            event = max(remaining, key=lambda c: stats[c][0])
+            names[event] = "이벤트형"
+            remaining.remove(event)
+        if len(remaining) >= 2:
+            leisure = max(remaining, key=lambda c: stats[c][1])
+            names[leisure] = "여가형"
+            remaining.remove(leisure)
+        for i, c in enumerate(sorted(remaining, key=lambda c: stats[c][1])):
+            names[c] = "출퇴근형" if i == 0 else f"출퇴근형 {i + 1}"
+        return names
+
+    def cluster_of(self, station_idx: int) -> str:
+        return self.cluster_names[int(self.labels[station_idx])]
+
+    def similar(self, station_idx: int, k: int = 10) -> pd.DataFrame:
+        """이 역과 패턴이 비슷한 역 k개 (자기 자신 제외, 유사도 내림차순)"""
+        sim = self.similarity[station_idx].copy()
+        sim[station_idx] = -np.inf
+        k = min(k, len(sim) - 1)
+        if k <= 0:
+            return pd.DataFrame(columns=["역명", "유사도", "군집"])
+        top = np.argpartition(-sim, k - 1)[:k]
+        top = top[np.argsort(-sim[top], kind="stable")]
+        return pd.DataFrame(
+            {
+                "역명": self.stations[top],
+                "유사도": sim[top].round(3),
+                "군집": [self.cluster_names[int(c)] for c in self.labels[top]],
+            }
+        )
+
+    def cluster_table(self) -> pd.DataFrame:
+        """군집별 역 수와 대표 역 (각 군집 중심에 가까운 순 5개)"""
+        rows = []
+        for c, name in sorted(self.cluster_names.items(), key=lambda kv: kv[1]):
+            members = np.flatnonzero(self.labels == c)
+            center = self.features[members].mean(axis=0)
+            closest = members[np.argsort(-(self.features[members] @ center))[:5]]
+            rows.append(
+                {
+                    "군집": name,
+                    "역 수": len(members),
+                    "대표 역": ", ".join(self.stations[closest]),
+                }
+            )
+        return pd.DataFrame(rows)
@@ -0,0 +1,345 @@
+"""
+지하철 승하차 데이터 저장소 (월 단위 파티션 Parquet)
+
+원본 CSV(cp949)를 한 번만 파싱해서 아래와 같은 구조로 저장한다.
+
+    subway_store/
+        ym=202510/part-<해시>.parquet
+        ym=202511/part-<해시>.parquet
+        ...
+        hourly/ym=202510/part-<해시>.parquet   (시간대별 원본이 있을 때)
+
+- 새 달(또는 새 일자) 파일이 오면 해당 월 폴더에 파일을 하나 더 추가할 뿐,
+  기존 파티션은 다시 쓰지 않는다.
+- 페이지에서는 조회 기간에 걸치는 월 폴더만 읽는다.
+- 시간대별 CSV(시간대마다 승차/하차 컬럼)는 hourly/ 아래에 따로 저장하고,
+  일 합계는 시간대 합으로 만들어 일별 저장소에도 함께 넣는다.
+
+사용법 (터미널):
+    python subway_store.py subway.csv [추가 CSV ...] [--store 저장경로]
+"""
+import argparse
+import hashlib
+import pathlib
+import re
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = pathlib.Path(__file__).resolve().parent
+STORE_DIR = BASE_DIR / "subway_store"
+SOURCE_CSV = BASE_DIR / "subway.csv"
+
+HOURLY_STORE_DIR = STORE_DIR / "hourly"
+
+COLUMNS = ["사용일자", "노선명", "역명", "승차총승객수", "하차총승객수"]
+STORE_KEY = COLUMNS[:3]  # 한 행을 구분하는 키 (일자, 노선, 역)
+
+# 시간대별 저장 컬럼: 승차_00 ~ 승차_23, 하차_00 ~ 하차_23
+HOURS = list(range(24))
+BOARD_HOURLY = [f"승차_{h:02d}" for h in HOURS]
+ALIGHT_HOURLY = [f"하차_{h:02d}" for h in HOURS]
+HOURLY_COLUMNS = COLUMNS[:3] + BOARD_HOURLY + ALIGHT_HOURLY
+
+# 시간대별 원본의 컬럼 이름 (예: "07시-08시 승차인원") 과 다른 이름의 키 컬럼
+_HOUR_COLUMN = re.compile(r"^\s*(\d{1,2})\s*시.*(승차|하차)")
+_KEY_RENAMES = {"호선명": "노선명", "지하철역": "역명"}
+
+
+# ---------------------------
+# 원본 CSV 읽기
+# ---------------------------
+def _read_csv(csv_path) -> pd.DataFrame:
+    """인코딩은 cp949 → utf-8-sig 순서로 시도"""
+    for enc in ["cp949", "utf-8-sig"]:
+        try:
+            return pd.read_csv(csv_path, encoding=enc)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"{csv_path} 파일의 인코딩을 확인할 수 없습니다.")
+
+
+def _hour_columns(columns) -> dict:
+    """시간대별 원본 컬럼 → {(승차|하차, 시): 컬럼명}. 시간대 컬럼이 없으면 빈 사전"""
+    found = {}
+    for col in columns:
+        m = _HOUR_COLUMN.match(str(col))
+        if m:
+            found[(m.group(2), int(m.group(1)) % 24)] = col
+    return found
+
+
+def _to_int32(values: pd.Series) -> np.ndarray:
+    """숫자 또는 '1,234' 같은 문자열 → int32 (빈 값은 0)"""
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values.astype(str).str.replace(",", ""), errors="coerce")
+    return values.fillna(0).astype(np.int32).to_numpy()
+
+
+def _hourly_frame(df: pd.DataFrame, hour_cols: dict, csv_path) -> pd.DataFrame:
+    """시간대별 원본 → HOURLY_COLUMNS 형식 (없는 시간대는 0)"""
+    missing = [c for c in COLUMNS[:3] if c not in df.columns]
+    if missing:
+        raise ValueError(f"{csv_path} 에 필요한 컬럼이 없습니다: {missing}")
+
+    out = {
+        "사용일자": df["사용일자"].astype("int32").to_numpy(),
+        "노선명": df["노선명"].to_numpy(),
+        "역명": df["역명"].to_numpy(),
+    }
+    zeros = np.zeros(len(df), dtype=np.int32)
+    for kind, names in (("승차", BOARD_HOURLY), ("하차", ALIGHT_HOURLY)):
+        for h, name in zip(HOURS, names):
+            col = hour_cols.get((kind, h))
+            out[name] = zeros if col is None else _to_int32(df[col])
+    return pd.DataFrame(out, columns=HOURLY_COLUMNS)
+
+
+def read_source_csv(csv_path):
+    """
+    원본 CSV를 읽어서 저장용 컬럼/타입으로 정리.
+    반환값: (일별 프레임, 시간대별 프레임 또는 None)
+    - 일별 원본: 승차총승객수/하차총승객수 컬럼을 그대로 사용
+    - 시간대별 원본: 시간대 컬럼을 모아 두고, 일 합계는 시간대 합으로 계산
+    """
+    df = _read_csv(csv_path).rename(columns=_KEY_RENAMES)
+
+    hour_cols = _hour_columns(df.columns)
+    if hour_cols:
+        hourly = _hourly_frame(df, hour_cols, csv_path)
+        daily = hourly[COLUMNS[:3]].copy()
+        daily["승차총승객수"] = hourly[BOARD_HOURLY].to_numpy().sum(axis=1, dtype=np.int64).astype(np.int32)
+        daily["하차총승객수"] = hourly[ALIGHT_HOURLY].to_numpy().sum(axis=1, dtype=np.int64).astype(np.int32)
+        return daily, hourly
+
+    missing = [c for c in COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{csv_path} 에 필요한 컬럼이 없습니다: {missing}")
+
+    df = df[COLUMNS].copy()
+    df["사용일자"] = df["사용일자"].astype("int32")
+    df["승차총승객수"] = df["승차총승객수"].astype("int32")
+    df["하차총승객수"] = df["하차총승객수"].astype("int32")
+    return df, None
+
+
+# ---------------------------
+# 파티션 경로 유틸
+# ---------------------------
+def _month_dir(store_dir: pathlib.Path, ym: int) -> pathlib.Path:
+    return store_dir / f"ym={ym}"
+
+
+def _month_keys(start: date, end: date) -> list:
+    """start~end 사이에 걸치는 YYYYMM 목록"""
+    keys = []
+    y, m = start.year, start.month
+    while (y, m) <= (end.year, end.month):
+        keys.append(y * 100 + m)
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return keys
+
+
+def list_partitions(start: date, end: date, store_dir=STORE_DIR) -> list:
+    """조회 기간에 걸치는 월 폴더의 parquet 파일 목록"""
+    store_dir = pathlib.Path(store_dir)
+    files = []
+    for ym in _month_keys(start, end):
+        files.extend(sorted(_month_dir(store_dir, ym).glob("part-*.parquet")))
+    return files
+
+
+def available_months(store_dir=STORE_DIR) -> list:
+    """저장소에 들어있는 YYYYMM 목록 (오름차순)"""
+    store_dir = pathlib.Path(store_dir)
+    if not store_dir.exists():
+        return []
+    months = []
+    for p in store_dir.glob("ym=*"):
+        if any(p.glob("part-*.parquet")):
+            months.append(int(p.name.split("=", 1)[1]))
+    return sorted(months)
+
+
+def available_range(store_dir=STORE_DIR):
+    """저장소 전체 기간 (첫 달 1일, 마지막 달 말일). 비어 있으면 None"""
+    months = available_months(store_dir)
+    if not months:
+        return None
+    first = date(months[0] // 100, months[0] % 100, 1)
+    y, m = divmod(months[-1], 100)
+    next_month = date(y + 1, 1, 1) if m == 12 else date(y, m + 1, 1)
+    return first, date.fromordinal(next_month.toordinal() - 1)
+
+
+def store_version(store_dir=STORE_DIR) -> str:
+    """
+    저장소 상태를 나타내는 짧은 문자열.
+    파티션이 추가/변경되면 값이 바뀌므로 캐시 키로 사용.
+    """
+    store_dir = pathlib.Path(store_dir)
+    h = hashlib.sha1()
+    for p in sorted(store_dir.glob("ym=*/part-*.parquet")):
+        stat = p.stat()
+        h.update(f"{p.relative_to(store_dir)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return h.hexdigest()[:12]
+
+
+# ---------------------------
+# 적재 (append only)
+# ---------------------------
+def _append_partitions(df: pd.DataFrame, store_dir: pathlib.Path, columns: list) -> list:
+    """
+    프레임을 월별 파티션으로 나눠 새 part 파일로 추가.
+    - 이미 저장소에 있는 (사용일자, 노선명, 역명) 행은 건너뜀
+      (같은 파일을 두 번 넣어도 중복 없음, 같은 날짜의 다른 노선/역 파일은 추가됨)
+    - 기존 파티션 파일은 건드리지 않음
+    """
+    ym_values = df["사용일자"] // 100
+
+    written = []
+    for ym, part in df.groupby(ym_values, sort=True):
+        month_dir = _month_dir(store_dir, int(ym))
+        existing = sorted(month_dir.glob("part-*.parquet"))
+
+        # 이미 적재된 키는 제외 (키 컬럼만 읽음)
+        if existing:
+            loaded = pd.read_parquet(existing, columns=STORE_KEY)
+            loaded = pd.MultiIndex.from_frame(loaded.astype({"노선명": str, "역명": str}))
+            incoming = pd.MultiIndex.from_frame(part[STORE_KEY].astype({"노선명": str, "역명": str}))
+            part = part[~incoming.isin(loaded)]
+        if part.empty:
+            continue
+
+        part = part[columns].sort_values(STORE_KEY).reset_index(drop=True)
+        part["노선명"] = part["노선명"].astype("category")
+        part["역명"] = part["역명"].astype("category")
+
+        digest = hashlib.sha1(
+            pd.util.hash_pandas_object(part, index=False).values.tobytes()
+        ).hexdigest()[:12]
+        out_path = month_dir / f"part-{digest}.parquet"
+
+        # 임시 파일에 쓴 뒤 이름 변경 → 읽는 쪽에서 반쯤 쓰인 파일을 보지 않도록
+        month_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = out_path.with_suffix(".tmp")
+        part.to_parquet(tmp_path, index=False)
+        tmp_path.replace(out_path)
+        written.append(out_path)
+
+    return written
+
+
+def ingest_csv(csv_path, store_dir=STORE_DIR) -> list:
+    """
+    원본 CSV 하나를 월별 파티션으로 나눠 저장소에 추가.
+    시간대별 원본이면 store_dir/hourly 에도 시간대 컬럼을 그대로 저장한다.
+    반환값: 새로 만든 파일 경로 목록
+    """
+    store_dir = pathlib.Path(store_dir)
+    daily, hourly = read_source_csv(csv_path)
+
+    written = []
+    if hourly is not None:
+        written += _append_partitions(hourly, store_dir / "hourly", HOURLY_COLUMNS)
+    written += _append_partitions(daily, store_dir, COLUMNS)
+    return written
+
+
+def ensure_store(csv_path=SOURCE_CSV, store_dir=STORE_DIR) -> None:
+    """저장소가 비어 있으면 기본 CSV(subway.csv)로 한 번 채워 둔다."""
+    if not available_months(store_dir) and pathlib.Path(csv_path).exists():
+        ingest_csv(csv_path, store_dir)
+
+
+# ---------------------------
+# 조회
+# ---------------------------
+def _read_partitions(start: date, end: date, store_dir, columns: list) -> pd.DataFrame:
+    files = list_partitions(start, end, store_dir)
+    if not files:
+        return pd.DataFrame(columns=columns)
+
+    lo = start.year * 10000 + start.month * 100 + start.day
+    hi = end.year * 10000 + end.month * 100 + end.day
+    df = pd.read_parquet(
+        files,
+        columns=columns,
+        filters=[("사용일자", ">=", lo), ("사용일자", "<=", hi)],
+    )
+    return df.reset_index(drop=True)
+
+
+def read_range(start: date, end: date, store_dir=STORE_DIR) -> pd.DataFrame:
+    """
+    start~end(양끝 포함) 기간의 데이터만 읽어서 반환.
+    해당 기간에 걸치는 월 파티션만 열어본다.
+    """
+    return _read_partitions(start, end, store_dir, COLUMNS)
+
+
+def read_hourly_range(start: date, end: date, store_dir=HOURLY_STORE_DIR) -> pd.DataFrame:
+    """시간대별 저장소에서 start~end(양끝 포함) 기간만 읽어서 반환 (HOURLY_COLUMNS)"""
+    return _read_partitions(start, end, store_dir, HOURLY_COLUMNS)
+
+
+# ---------------------------
+# 메모리용 압축 표현
+# ---------------------------
+def ymd_to_day(ymd) -> np.ndarray:
+    """YYYYMMDD 정수 배열 → 1970-01-01 기준 일수 (문자열 변환 없이 계산)"""
+    ymd = np.asarray(ymd, dtype=np.int64)
+    months = ((ymd // 10000 - 1970) * 12 + (ymd // 100 % 100 - 1)).astype("datetime64[M]")
+    return (months.astype("datetime64[D]") + (ymd % 100 - 1)).astype(np.int64)
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    화면/캐시에 올릴 때 쓰는 작은 표현.
+    - day: 1970-01-01 기준 일수 (int16, 2059년까지 표현 가능)
+    - 노선명/역명: category (사전 인코딩)
+    - 승차/하차: int32
+    date, day(일), 총승하차 같은 파생 컬럼은 만들지 않음
+    """
+    return pd.DataFrame(
+        {
+            "day": ymd_to_day(df["사용일자"]).astype(np.int16),
+            "노선명": df["노선명"].astype("category"),
+            "역명": df["역명"].astype("category"),
+            "승차총승객수": df["승차총승객수"].astype(np.int32),
+            "하차총승객수": df["하차총승객수"].astype(np.int32),
+        }
+    )
+
+
+def compact_hourly_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """시간대별 프레임의 압축 표현 (day int16, category 역/노선, 시간대 컬럼 int32)"""
+    out = pd.DataFrame(
+        {
+            "day": ymd_to_day(df["사용일자"]).astype(np.int16),
+            "노선명": df["노선명"].astype("category"),
+            "역명": df["역명"].astype("category"),
+        }
+    )
+    hours = df[BOARD_HOURLY + ALIGHT_HOURLY].astype(np.int32)
+    return pd.concat([out, hours.reset_index(drop=True)], axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지하철 승하차 CSV를 월별 Parquet 저장소에 적재")
+    parser.add_argument("csv", nargs="+", help="적재할 원본 CSV 경로 (일별 또는 시간대별)")
+    parser.add_argument("--store", default=str(STORE_DIR), help="저장소 폴더 (기본: ./subway_store)")
+    args = parser.parse_args()
+
+    for csv_path in args.csv:
+        written = ingest_csv(csv_path, args.store)
+        if written:
+            for p in written:
+                print(f"[추가] {p}")
+        else:
+            print(f"[건너뜀] {csv_path}: 새로 적재할 일자가 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# 테스트에서 앱 폴더의 모듈(subway_*, population_*)을 바로 import
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
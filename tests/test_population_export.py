@@ -0,0 +1,32 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+import population_data
+import population_export
+
+
+@pytest.fixture(scope="module")
+def cube():
+    tables = [population_data.PopulationTable(p) for p in population_data.find_csvs()]
+    return population_data.PopulationCube(tables)
+
+
+@pytest.mark.parametrize("fmt", list(population_export.FORMATS))
+def test_download_callable_returns_streamlit_data(cube, fmt):
+    bands = population_data.parse_bands("0-14, 15-64, 65+")
+    data = population_export.export_to_tempfile(fmt, cube, sexes=[0], bands=bands)
+
+    payload, _ = convert_data_to_bytes_and_infer_mime(data, RuntimeError("unsupported type"))
+    data.close()
+
+    if fmt == "parquet":
+        frame = pd.read_parquet(io.BytesIO(payload))
+    else:
+        archive = zipfile.ZipFile(io.BytesIO(payload))
+        frame = pd.concat([pd.read_csv(archive.open(name), encoding="utf-8-sig") for name in archive.namelist()])
+    assert len(frame) == len(cube.labels) * len(cube.month_labels) * len(bands)
+    assert int(frame["인구수"].sum()) == int(cube.totals[:, :, 0].sum())
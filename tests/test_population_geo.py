@@ -0,0 +1,55 @@
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+import population_geo
+
+
+def _wiggly_square(x0, y0, size, n=400):
+    t = np.linspace(0, 1, n)
+    edge = np.sin(t * 60) * size * 0.03  # 진폭 0.0009도: 보통(0.0003)은 남기고 간략(0.0015)은 지움
+    sides = [
+        np.c_[x0 + t * size, y0 + edge],
+        np.c_[x0 + size + edge, y0 + t * size],
+        np.c_[x0 + size - t * size, y0 + size + edge],
+        np.c_[x0 + edge, y0 + size - t * size],
+    ]
+    ring = np.vstack(sides)
+    return np.vstack([ring, ring[:1]]).tolist()
+
+
+def test_offline_levels_are_precomputed_and_loaded_as_is(tmp_path):
+    raw = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "properties": {"SIG_CD": "11140", "SIG_KOR_NM": "중구"},
+             "geometry": {"type": "Polygon", "coordinates": [_wiggly_square(126.97, 37.55, 0.03)]}},
+            {"type": "Feature", "properties": {"SIG_CD": "11110", "SIG_KOR_NM": "종로구"},
+             "geometry": {"type": "Polygon", "coordinates": [_wiggly_square(126.97, 37.58, 0.03)]}},
+        ],
+    }
+    source = tmp_path / "raw.geojson"
+    source.write_text(json.dumps(raw), encoding="utf-8")
+    stem = tmp_path / "seoul_districts"
+
+    subprocess.run(
+        [sys.executable, population_geo.__file__, str(source), "--out", str(stem)], check=True, capture_output=True
+    )
+
+    files = population_geo.find_geojson([stem])
+    assert list(files) == list(population_geo.GEOMETRY_LEVELS)
+    geometry = population_geo.DistrictGeometry(files)
+    assert geometry.codes.tolist() == [1111000000, 1114000000]
+    points = [population_geo.count_points(geometry.geojson(level)) for level in files]
+    assert points[0] > points[1] > points[2]
+    # 앱에서는 파일 내용을 그대로 사용 (실행 중 단순화 없음)
+    assert geometry.geojson("간략") == json.loads(files["간략"].read_text(encoding="utf-8"))
+
+
+def test_bundled_tiles_are_a_single_level():
+    files = population_geo.find_geojson([population_geo.BASE_DIR / "seoul_district_tiles"])
+    geometry = population_geo.DistrictGeometry(files)
+    assert list(geometry.levels) == [population_geo.SINGLE_LEVEL]
+    assert len(geometry) == 25 and geometry.schematic
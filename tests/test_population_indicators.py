@@ -0,0 +1,20 @@
+import numpy as np
+
+import population_indicators
+
+
+def test_month_over_month_change_only_for_adjacent_present_months():
+    # 지역 2개 × 기준월 4개 (2025년 1·2·3월, 5월) × 나이 101개 (0~100세)
+    values = np.zeros((2, 4, 101), dtype=np.int64)
+    values[:, :, 0] = [[100, 110, 120, 130], [50, 60, 70, 80]]
+    present = np.array([[True, True, True, True], [True, False, True, True]])
+    months = [202501, 202502, 202503, 202505]
+
+    result = population_indicators.compute(values, present, months)
+    change = result["전월 대비 증감"]
+    change_pct = result["전월 대비 증감률(%)"]
+
+    np.testing.assert_array_equal(change[0], [np.nan, 10, 10, np.nan])     # 4월이 빠져 5월은 비교 불가
+    np.testing.assert_array_equal(change[1], [np.nan, np.nan, np.nan, np.nan])  # 2월 자료 없음
+    np.testing.assert_allclose(change_pct[0, 1], 10.0)
+    assert np.isnan(change_pct[0, 3]) and np.isnan(change_pct[1]).all()
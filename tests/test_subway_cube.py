@@ -0,0 +1,25 @@
+import pandas as pd
+
+import subway_cube
+import subway_store
+
+
+def test_range_sum_when_pairs_equal_stations_in_other_order():
+    # 호선마다 역이 하나씩: 조합 순서 (A, Y), (B, X) ↔ 역 순서 X, Y
+    df = pd.DataFrame(
+        {
+            "사용일자": [20251001, 20251001, 20251002, 20251002],
+            "노선명": ["A", "B", "A", "B"],
+            "역명": ["Y", "X", "Y", "X"],
+            "승차총승객수": [100, 1, 100, 1],
+            "하차총승객수": [90, 2, 90, 2],
+        }
+    )
+    cube = subway_cube.RidershipCube(subway_store.compact_frame(df))
+    assert cube.n_pairs == len(cube.stations) == 2
+
+    sums = cube.range_sum(0, len(cube.days))
+    assert sums.loc["Y", "승차총승객수"] == 200
+    assert sums.loc["X", "승차총승객수"] == 2
+    assert sums.loc["X", "하차총승객수"] == 4
+    assert sums.loc["Y", "rows"] == 2 and sums.loc["Y", "days"] == 2
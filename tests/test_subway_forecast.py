@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+import subway_cube
+import subway_forecast
+import subway_store
+
+
+def test_total_band_uses_summed_residuals():
+    days = pd.date_range("2025-09-01", periods=56, freq="D")
+    noise = np.random.default_rng(0).normal(0, 50, len(days)).round()
+    # 승차와 하차가 같은 잡음을 가짐 → 합계 잔차 표준편차는 각각의 2배
+    df = pd.DataFrame(
+        {
+            "사용일자": days.strftime("%Y%m%d").astype(int),
+            "노선명": "2호선",
+            "역명": "강남",
+            "승차총승객수": (1000 + noise).astype(np.int32),
+            "하차총승객수": (900 + noise).astype(np.int32),
+        }
+    )
+    forecast = subway_forecast.StationForecast(subway_cube.RidershipCube(subway_store.compact_frame(df)))
+
+    board, alight = forecast.sigma[0]
+    assert np.isclose(forecast.sigma_total[0], board + alight, rtol=1e-6)
+
+    frame = forecast.station_frame(0, horizon=3)
+    pred = frame[frame["구분"] == "예측"]
+    width = (pred["상한"] - pred["인원"]).to_numpy()
+    assert np.allclose(width, subway_forecast.Z_95 * forecast.sigma_total[0], atol=1)
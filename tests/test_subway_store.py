@@ -0,0 +1,66 @@
+import numpy as np
+
+import subway_store
+
+
+def _write_hourly(path, rows):
+    """시간대별 원본 형식 CSV (천 단위 쉼표 숫자, utf-8-sig)"""
+    header = ["사용일자", "호선명", "지하철역"]
+    for h in subway_store.HOURS:
+        header += [f"{h:02d}시-{(h + 1) % 24:02d}시 승차인원", f"{h:02d}시-{(h + 1) % 24:02d}시 하차인원"]
+    lines = [",".join(header)]
+    for day, line, station, board, alight in rows:
+        cells = [str(day), line, station]
+        for h in subway_store.HOURS:
+            cells += [f'"{board * (h + 1):,}"', f'"{alight * (h + 1):,}"']
+        lines.append(",".join(cells))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8-sig")
+
+
+def test_ingest_hourly_with_comma_counts(tmp_path):
+    src = tmp_path / "hourly.csv"
+    _write_hourly(src, [(20251001, "2호선", "강남", 4402, 3901), (20251001, "2호선", "역삼", 1200, 1100)])
+    store = tmp_path / "store"
+
+    written = subway_store.ingest_csv(src, store)
+
+    assert written
+    hourly = subway_store.read_hourly_range(
+        subway_store.date(2025, 10, 1), subway_store.date(2025, 10, 1), store / "hourly"
+    ).sort_values("역명")
+    assert hourly["승차_07"].tolist() == [4402 * 8, 1200 * 8]
+    daily = subway_store.read_range(subway_store.date(2025, 10, 1), subway_store.date(2025, 10, 1), store)
+    expected = 4402 * sum(h + 1 for h in subway_store.HOURS)
+    assert int(daily.loc[daily["역명"] == "강남", "승차총승객수"].iloc[0]) == expected
+    assert daily["하차총승객수"].dtype == np.int32
+
+
+def _write_daily(path, rows):
+    lines = [",".join(subway_store.COLUMNS)]
+    lines += [f"{day},{line},{station},{board},{alight}" for day, line, station, board, alight in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8-sig")
+
+
+def test_ingest_partial_overlap_keeps_other_stations(tmp_path):
+    store = tmp_path / "store"
+    first, second = tmp_path / "line2.csv", tmp_path / "mixed.csv"
+    _write_daily(first, [(20251001, "2호선", "강남", 100, 90), (20251002, "2호선", "강남", 110, 95)])
+    # 같은 날짜의 다른 노선 + 이미 있는 행 하나 + 새 날짜
+    _write_daily(second, [
+        (20251001, "신분당선", "강남", 50, 40),
+        (20251001, "2호선", "강남", 999, 999),
+        (20251003, "2호선", "강남", 120, 100),
+    ])
+
+    subway_store.ingest_csv(first, store)
+    subway_store.ingest_csv(second, store)
+    subway_store.ingest_csv(second, store)  # 같은 파일을 다시 넣어도 변화 없음
+
+    df = subway_store.read_range(subway_store.date(2025, 10, 1), subway_store.date(2025, 10, 31), store)
+    rows = sorted(zip(df["사용일자"], df["노선명"].astype(str), df["승차총승객수"]))
+    assert rows == [
+        (20251001, "2호선", 100),
+        (20251001, "신분당선", 50),
+        (20251002, "2호선", 110),
+        (20251003, "2호선", 120),
+    ]